@@ -0,0 +1,61 @@
+"""Applicative lifting of 3 to 6 argument functions.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_apply [calls]
+
+Compares the retry-on-TypeError ``apply`` that fp_py used before the
+currying engine, the curried ``Just.pure(f).apply(...)`` chain, and
+``Maybe.map_n``.
+"""
+import sys
+import timeit
+from functools import partial
+
+from fp_py.Maybe import Just, Maybe
+
+
+def retry_apply(fn, m):
+    def mapper(value):
+        try:
+            return fn(value)
+        except TypeError:
+            return partial(fn, value)
+    return m.map(mapper)
+
+
+def f3(a, b, c): return a + b + c
+def f4(a, b, c, d): return a + b + c + d
+def f5(a, b, c, d, e): return a + b + c + d + e
+def f6(a, b, c, d, e, f): return a + b + c + d + e + f
+
+
+def main(number: int = 50_000) -> None:
+    for fn in (f3, f4, f5, f6):
+        args = [Just(i) for i in range(fn.__code__.co_argcount)]
+
+        def retry():
+            m = Just(fn)
+            for a in args:
+                m = retry_apply(m.unwrap(), a)
+            return m
+
+        def curried():
+            m = Just.pure(fn)
+            for a in args:
+                m = m.apply(a)
+            return m
+
+        def lifted():
+            return Maybe.map_n(fn, *args)
+
+        assert retry().unwrap() == curried().unwrap() == lifted().unwrap()
+        row = []
+        for label, run in (("retry", retry), ("curried", curried), ("map_n", lifted)):
+            seconds = min(timeit.repeat(run, number=number, repeat=3))
+            row.append(f"{label} {seconds / number * 1e6:6.2f} us")
+        print(f"{fn.__name__}: " + "   ".join(row))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,48 @@
+"""Cost of the Try failure path under each capture policy.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_capture [items]
+
+Times ``Try.unit(x).bind(f)`` where every call fails, either by raising
+(under each ``Capture`` policy) or by returning ``Try.fail``, and reports
+the memory still held by the resulting Lefts.
+"""
+import sys
+import time
+import tracemalloc
+
+from fp_py.Either import Try
+from fp_py.capture import Capture
+
+
+def parse(text):
+    payload = list(range(64))  # a local that a live traceback keeps alive
+    return int(text)
+
+
+def parse_or_fail(text):
+    return int(text) if text.isdigit() else Try.fail(f"not a number: {text!r}")
+
+
+def measure(label: str, fn, size: int) -> None:
+    tracemalloc.start()
+    began = time.perf_counter()
+    results = [Try.unit("x").bind(fn) for _ in range(size)]
+    elapsed = time.perf_counter() - began
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert all(r.is_left() for r in results)
+    print(f"{label:<10}{elapsed / size * 1e6:>8.2f} us/item{held / size:>10.0f} B/item")
+
+
+def main(size: int = 20_000) -> None:
+    for policy in Capture:
+        Try.capture_policy = policy
+        measure(policy.name.lower(), parse, size)
+    Try.capture_policy = Capture.KEEP
+    measure("fail", parse_or_fail, size)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
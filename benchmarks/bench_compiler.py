@@ -0,0 +1,64 @@
+"""Compiled lambda terms against the hand-written combinators.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compiler [rounds]
+
+Booleans: ``not (and (or a b) (not c))`` over all eight inputs, written
+with the ``lambda_calculus`` combinators and compiled from the same
+combinators. Numerals: ``add (mul m n) m`` on Church numerals built from
+closures (so the Numeral fast paths do not apply) and read with
+``to_int``.
+"""
+import sys
+import time
+from itertools import product
+
+from fp_py.utils import lambda_calculus as lc
+from fp_py.utils.compiler import compile_term, compile_uncurried
+from fp_py.utils.terms import Lam, Var, app, from_python
+
+BOOLEANS = list(product([lc.true, lc.false], repeat=3))
+
+
+def boolean_term():
+    not_, and_, or_ = (from_python(f) for f in (lc.not_, lc.and_, lc.or_))
+    a, b, c = Var(2), Var(1), Var(0)
+    return Lam(Lam(Lam(app(not_, app(and_, app(or_, a, b), app(not_, c))))))
+
+
+def numeral_term():
+    add, mul = from_python(lc.add), from_python(lc.mul)
+    m, n = Var(1), Var(0)
+    return Lam(Lam(app(add, app(mul, m, n), m)))
+
+
+def closure_numeral(k: int):
+    return lambda f: lambda x: lc.from_int(k)(f)(x)
+
+
+def timed(label: str, fn, rounds: int) -> None:
+    began = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    print(f"{label:<32}{(time.perf_counter() - began) / rounds * 1e6:>10.1f} µs")
+
+
+def main(rounds: int = 2_000) -> None:
+    curried = compile_term(boolean_term())
+    uncurried = compile_uncurried(boolean_term())
+    timed("booleans, hand-written", lambda: [
+        lc.to_bool(lc.not_(lc.and_(lc.or_(a)(b))(lc.not_(c)))) for a, b, c in BOOLEANS], rounds)
+    timed("booleans, compiled", lambda: [lc.to_bool(curried(a)(b)(c)) for a, b, c in BOOLEANS], rounds)
+    timed("booleans, compiled uncurried", lambda: [lc.to_bool(uncurried(a, b, c)) for a, b, c in BOOLEANS], rounds)
+
+    m, n = closure_numeral(7), closure_numeral(6)
+    compiled = compile_term(numeral_term())
+    fused = compile_uncurried(numeral_term())
+    timed("numerals, hand-written", lambda: lc.to_int(lc.add(lc.mul(m)(n))(m)), rounds)
+    timed("numerals, compiled", lambda: lc.to_int(compiled(m)(n)), rounds)
+    timed("numerals, compiled uncurried", lambda: fused(m, n, lambda x: x + 1, 0), rounds)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,42 @@
+"""Maybe.concat/Either.concat against a pairwise reduce.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_concat [items]
+"""
+import sys
+import time
+from functools import reduce
+
+from fp_py.Either import Either, Right
+from fp_py.Maybe import Just, Maybe, Nothing
+
+
+def pairwise(xs, start):
+    return reduce(lambda a, b: a + b, xs, start)
+
+
+def timed(label: str, fn) -> None:
+    began = time.perf_counter()
+    fn()
+    print(f"{label:<28}{time.perf_counter() - began:>10.3f}s")
+
+
+def main(size: int = 100_000) -> None:
+    payloads = {
+        "str": [str(i % 10) for i in range(size)],
+        "list": [[i] for i in range(size)],
+        "tuple": [(i,) for i in range(size)],
+        "int": list(range(size)),
+    }
+    for name, values in payloads.items():
+        maybes = [Just(v) if i % 10 else Nothing() for i, v in enumerate(values)]
+        timed(f"{name} pairwise Maybe", lambda: pairwise(maybes, Nothing()))
+        timed(f"{name} Maybe.concat", lambda: Maybe.concat(maybes))
+        rights = [Right(v) for v in values]
+        timed(f"{name} pairwise Either", lambda: pairwise(rights[1:], rights[0]))
+        timed(f"{name} Either.concat", lambda: Either.concat(rights))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
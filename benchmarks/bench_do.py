@@ -0,0 +1,41 @@
+"""Do-notation against nested bind.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_do [calls]
+
+Both forms run three dependent steps where the last one sees every
+earlier value. ``bind`` does not flatten here, so the nested form
+returns nested Justs; the work per step is the same.
+"""
+import sys
+import timeit
+
+from fp_py.Maybe import Just, Maybe, Nothing
+
+
+def half(x):
+    return Just(x // 2) if x % 2 == 0 else Nothing()
+
+
+def nested(x):
+    return half(x).bind(lambda a: half(a).bind(lambda b: half(b).map(lambda c: a + b + c)))
+
+
+@Maybe.do
+def block(x):
+    a = yield half(x)
+    b = yield half(a)
+    c = yield half(b)
+    return a + b + c
+
+
+def main(number: int = 200_000) -> None:
+    for label, x in (("success", 64), ("fails at step 2", 2)):
+        for name, fn in (("nested bind", nested), ("Maybe.do", block)):
+            seconds = min(timeit.repeat(lambda: fn(x), number=number, repeat=3))
+            print(f"{label:<18}{name:<14}{seconds / number * 1e9:>8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,40 @@
+"""Validating a batch: Try per row vs TryArray.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_either_array [rows]
+"""
+import sys
+import time
+
+import numpy as np
+
+from fp_py.Either import Try
+from fp_py.EitherArray import TryArray
+
+
+def main(size: int = 1_000_000) -> None:
+    raw = [float(i % 1000) for i in range(size)]
+    invert = lambda x: 1.0 / x
+
+    began = time.perf_counter()
+    [Try.unit(x).bind(invert) for x in raw]
+    print(f"{'Try per row':<24}{time.perf_counter() - began:>10.3f}s")
+
+    batch = TryArray.from_values(raw)
+    began = time.perf_counter()
+    batch.bind(invert, vectorized=True)
+    print(f"{'TryArray (chunked)':<24}{time.perf_counter() - began:>10.3f}s")
+
+    clean = TryArray.from_values(np.asarray(raw) + 1.0)
+    began = time.perf_counter()
+    clean.bind(invert, vectorized=True)
+    print(f"{'TryArray (no errors)':<24}{time.perf_counter() - began:>10.3f}s")
+
+    began = time.perf_counter()
+    batch.bind(invert)
+    print(f"{'TryArray (per row)':<24}{time.perf_counter() - began:>10.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
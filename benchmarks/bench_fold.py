@@ -0,0 +1,35 @@
+"""fold_parallel against a serial left fold of per-shard counters.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_fold [shards]
+
+Each shard is a ``Just(Counter)``; merging them is the associative
+``+`` that fold_parallel spreads over a process pool. The speed-up
+depends on the number of CPUs available.
+"""
+import sys
+import time
+from collections import Counter
+from functools import reduce
+
+from fp_py.Maybe import Just, Nothing
+from fp_py.parallel import fold_parallel
+
+
+def timed(label: str, fn) -> None:
+    began = time.perf_counter()
+    result = fn()
+    print(f"{label:<28}{time.perf_counter() - began:>10.3f}s  {len(result.unwrap())} keys")
+
+
+def main(shards: int = 5_000) -> None:
+    xs = [Just(Counter({f"key{(i * 7 + j) % 5000}": j for j in range(50)})) if i % 10 else Nothing()
+          for i in range(shards)]
+    timed("serial reduce", lambda: reduce(lambda a, b: a + b, xs, Nothing()))
+    timed("fold_parallel process", lambda: fold_parallel(xs))
+    timed("fold_parallel commutative", lambda: fold_parallel(xs, commutative=True))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
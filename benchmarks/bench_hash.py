@@ -0,0 +1,42 @@
+"""Maybe/Either as dict and set keys.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hash [keys]
+
+Times building a dict keyed by Just/Right values, looking every key up
+again through freshly built equal values, and deduplicating a list with
+a set, next to the same work on the raw payloads.
+"""
+import sys
+import time
+
+from fp_py.Either import Right
+from fp_py.Maybe import Just
+
+
+def timed(label: str, fn) -> None:
+    began = time.perf_counter()
+    fn()
+    print(f"{label:<32}{time.perf_counter() - began:>10.3f}s")
+
+
+def main(size: int = 500_000) -> None:
+    raw = [f"user-{i}" for i in range(size)]
+    for name, wrap in (("raw", lambda x: x), ("Just", Just), ("Right", Right)):
+        keys = [wrap(k) for k in raw]
+        probes = [wrap(k) for k in raw]
+        table = {}
+
+        def build():
+            for i, k in enumerate(keys):
+                table[k] = i
+
+        timed(f"{name} dict build", build)
+        timed(f"{name} dict lookup (new keys)", lambda: sum(table[k] for k in probes))
+        timed(f"{name} dict lookup (cached)", lambda: sum(table[k] for k in probes))
+        timed(f"{name} set dedupe", lambda: len(set(keys + probes)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
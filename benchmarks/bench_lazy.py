@@ -0,0 +1,59 @@
+"""Deferred against eager Maybe/Either when most values are never read.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_lazy [keys] [percent_read]
+
+Resolves ``keys`` config entries, each through an expensive lookup and
+two ``map`` steps, then reads ``percent_read`` percent of them. The
+eager version pays for every lookup; ``Maybe.lazy``/``Either.lazy``
+pay a small deferral cost per entry and only look up the ones read.
+"""
+import sys
+import time
+
+from fp_py.Either import Either, Right
+from fp_py.Maybe import Just, Maybe
+
+
+def lookup(key: int):
+    total = 0
+    for i in range(200):
+        total += (key * i) % 7
+    return total if key % 5 else None
+
+
+def resolve_eager(keys: int) -> list:
+    return [Just.unit(lookup(k)).map(lambda v: v + 1).map(str) for k in range(keys)]
+
+
+def resolve_lazy(keys: int) -> list:
+    return [Maybe.lazy(lambda k=k: lookup(k)).map(lambda v: v + 1).map(str) for k in range(keys)]
+
+
+def resolve_eager_either(keys: int) -> list:
+    return [Right(k).map(lookup).map(lambda v: v + 1) for k in range(keys)]
+
+
+def resolve_lazy_either(keys: int) -> list:
+    return [Either.lazy(lambda k=k: lookup(k)).map(lambda v: v + 1) for k in range(keys)]
+
+
+def timed(label: str, resolve, keys: int, step: int) -> None:
+    began = time.perf_counter()
+    values = resolve(keys)
+    read = [values[i].match(lambda *_: None, lambda v: v) for i in range(0, keys, step)]
+    print(f"{label:<16}{len(read):>8} read{time.perf_counter() - began:>10.3f}s")
+
+
+def main(keys: int = 20_000, percent_read: int = 5) -> None:
+    step = max(1, 100 // max(percent_read, 1))
+    timed("Maybe eager", resolve_eager, keys, step)
+    timed("Maybe.lazy", resolve_lazy, keys, step)
+    timed("Either eager", resolve_eager_either, keys, step)
+    timed("Either.lazy", resolve_lazy_either, keys, step)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,38 @@
+"""Mapping a column of optional values: list of Maybe vs MaybeArray.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_maybe_array [rows]
+"""
+import sys
+import time
+
+import numpy as np
+
+from fp_py.Maybe import Just
+from fp_py.MaybeArray import MaybeArray
+
+
+def main(size: int = 1_000_000) -> None:
+    raw = [None if i % 10 == 0 else float(i) for i in range(size)]
+
+    began = time.perf_counter()
+    [Just.unit(x).map(lambda v: v * 2.0 + 1.0) for x in raw]
+    print(f"{'list[Maybe]':<24}{time.perf_counter() - began:>10.3f}s")
+
+    column = MaybeArray.from_values(raw)
+    began = time.perf_counter()
+    column.map(lambda v: v * 2.0 + 1.0, vectorized=True)
+    print(f"{'MaybeArray vectorized':<24}{time.perf_counter() - began:>10.3f}s")
+
+    began = time.perf_counter()
+    column.map(np.sqrt)
+    print(f"{'MaybeArray ufunc':<24}{time.perf_counter() - began:>10.3f}s")
+
+    began = time.perf_counter()
+    column.map(lambda v: v * 2.0 + 1.0)
+    print(f"{'MaybeArray per-element':<24}{time.perf_counter() - began:>10.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
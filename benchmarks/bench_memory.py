@@ -0,0 +1,59 @@
+"""Per-object size and allocation cost of the Maybe/Either variants.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory [steps]
+
+For every variant it prints the bytes held by one instance (including
+its ``__dict__`` when the class has one) and, for a chain of ``steps``
+``map`` calls, the number of fresh containers allocated, the
+tracemalloc peak and the wall time.
+"""
+import sys
+import time
+import tracemalloc
+
+from fp_py.Maybe import Just, Nothing
+from fp_py.Either import Left, Right, Try
+
+
+def object_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def run_chain(start, steps: int):
+    inc = lambda x: x + 1
+    allocations = 0
+    current = start
+    tracemalloc.start()
+    began = time.perf_counter()
+    for _ in range(steps):
+        following = current.map(inc)
+        if following is not current:
+            allocations += 1
+        current = following
+    elapsed = time.perf_counter() - began
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocations, peak, elapsed
+
+
+def main(steps: int = 1_000_000) -> None:
+    samples = {
+        "Just": Just(1),
+        "Nothing": Nothing(),
+        "Left": Left(1),
+        "Right": Right(1),
+        "Try": Try(1),
+    }
+    print(f"{'variant':<10}{'bytes/obj':>10}{'allocs':>12}{'peak KiB':>12}{'seconds':>10}")
+    for name, sample in samples.items():
+        allocations, peak, elapsed = run_chain(sample, steps)
+        print(f"{name:<10}{object_size(sample):>10}{allocations:>12}{peak / 1024:>12.1f}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
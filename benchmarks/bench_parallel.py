@@ -0,0 +1,43 @@
+"""Serial Try.bind loop vs map_parallel on a CPU-bound chain.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel [inputs]
+"""
+import sys
+import time
+
+from fp_py.Either import Try
+from fp_py.parallel import map_parallel
+
+
+def digest(x: int) -> int:
+    total = 0
+    for i in range(2000):
+        total = (total * 31 + x + i) % 1_000_003
+    return total
+
+
+def check(x: int) -> int:
+    if x % 97 == 0:
+        raise ValueError(x)
+    return x
+
+
+def main(size: int = 20_000) -> None:
+    xs = range(size)
+
+    began = time.perf_counter()
+    serial = [Try.unit(x).bind(digest).bind(check) for x in xs]
+    print(f"{'serial Right.bind':<24}{time.perf_counter() - began:>10.3f}s")
+
+    pipeline = Try.pipeline().bind(digest).bind(check)
+    for executor in ("thread", "process"):
+        began = time.perf_counter()
+        results = list(map_parallel(pipeline, xs, executor=executor))
+        print(f"{executor + ' pool':<24}{time.perf_counter() - began:>10.3f}s")
+        assert [r.is_right() for r in results] == [r.is_right() for r in serial]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
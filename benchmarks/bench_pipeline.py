@@ -0,0 +1,36 @@
+"""Eager Just/Right chains against the fused pipeline.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline [inputs]
+"""
+import sys
+import time
+
+from fp_py.Maybe import Just, Maybe
+from fp_py.Either import Either, Right
+
+
+def timed(label: str, fn, inputs) -> None:
+    began = time.perf_counter()
+    for value in inputs:
+        fn(value)
+    print(f"{label:<20}{time.perf_counter() - began:>10.3f}s")
+
+
+def main(size: int = 1_000_000) -> None:
+    inc = lambda x: x + 1
+    dbl = lambda x: x * 2
+    inputs = range(size)
+
+    timed("Just eager", lambda x: Just.unit(x).map(inc).bind(dbl).map(inc).bind(dbl), inputs)
+    plan = Maybe.pipeline().map(inc).bind(dbl).map(inc).bind(dbl)
+    timed("Maybe pipeline", plan.compile(), inputs)
+
+    timed("Right eager", lambda x: Right.unit(x).map(inc).bind(dbl).map(inc).bind(dbl), inputs)
+    plan = Either.pipeline().map(inc).bind(dbl).map(inc).bind(dbl)
+    timed("Either pipeline", plan.compile(), inputs)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
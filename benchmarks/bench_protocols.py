@@ -0,0 +1,34 @@
+"""Cost of isinstance against the fp_py protocols.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_protocols [checks]
+
+Compares the cached protocols from ``fp_py.types`` with a plain
+``runtime_checkable`` protocol declaring the same methods.
+"""
+import sys
+import timeit
+from typing import Protocol, runtime_checkable
+
+from fp_py.Maybe import Just
+from fp_py.types import Applicative, Functor, Monad, Monoid
+
+
+@runtime_checkable
+class PlainMonad(Protocol):
+    def bind(self, fn): ...
+
+    @classmethod
+    def unit(cls, value): ...
+
+
+def main(number: int = 1_000_000) -> None:
+    value = Just(1)
+    for protocol in (Functor, Applicative, Monad, Monoid, PlainMonad):
+        seconds = min(timeit.repeat(lambda: isinstance(value, protocol), number=number, repeat=3))
+        print(f"{protocol.__name__:<14}{seconds / number * 1e9:>10.0f} ns/check")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,63 @@
+"""Peak memory of Stream pipelines against list-based equivalents.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stream [items ...]
+
+Each run parses ``items`` records, fans every record out to three
+values with ``bind``, keeps the Rights and sums them in chunks. The list
+version materializes every intermediate list. The Stream version pulls
+from an unbounded generator and stops after ``items`` records, so its
+tracemalloc peak should stay flat as ``items`` grows.
+"""
+import sys
+import time
+import tracemalloc
+from itertools import count
+
+from fp_py.Either import Left, Right
+from fp_py.Stream import Stream
+
+
+def parse(i: int):
+    return Left(f"bad record {i}") if i % 7 == 0 else Right(i)
+
+
+def fan_out(x: int) -> list:
+    return [x, x * 2, x * 3]
+
+
+def with_lists(items: int) -> int:
+    parsed = [parse(i) for i in range(items)]
+    values = [v.unwrap() for v in parsed if isinstance(v, Right)]
+    fanned = [y for x in values for y in fan_out(x)]
+    chunks = [fanned[i:i + 100] for i in range(0, len(fanned), 100)]
+    return sum(sum(c) for c in chunks)
+
+
+def with_stream(items: int) -> int:
+    records = Stream(count()).take(items).map(parse)
+    fanned = Stream.collect_rights(records).bind(fan_out)
+    return sum(sum(c) for c in fanned.chunk(100))
+
+
+def measure(label: str, fn, items: int) -> int:
+    tracemalloc.start()
+    began = time.perf_counter()
+    result = fn(items)
+    elapsed = time.perf_counter() - began
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<8}{items:>10}{peak / 1024:>14.1f}{elapsed:>10.3f}")
+    return result
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'kind':<8}{'items':>10}{'peak KiB':>14}{'seconds':>10}")
+    for items in sizes:
+        expected = measure("list", with_lists, items)
+        assert measure("stream", with_stream, items) == expected
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,57 @@
+"""tail_rec against recursive bind for long monadic loops.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tailrec [iterations ...]
+
+The recursive form nests one bind per iteration and needs the recursion
+limit raised to get anywhere; tail_rec runs in a loop on any stack.
+"""
+import sys
+import time
+
+from fp_py.Either import Either, Right
+from fp_py.Maybe import Just, Maybe
+from fp_py.tailrec import Continue, Done
+
+
+def step(n):
+    return Done(n) if n == 0 else Continue(n - 1)
+
+
+def recursive_maybe(n):
+    m = Just(n)
+    return m if n == 0 else m.bind(lambda k: recursive_maybe(k - 1).unwrap())
+
+
+def recursive_either(n):
+    m = Right(n)
+    return m if n == 0 else m.bind(lambda k: recursive_either(k - 1).unwrap())
+
+
+def timed(label: str, fn, n: int) -> None:
+    began = time.perf_counter()
+    try:
+        fn(n)
+        outcome = f"{time.perf_counter() - began:.3f}s"
+    except RecursionError:
+        outcome = "RecursionError"
+    print(f"{label:<30}{n:>10}  {outcome}")
+
+
+def main(sizes: list[int]) -> None:
+    limit = sys.getrecursionlimit()
+    for n in sizes:
+        timed("Maybe.tail_rec", lambda k: Maybe.tail_rec(step, k), n)
+        timed("Either.tail_rec", lambda k: Either.tail_rec(step, k), n)
+        timed("recursive Just.bind", recursive_maybe, n)
+        sys.setrecursionlimit(4 * n + limit)
+        try:
+            timed("recursive Just.bind (raised)", recursive_maybe, n)
+            timed("recursive Right.bind (raised)", recursive_either, n)
+        finally:
+            sys.setrecursionlimit(limit)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,43 @@
+"""Reduction steps and throughput of the call-by-need normalizer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_terms [n]
+
+Normalizes Church arithmetic built from the ``lambda_calculus``
+combinators and reports the beta steps taken, steps per second and the
+size of the normal form. The last row binds one expensive argument that
+is needed many times; with sharing it costs about the same as the
+argument alone.
+"""
+import sys
+import time
+
+from fp_py.utils import lambda_calculus as lc
+from fp_py.utils.terms import Normalizer, app, church, from_python, parse
+
+
+def workloads(n: int) -> dict:
+    add, mul, pow_, pred = (from_python(f) for f in (lc.add, lc.mul, lc.pow_, lc.pred))
+    identity = app(church(n), parse(r"\y. y"), parse(r"\z. z"))
+    return {
+        f"add {n} {n}": app(add, church(n), church(n)),
+        f"mul {n} {n}": app(mul, church(n), church(n)),
+        "pow 2 12": app(pow_, church(2), church(12)),
+        f"pred {n * 10}": app(pred, church(n * 10)),
+        f"shared x10, {n} steps": app(parse(r"\x c. x (x (x (x (x (x (x (x (x (x c)))))))))"), identity),
+    }
+
+
+def main(n: int = 300) -> None:
+    print(f"{'term':<24}{'steps':>10}{'seconds':>10}{'steps/s':>12}")
+    for label, term in workloads(n).items():
+        normalizer = Normalizer()
+        began = time.perf_counter()
+        normalizer.normalize(term)
+        elapsed = time.perf_counter() - began
+        print(f"{label:<24}{normalizer.steps:>10}{elapsed:>10.3f}{normalizer.steps / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,51 @@
+"""Error accumulation cost when validating wide records.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_validation [fields ...]
+
+Folds the field checks of one record with ``+``, so every step joins
+the errors gathered so far with the next field's. The rope-backed
+Validation is compared with a copy-on-append list of errors.
+"""
+import sys
+import time
+
+from fp_py.Validation import Failure, Success, Validation
+
+
+def check(i):
+    return Failure(f"field {i} is invalid") if i % 2 else Success(1)
+
+
+def list_fold(fields: int) -> list:
+    errors = []
+    for i in range(fields):
+        if i % 2:
+            errors = errors + [f"field {i} is invalid"]
+    return errors
+
+
+def rope_fold(fields: int) -> Validation:
+    v = Success(0)
+    for i in range(fields):
+        v = v + check(i)
+    return v
+
+
+def timed(label: str, fn, fields: int) -> None:
+    began = time.perf_counter()
+    for _ in range(10):
+        fn(fields)
+    print(f"{label:<16}{fields:>8}{(time.perf_counter() - began) / 10 * 1e3:>10.2f} ms")
+
+
+def main(sizes: list[int]) -> None:
+    for fields in sizes:
+        timed("list copy", list_fold, fields)
+        timed("Validation +", rope_fold, fields)
+        timed("traverse", lambda n: Validation.traverse(check, range(n)), fields)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [500, 5_000, 50_000])
@@ -0,0 +1,273 @@
+"""Core Maybe/Either/Try benchmark suite with a saved JSON baseline.
+
+Run from the repository root:
+
+    python -m benchmarks.suite                          # print results
+    python -m benchmarks.suite --save FILE              # store them as JSON
+    python -m benchmarks.suite --compare FILE [--tolerance 0.5]
+
+Every case times an fp_py operation next to the plain-Python code it
+stands in for: if/else on None for Maybe, try/except for Either and
+Try. Results are compared by the ratio of the two, so a baseline saved
+on one machine stays meaningful on another. ``--compare`` exits with
+status 1 when a case got slower than its baseline ratio by more than
+the tolerance.
+
+``tests/test_benchmarks.py`` runs the quick form of the suite against
+``benchmarks/baseline.json`` under the ``benchmark`` pytest marker,
+which the default run deselects; run it with ``pytest -m benchmark``
+(tolerance from ``FP_PY_BENCH_TOLERANCE``). After an intended change in
+performance, refresh the baseline with
+
+    python -m benchmarks.suite --quick --save benchmarks/baseline.json
+"""
+import argparse
+import json
+import operator
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+
+BASELINE = Path(__file__).with_name("baseline.json")
+CHAIN_LENGTHS = (1, 4, 16)
+INPUT_SIZES = (10, 100, 1000)
+
+
+class Case(NamedTuple):
+    name: str
+    fp: Callable[[], object]
+    plain: Callable[[], object]
+    # Work per call, used to scale the number of timed calls.
+    weight: int = 1
+
+
+def inc(x):
+    return x + 1
+
+
+def chain(start, method: str, n: int) -> Callable[[], object]:
+    fns = [inc] * n
+
+    def run():
+        m = start
+        for f in fns:
+            m = getattr(m, method)(f)
+        return m
+    return run
+
+
+def plain_optional_chain(start, n: int) -> Callable[[], object]:
+    fns = [inc] * n
+
+    def run():
+        x = start
+        for f in fns:
+            if x is None:
+                break
+            x = f(x)
+        return x
+    return run
+
+
+def plain_try_chain(start, n: int) -> Callable[[], object]:
+    fns = [inc] * n
+
+    def run():
+        x = start
+        for f in fns:
+            try:
+                x = f(x)
+            except Exception as ex:
+                return ex
+            if x is None:
+                break
+        return x
+    return run
+
+
+def chain_cases() -> Iterator[Case]:
+    for n in CHAIN_LENGTHS:
+        for method in ("map", "bind"):
+            yield Case(f"{method}/Just/n={n}", chain(Just(1), method, n), plain_optional_chain(1, n), n)
+            yield Case(f"{method}/Nothing/n={n}", chain(Nothing(), method, n), plain_optional_chain(None, n), n)
+            yield Case(f"{method}/Right/n={n}", chain(Right(1), method, n), plain_try_chain(1, n), n)
+            yield Case(f"{method}/Left/n={n}", chain(Left("e"), method, n), plain_optional_chain(None, n), n)
+            yield Case(f"{method}/Try/n={n}", chain(Try.unit(1), method, n), plain_try_chain(1, n), n)
+
+
+def apply_cases() -> Iterator[Case]:
+    add = operator.add
+    a, b = 1, 2
+    yield Case("apply/Just", lambda: Just.pure(add).apply(Just(a)).apply(Just(b)),
+               lambda: add(a, b) if a is not None and b is not None else None)
+    yield Case("apply/Nothing", lambda: Just.pure(add).apply(Nothing()).apply(Just(b)),
+               lambda: None)
+    yield Case("apply/Right", lambda: Right.pure(add).apply(Right(a)).apply(Right(b)),
+               lambda: add(a, b))
+    yield Case("apply/Left", lambda: Right.pure(add).apply(Left("e")).apply(Right(b)),
+               lambda: "e")
+    yield Case("apply/Try", lambda: Try.pure(add).apply(Try.unit(a)).apply(Try.unit(b)),
+               lambda: add(a, b))
+
+
+def concat_cases() -> Iterator[Case]:
+    for size in INPUT_SIZES:
+        values = list(range(size))
+        maybes = [Just(x) if x % 3 else Nothing() for x in values]
+        optionals = [x if x % 3 else None for x in values]
+        eithers = [Right(x) for x in values]
+        yield Case(f"concat/Maybe/size={size}", lambda: Maybe.concat(maybes),
+                   lambda: sum(x for x in optionals if x is not None), size)
+        yield Case(f"concat/Either/size={size}", lambda: Either.concat(eithers),
+                   lambda: sum(values), size)
+
+
+def match_cases() -> Iterator[Case]:
+    on_nothing, on_value = (lambda: 0), (lambda x: x)
+    just, nothing, right, left = Just(1), Nothing(), Right(1), Left("e")
+    x, missing = 1, None
+    yield Case("match/Just", lambda: just.match(nothing=on_nothing, just=on_value),
+               lambda: on_nothing() if x is None else on_value(x))
+    yield Case("match/Nothing", lambda: nothing.match(nothing=on_nothing, just=on_value),
+               lambda: on_nothing() if missing is None else on_value(missing))
+    yield Case("match/Right", lambda: right.match(left=on_value, right=on_value),
+               lambda: on_value(x) if isinstance(x, Exception) else on_value(x))
+    yield Case("match/Left", lambda: left.match(left=on_value, right=on_value),
+               lambda: on_value("e") if isinstance("e", str) else on_value("e"))
+
+
+def equality_cases() -> Iterator[Case]:
+    pairs = {
+        "Just": (Just(1), Just(1)),
+        "Nothing": (Nothing(), Nothing()),
+        "Right": (Right(1), Right(1)),
+        "Left": (Left("e"), Left("e")),
+        "Try": (Try.unit(1), Try.unit(1)),
+    }
+    a, b = 1, 1
+    for label, (m, n) in pairs.items():
+        yield Case(f"eq/{label}", lambda m=m, n=n: m == n, lambda: a == b)
+
+
+def cases() -> Iterator[Case]:
+    yield from chain_cases()
+    yield from apply_cases()
+    yield from concat_cases()
+    yield from match_cases()
+    yield from equality_cases()
+
+
+def measure(fp: Callable[[], object], plain: Callable[[], object], number: int, repeat: int) -> tuple[float, float]:
+    """Best time per call of both functions, in nanoseconds.
+
+    The two are timed in alternation so that a slow spell of the machine
+    hits both sides of the ratio rather than one.
+    """
+    fp_timer, plain_timer = timeit.Timer(fp), timeit.Timer(plain)
+    fp_best = plain_best = float("inf")
+    for _ in range(repeat):
+        fp_best = min(fp_best, fp_timer.timeit(number))
+        plain_best = min(plain_best, plain_timer.timeit(number))
+    return fp_best / number * 1e9, plain_best / number * 1e9
+
+
+def run(quick: bool = False, only: str | None = None, names: set[str] | None = None) -> dict:
+    """Time the cases and return the JSON-ready results.
+
+    ``only`` keeps the cases whose name contains it, ``names`` the cases
+    with exactly those names.
+    """
+    budget, repeat = (5_000, 7) if quick else (20_000, 9)
+    results = {}
+    for case in cases():
+        if only and only not in case.name or names is not None and case.name not in names:
+            continue
+        number = max(10, budget // case.weight)
+        try:
+            fp_ns, plain_ns = measure(case.fp, case.plain, number, repeat)
+        except Exception as ex:
+            results[case.name] = {"error": f"{type(ex).__name__}: {ex}"}
+            continue
+        results[case.name] = {"fp_ns": round(fp_ns, 1), "plain_ns": round(plain_ns, 1),
+                              "ratio": round(fp_ns / plain_ns, 3)}
+    return {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> dict[str, str]:
+    """Describe every case whose ratio grew by more than ``tolerance``.
+
+    Cases that failed in the baseline are skipped; a case that worked in
+    the baseline and now fails is a regression.
+    """
+    regressions = {}
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if "ratio" not in before or after is None:
+            continue
+        if "ratio" not in after:
+            regressions[name] = after["error"]
+        elif after["ratio"] > before["ratio"] * (1 + tolerance):
+            regressions[name] = f"{before['ratio']:.2f}x -> {after['ratio']:.2f}x of plain Python"
+    return regressions
+
+
+def gate(baseline: dict, tolerance: float, quick: bool = False, only: str | None = None,
+         attempts: int = 3) -> tuple[dict, dict[str, str]]:
+    """Run the suite and compare it with ``baseline``.
+
+    Cases that look slower are timed again, up to ``attempts`` runs in
+    all, keeping their best ratio, so a single noisy measurement does
+    not fail the gate. Returns the results and the regressions left.
+    """
+    results = run(quick=quick, only=only)
+    regressions = compare(results, baseline, tolerance)
+    for _ in range(attempts - 1):
+        if not regressions:
+            break
+        retry = run(quick=quick, names=set(regressions))["results"]
+        for name, after in retry.items():
+            before = results["results"][name]
+            if "ratio" in after and ("ratio" not in before or after["ratio"] < before["ratio"]):
+                results["results"][name] = after
+        regressions = compare(results, baseline, tolerance)
+    return results, regressions
+
+
+def report(results: dict) -> None:
+    for name, r in results["results"].items():
+        if "ratio" in r:
+            print(f"{name:<28}{r['fp_ns']:>10.0f} ns{r['plain_ns']:>10.0f} ns plain{r['ratio']:>8.2f}x")
+        else:
+            print(f"{name:<28}  {r['error']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="fail on regressions against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown (default 0.5)")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    args = parser.parse_args(argv)
+
+    regressions = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        results, regressions = gate(baseline, args.tolerance, quick=args.quick, only=args.only)
+    else:
+        results = run(quick=args.quick, only=args.only)
+    report(results)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    for name, message in regressions.items():
+        print(f"REGRESSION {name}: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
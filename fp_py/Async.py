@@ -0,0 +1,252 @@
+"""Awaitable Maybe, Either and Try.
+
+An async container wraps an awaitable that produces a plain Maybe or
+Either. ``map``/``bind`` accept both plain and coroutine functions and
+return a new async container straight away; nothing runs until the
+chain is awaited:
+
+    result = await AsyncTry.unit(6).bind(fetch_rate).map(lambda r: r * 2)
+
+Like a coroutine, a chain can be awaited only once.
+"""
+import asyncio
+import inspect
+from functools import partial
+from typing import Any, Awaitable, Generator, Iterable, TypeVar
+
+from fp_py.types.lambda_types import typed_lambda
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.curry import apply_curried
+from fp_py.Maybe import Maybe, Just
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.capture import Capture, capture
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+TError = TypeVar("TError")
+
+
+async def _ready(value):
+    return value
+
+
+class _Async[TSource]:
+    """Shared chain plumbing; subclasses define how results are wrapped."""
+
+    __slots__ = ("_awaitable",)
+
+    def __init__(self, awaitable: Awaitable) -> None:
+        self._awaitable = awaitable
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._awaitable.__await__()
+
+    @classmethod
+    def _failed(cls, m) -> bool:
+        ...
+
+    @classmethod
+    def _success(cls, value):
+        ...
+
+    @classmethod
+    async def _call(cls, fn, value, flatten: bool):
+        ...
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> "_Async[TResult]":
+        return type(self)(self._then(mapper, False))
+
+    # Applicative Section
+    # ===================
+
+    @classmethod
+    def pure(cls, value: typed_lambda[TSource, TResult]) -> "_Async[typed_lambda[TSource, TResult]]":
+        return cls.unit(value)
+
+    def apply(self, something: "_Async[TSource]") -> "_Async[TResult]":
+        return type(self)(self._apply(something))
+
+    async def _apply(self, something):
+        fn = await self
+        if self._failed(fn):
+            return fn
+        m = await something
+        if self._failed(m):
+            return fn.apply(m)
+        # Curry like the sync apply; _call awaits whatever the call returns.
+        return await self._call(partial(apply_curried, fn.unwrap()), m.unwrap(), False)
+
+    # Monad Section
+    # =============
+
+    def bind(self, func: typed_lambda[TSource, Any]) -> "_Async[TResult]":
+        """Chain ``func``; Maybe/Either and async results are flattened."""
+        return type(self)(self._then(func, True))
+
+    async def _then(self, fn, flatten: bool):
+        m = await self._awaitable
+        if self._failed(m):
+            return m
+        return await self._call(fn, m.unwrap(), flatten)
+
+    # Concurrency Section
+    # ===================
+
+    @classmethod
+    async def gather(cls, xs: Iterable[Awaitable], limit: int | None = None) -> list:
+        """Await every item with at most ``limit`` running at once.
+
+        Items may be async containers or any awaitable of a plain
+        container; results come back in input order.
+        """
+        results, _ = await cls._run_bounded(lambda x: x, list(xs), limit, False)
+        return results
+
+    @classmethod
+    async def traverse_async(cls, fn: typed_lambda[TSource, Any], xs: Iterable[TSource],
+                             limit: int | None = None, cancel_on_failure: bool = False):
+        """Run ``fn`` over ``xs`` concurrently and collect the values.
+
+        At most ``limit`` calls are in flight. The result is the first
+        failure in input order, or a success holding the list of values.
+        With ``cancel_on_failure`` the first failure to arrive cancels
+        every call still running and is returned at once.
+        """
+        results, failure = await cls._run_bounded(fn, list(xs), limit, cancel_on_failure)
+        if failure is not None:
+            return failure
+        for m in results:
+            if cls._failed(m):
+                return m
+        return cls._success([m.unwrap() for m in results])
+
+    @classmethod
+    async def _run_bounded(cls, fn, items: list, limit: int | None, stop_on_failure: bool):
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        results = [None] * len(items)
+        pending = iter(enumerate(items))
+        failure = None
+        workers: list[asyncio.Future] = []
+
+        def cancel_others():
+            current = asyncio.current_task()
+            for task in workers:
+                if task is not current:
+                    task.cancel()
+
+        async def worker():
+            nonlocal failure
+            try:
+                for i, x in pending:
+                    m = await cls._call(fn, x, True)
+                    results[i] = m
+                    if stop_on_failure and cls._failed(m):
+                        failure = m
+                        cancel_others()
+                        return
+            except Exception:
+                cancel_others()
+                raise
+
+        count = len(items) if limit is None else min(limit, len(items))
+        workers.extend(asyncio.ensure_future(worker()) for _ in range(count))
+        for outcome in await asyncio.gather(*workers, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                raise outcome
+        return results, failure
+
+
+class AsyncMaybe(_Async[TSource]):
+    """An awaitable Maybe. Exceptions raised by mappers propagate."""
+
+    __slots__ = ()
+
+    @classmethod
+    def unit(cls, value: TSource) -> "AsyncMaybe[TSource]":
+        return cls(_ready(Just.unit(value)))
+
+    @classmethod
+    def from_maybe(cls, m: Maybe[TSource]) -> "AsyncMaybe[TSource]":
+        return cls(_ready(m))
+
+    @classmethod
+    def _failed(cls, m) -> bool:
+        return m.is_nothing()
+
+    @classmethod
+    def _success(cls, value):
+        return Just(value)
+
+    @classmethod
+    async def _call(cls, fn, value, flatten: bool):
+        result = fn(value)
+        if inspect.isawaitable(result):
+            result = await result
+        if flatten and isinstance(result, Maybe):
+            return result
+        return Just.unit(result)
+
+
+class AsyncEither(_Async[TSource]):
+    """An awaitable Either.
+
+    Mapper results follow the rules of ``Right.contoled_map`` for the
+    sync class in ``_right`` (Right here, Try for AsyncTry): an
+    exception, raised synchronously or while awaiting, becomes a Left
+    kept according to that class's ``capture_policy``, and a None
+    result becomes ``Left(None)``.
+    """
+
+    __slots__ = ()
+
+    _right: type = Right
+
+    @classmethod
+    def unit(cls, value: TSource) -> "AsyncEither[TSource]":
+        return cls(_ready(cls._right(value)))
+
+    @classmethod
+    def from_either(cls, e: Either[Any, TSource]) -> "AsyncEither[TSource]":
+        return cls(_ready(e))
+
+    @classmethod
+    def _failed(cls, m) -> bool:
+        return m.is_left()
+
+    @classmethod
+    def _success(cls, value):
+        return cls._right(value)
+
+    @classmethod
+    async def _call(cls, fn, value, flatten: bool):
+        right = cls._right
+        try:
+            result = fn(value)
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as ex:
+            policy = right.capture_policy
+            return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+        if flatten and isinstance(result, Either):
+            return result
+        return right(value).contoled_map(lambda _: result)
+
+
+class AsyncTry(AsyncEither[TSource]):
+    """Awaitable Try: Left values hold the exception that was raised."""
+
+    __slots__ = ()
+
+    _right = Try
+
+
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad
+    from .types.checks import check_protocols
+
+    check_protocols(AsyncMaybe, Functor, Applicative, Monad)
+    check_protocols(AsyncEither, Functor, Applicative, Monad)
@@ -2,20 +2,19 @@
 from abc import abstractmethod
 from functools import reduce, partial
 
-from typing import Callable, Any, Optional, TypeVar, cast
+from typing import Callable, Any, Generator, Iterable, Optional, TypeVar, cast
 
 from fp_py.types.lambda_types import typed_lambda, untyped_lambda
-
-
-from .types import Applicative
-from .types import Functor
-from .types import Monoid
-from .types import Monad
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.curry import apply_curried
+from fp_py.capture import Capture, capture
 
 TSource = TypeVar("TSource")
 TResult = TypeVar("TResult")
 TError = TypeVar("TError")
 
+_identity = lambda x: x
+
 class Either[TError, TSource]:
     """The Either Monad.
 
@@ -23,6 +22,13 @@ class Either[TError, TSource]:
     has failed.
     """
 
+    __slots__ = ()
+
+    # What contoled_map keeps of a caught exception; see fp_py.capture.
+    capture_policy: Capture = Capture.KEEP
+
+    # True for deferred values (see fp_py.lazy), which must be forced before use.
+    _lazy = False
 
     @abstractmethod
     def __add__(self, other: "Either[TError,TSource]") -> "Either[TError,TSource]":
@@ -62,22 +68,152 @@ class Either[TError, TSource]:
     def is_right(self) -> bool:
         return True
 
+    def force(self) -> "Either[TError, TSource]":
+        """The computed Left or Right; a plain Either is already computed."""
+        return self
+
 
 
     @classmethod
-    def concat(cls, xs):
+    def concat(cls, xs: Iterable["Either[TError, TSource]"]) -> "Either[TError, TSource]":
         """mconcat :: [m] -> m
 
-        Fold a list using the monoid. For most types, the default
-        definition for mconcat will be used, but the function is
-        included in the class definition so that an optimized version
-        can be provided for specific types.
+        Fold a list using the monoid. Stops at the first Left without
+        reading the rest of ``xs``; the values of strings, bytes,
+        lists, tuples and numbers are added in one linear pass (see
+        fp_py.concat) instead of pairwise. Either has no empty element,
+        so an empty ``xs`` gives ``Left(None)``.
+        """
+        from .concat import strategy_for
+        rights = []
+        for m in xs:
+            if m._lazy:
+                m = m.force()
+            if isinstance(m, Left):
+                return m
+            rights.append(m)
+        if len(rights) <= 1:
+            return rights[0] if rights else Left(None)
+        values = [m._value for m in rights]
+        strategy = strategy_for(values)
+        if strategy is None:
+            return reduce(lambda a, b: a + b, rights)
+        return rights[-1].contoled_map(lambda _: strategy(values))
+
+    @classmethod
+    def pipeline(cls) -> "EitherPipeline[TSource, TSource]":
+        """Start a lazy, fused chain of map/bind/filter steps.
+
+        The recorded steps run over a raw value in one pass, under a
+        single try block, when the pipeline is called.
+        """
+        from .pipeline import EitherPipeline
+        return EitherPipeline((), cls.capture_policy, cls if issubclass(cls, Right) else Right)
+
+    @classmethod
+    def traverse(cls, fn: typed_lambda[TSource, "Either[TError, TResult]"],
+                 xs: Iterable[TSource]) -> "Either[TError, list[TResult]]":
+        """traverse :: (a -> Either e b) -> [a] -> Either e [b]
+
+        Map ``fn`` over ``xs`` and collect the values into a Right list
+        (a Try list for ``Try.traverse``). Stops at the first Left
+        without reading the rest of ``xs``.
+        """
+        from .traverse import traverse
+        return traverse(fn, xs, Left, cls if issubclass(cls, Right) else Right)
+
+    @classmethod
+    def sequence(cls, xs: Iterable["Either[TError, TSource]"]) -> "Either[TError, list[TSource]]":
+        """sequence :: [Either e a] -> Either e [a]"""
+        from .traverse import traverse
+        return traverse(_identity, xs, Left, cls if issubclass(cls, Right) else Right)
+
+    @classmethod
+    def traverse_iter(cls, fn: typed_lambda[TSource, "Either[TError, TResult]"], xs: Iterable[TSource],
+                      raise_on_failure: bool = False) -> Generator[TResult, None, "Either[TError, TResult] | None"]:
+        """Streaming traverse: yield values until the first Left.
+
+        The generator returns that Left (or raises ShortCircuit when
+        ``raise_on_failure`` is set), so memory stays constant on
+        unbounded inputs.
+        """
+        from .traverse import traverse_iter
+        return traverse_iter(fn, xs, Left, raise_on_failure)
+
+    @classmethod
+    def sequence_iter(cls, xs: Iterable["Either[TError, TSource]"],
+                      raise_on_failure: bool = False) -> Generator[TSource, None, "Either[TError, TSource] | None"]:
+        """Streaming sequence: yield values until the first Left."""
+        from .traverse import traverse_iter
+        return traverse_iter(_identity, xs, Left, raise_on_failure)
+
+    @classmethod
+    def map_n(cls, fn: Callable[..., TResult], first: "Either", *rest: "Either") -> "Either[TError, TResult]":
+        """Call ``fn`` with the values of all the arguments.
+
+        The result of ``pure(fn).apply(first).apply(...)`` without any
+        intermediate partials: the first Left is returned as is.
+        """
+        from .curry import map_n
+        return map_n(fn, (first, *rest), Left)
+
+    @classmethod
+    def lift2(cls, fn: Callable[[Any, Any], TResult]) -> Callable[["Either", "Either"], "Either[TError, TResult]"]:
+        """liftA2 :: (a -> b -> c) -> f a -> f b -> f c"""
+        return lambda a, b: cls.map_n(fn, a, b)
+
+    @classmethod
+    def lift_n(cls, fn: Callable[..., TResult]) -> Callable[..., "Either[TError, TResult]"]:
+        """Lift a function of n values to a function of n Eithers."""
+        return lambda first, *rest: cls.map_n(fn, first, *rest)
+
+    @classmethod
+    def tail_rec(cls, step: typed_lambda[TSource, Any], seed: TSource) -> "Either[TError, TResult]":
+        """tailRecM :: (a -> Either e (Either a b)) -> a -> Either e b
+
+        Run ``step`` in a constant-stack loop: it returns
+        ``Continue(x)`` to go on with ``x``, ``Done(y)`` for a Right
+        (a Try on Try) or a Left to stop. An exception raised by
+        ``step`` becomes a Left, as in ``contoled_map``. See
+        fp_py.tailrec.
+        """
+        from .tailrec import tail_rec
+        done = cls if issubclass(cls, Right) else Right
+        try:
+            return tail_rec(step, seed, Left, done, lambda: Left(None))
+        except Exception as ex:
+            policy = cls.capture_policy
+            return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+
+    @classmethod
+    def do(cls, fn: Callable[..., Generator]) -> Callable[..., "Either[TError, TResult]"]:
+        """Decorate a generator function to run as a do block.
+
+        ``x = yield m`` binds the value of a Right; the first Left
+        yielded is the result. An exception raised by the block becomes
+        a Left, as in ``contoled_map``. See fp_py.do.
         """
+        from .do import do, run
+        done = cls if issubclass(cls, Right) else Right
 
-        def reducer(a, b):
-            return a + b
+        def runner(gen):
+            try:
+                return run(gen, Left, Either, done)
+            except Exception as ex:
+                policy = cls.capture_policy
+                return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+        return do(fn, runner)
 
-        return reduce(reducer, xs, cls.empty())
+    @classmethod
+    def lazy(cls, thunk: Callable[[], Any]) -> "Either[TError, TSource]":
+        """An Either computed by ``thunk`` on first use, at most once.
+
+        A plain result is wrapped as by ``map`` (a Try stays a Try) and
+        an exception becomes a Left. map/bind stay deferred until the
+        value is inspected. See fp_py.lazy.
+        """
+        from .lazy import LazyEither
+        return LazyEither(thunk, wrap=cls if issubclass(cls, Right) else Right)
 
     def __rmod__(self, fn):
         """Infix version of map.
@@ -101,14 +237,56 @@ class Either[TError, TSource]:
     def contoled_map(self, mapper: typed_lambda[TSource, TResult])-> "Either[TError, TResult]":
         try:
             result = mapper(self._value)
-            return Left(result) if result is None else Right(result)
         except Exception as ex:
-            return Left(ex)
-        
+            policy = self.capture_policy
+            return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+        if result is None:
+            return Left(result)
+        if isinstance(result, Fail):
+            return result
+        # Try stays Try; any other receiver (Left included) gives a Right.
+        return (type(self) if isinstance(self, Right) else Right)(result)
+
+    @classmethod
+    def fail(cls, error: TError) -> "Fail[TError, TSource]":
+        """Fail without raising.
+
+        A mapper can return ``Try.fail(error)`` instead of raising; map
+        and bind pass it through as a Left holding ``error``, skipping
+        the cost of raising, catching and capturing a traceback.
+        """
+        return Fail(error)
+
+
 class Left(Either[TError, TSource]):
+    # _hash caches __hash__ once it has been asked for.
+    __slots__ = ("_value", "_hash")
+    __match_args__ = ("_value",)
+
     def __init__(self, value : TError) -> None:
         self._value = value
 
+    # Operator Overloads Section
+    # ==========================
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Left):
+            return self._value is other._value or self._value == other._value
+        if isinstance(other, Either):
+            return other._lazy and self == other.force()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = result = hash((Left, self._value))
+            return result
+
+    def __reduce__(self):
+        # Leave out the cached hash: str hashes differ between processes.
+        return (type(self), (self._value,))
+
     def is_left(self) -> bool:
         return True
 
@@ -116,31 +294,62 @@ class Left(Either[TError, TSource]):
         return False
     
     def __add__(self, other: "Either[TError,TSource]") -> "Either[TError,TSource]":
-        return Left(self._value) 
+        return self
 
     def map(self, mapper : typed_lambda[TSource, TResult]) -> "Either[TError,TResult]":
-        return Left(self._value)
+        return self
 
     @classmethod
     def pure(cls, value: typed_lambda[TSource, TResult]) -> "Either[TError, typed_lambda[TSource, TResult]]":
         return Right(value)
 
     def apply(self: "Either[typed_lambda[TSource, TResult]]", something: Either[TError, TSource]) -> Either[TError, TResult]:
-        return Left(self._value)
+        return self
 
     def bind(self, fn: typed_lambda[TSource, "Either[TError, TSource]"]) -> "Either[TError, TResult]":
-        return Left(self._value)
+        return self
     
     def bind(self, func: typed_lambda[TSource, TResult]) -> "Either[TError,TResult]":
-        return Left(self._value)
+        return self
 
     @classmethod
     def unit(cls, value: TSource) -> "Either[TError, TSource]":
         return Left(value)
     
+class Fail(Left[TError, TSource]):
+    """A Left returned by a mapper to signal an expected failure."""
+
+    __slots__ = ()
+
+
 class Right(Either[TError, TSource]):
+    # _hash caches __hash__ once it has been asked for.
+    __slots__ = ("_value", "_hash")
+    __match_args__ = ("_value",)
+
     def __init__(self, value: TSource) -> None:
         self._value = value
+
+    # Operator Overloads Section
+    # ==========================
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Right):
+            return self._value is other._value or self._value == other._value
+        if isinstance(other, Either):
+            return other._lazy and self == other.force()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = result = hash((Right, self._value))
+            return result
+
+    def __reduce__(self):
+        # Leave out the cached hash: str hashes differ between processes.
+        return (type(self), (self._value,))
     
 
     def is_left(self) -> bool:
@@ -151,7 +360,7 @@ class Right(Either[TError, TSource]):
  
     def __add__(self, other: "Either[TError,TSource]") -> "Either[TError,TSource]":
         if other.is_left():
-            return Left(other._value)
+            return other
         return other.map(
             lambda other_value: cast(Any, self._value) + other_value if hasattr(self._value, "__add__") else Left()
         )
@@ -164,16 +373,12 @@ class Right(Either[TError, TSource]):
         return Right(value)
     
     def apply(self: "Either[TError, typed_lambda[TSource, TResult]]", something: Either[TError,TSource]) -> Either[TError, TResult]:
-        def mapper(other_value):
-            try:
-                return self._value(other_value)
-            except TypeError:
-                return partial(self._value, other_value)
-        return something.map(mapper)
+        # Multi-argument functions are curried: see fp_py.curry.
+        return something.map(partial(apply_curried, self._value))
     
     @classmethod
     def unit(cls, value: TSource) -> "Either[TError, TSource]":
-        return Right(value)
+        return cls(value)
     
     def bind(self, func: typed_lambda[TSource, "Either[TError, TSource]"]) -> "Either[TError, TResult]":
         return self.contoled_map(func)
@@ -183,20 +388,17 @@ class Right(Either[TError, TSource]):
     
     @classmethod
     def unit(cls, value: TSource) -> "Either[TError, TSource]":
-        return Right(value)
-    
-assert(isinstance(Either, Functor))
-assert(isinstance(Either, Applicative))
-assert(isinstance(Either, Monad))
+        return cls(value)
+
 
-assert(isinstance(Right, Functor))
-assert(isinstance(Right, Applicative))
-assert(isinstance(Right, Monad))
+class Try[TSource](Right[Exception, TSource]):
+    __slots__ = ()
 
-assert(isinstance(Left, Functor))
-assert(isinstance(Left, Applicative))
-assert(isinstance(Left, Monad))
 
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad
+    from .types.checks import check_protocols
 
-class Try[TSource](Right[Exception, TSource]):
-    pass
\ No newline at end of file
+    check_protocols(Either, Functor, Applicative, Monad)
+    check_protocols(Right, Functor, Applicative, Monad)
+    check_protocols(Left, Functor, Applicative, Monad)
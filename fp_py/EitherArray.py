@@ -0,0 +1,276 @@
+"""Columnar Either/Try with per-row error capture.
+
+Requires the optional ``numpy`` dependency (``pip install fp-py[numpy]``).
+"""
+from typing import Any, Iterable, TypeVar
+
+import numpy as np
+
+from fp_py.types.lambda_types import typed_lambda
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.capture import Capture, capture
+from fp_py.Either import Either, Left, Right, Try, Fail
+from fp_py.MaybeArray import _pack, _scatter
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+TError = TypeVar("TError")
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class EitherArray[TError, TSource]:
+    """A batch of Either values.
+
+    Stored as three columns: the Right payloads, a boolean tag that is
+    True for Right rows, and a sparse ``{row: payload}`` dict for the
+    Left rows. ``map``/``bind`` run the function once per Right row,
+    where each exception becomes that row's Left just like
+    ``contoled_map``, kept under ``Right.capture_policy``
+    (``Try.capture_policy`` for TryArray). NumPy ufuncs (or any function passed with
+    ``vectorized=True``) run over all Right rows at once instead; if
+    that raises, the batch is split into chunks and only the chunks that
+    fail again are run row by row.
+    """
+
+    __slots__ = ("_values", "_right", "_errors")
+
+    # The eager class whose capture policy applies to caught exceptions.
+    _eager: type = Right
+
+    def __init__(self, values: Any, right: Any = None, errors: dict[int, TError] | None = None) -> None:
+        self._values = values if isinstance(values, np.ndarray) else _pack(list(values))
+        self._right = np.ones(len(self._values), dtype=bool) if right is None \
+            else np.asarray(right, dtype=bool)
+        self._errors = {} if errors is None else errors
+
+    # Conversion Section
+    # ==================
+
+    @classmethod
+    def from_values(cls, xs: Iterable[TSource]) -> "EitherArray[TError, TSource]":
+        """Build a batch where every row is a Right."""
+        return cls(_pack(list(xs)))
+
+    @classmethod
+    def from_eithers(cls, xs: Iterable[Either[TError, TSource]]) -> "EitherArray[TError, TSource]":
+        xs = list(xs)
+        right = np.fromiter((x.is_right() for x in xs), dtype=bool, count=len(xs))
+        errors = {i: x.unwrap() for i, x in enumerate(xs) if x.is_left()}
+        return cls(_scatter(right, [x.unwrap() for x in xs if x.is_right()]), right, errors)
+
+    def to_eithers(self) -> list[Either[TError, TSource]]:
+        errors = self._errors
+        return [Right(v) if r else Left(errors.get(i))
+                for i, (v, r) in enumerate(zip(self._values.tolist(), self._right.tolist()))]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def errors(self) -> dict[int, TError]:
+        return dict(self._errors)
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult], vectorized: bool | None = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE) -> "EitherArray[TError, TResult]":
+        """Row-wise ``Right.map``: exceptions and None results become Left.
+
+        ``vectorized`` defaults to True for NumPy ufuncs only; pass it
+        explicitly for other functions that take the whole column.
+        """
+        return self._transform(mapper, False, vectorized, chunk_size)
+
+    # Applicative Section
+    # ===================
+
+    @classmethod
+    def pure(cls, value: typed_lambda[TSource, TResult]) -> "EitherArray[TError, typed_lambda[TSource, TResult]]":
+        return cls.unit(value)
+
+    def apply(self: "EitherArray[TError, typed_lambda[TSource, TResult]]",
+              something: "EitherArray[TError, TSource]") -> "EitherArray[TError, TResult]":
+        """Apply the wrapped functions row by row.
+
+        A single-row function batch (as built by ``pure``) is broadcast
+        through ``map``.
+        """
+        if len(self) == 1:
+            if self._right[0]:
+                return something.map(self._values[0])
+            error = self._errors.get(0)
+            return type(something)(something._values, np.zeros(len(something), dtype=bool),
+                                   {i: error for i in range(len(something))})
+        errors = {**something._errors, **self._errors}
+        right = self._right & something._right
+        functions = self._values
+        return type(something)(something._values, right, errors)._scalar(
+            lambda i, value: functions[i](value), False)
+
+    # Monad Section
+    # =============
+
+    @classmethod
+    def unit(cls, value: TSource) -> "EitherArray[TError, TSource]":
+        return cls.from_values([value])
+
+    def bind(self, func: typed_lambda[TSource, Either[TError, TResult] | TResult], vectorized: bool | None = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> "EitherArray[TError, TResult]":
+        """Row-wise ``Right.bind``; Either results are flattened into the batch."""
+        return self._transform(func, True, vectorized, chunk_size)
+
+    def _transform(self, fn, flatten: bool, vectorized: bool | None, chunk_size: int) -> "EitherArray[TError, TResult]":
+        if vectorized is None:
+            vectorized = isinstance(fn, np.ufunc)
+        rows = np.flatnonzero(self._right)
+        out = _Collector(len(self), self._errors, flatten, self._eager.capture_policy)
+        if not vectorized:
+            out.scalar(fn, rows, self._values[rows].tolist())
+        elif not out.vectorized(fn, rows, self._values[rows]):
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                if not out.vectorized(fn, chunk, self._values[chunk]):
+                    out.scalar(fn, chunk, self._values[chunk].tolist())
+        return type(self)(*out.columns())
+
+    def _scalar(self, call, flatten: bool) -> "EitherArray[TError, TResult]":
+        rows = np.flatnonzero(self._right)
+        out = _Collector(len(self), self._errors, flatten, self._eager.capture_policy)
+        out.indexed(call, rows, self._values[rows].tolist())
+        return type(self)(*out.columns())
+
+    # Utilities Section
+    # =================
+
+    def is_left(self) -> np.ndarray:
+        return ~self._right
+
+    def is_right(self) -> np.ndarray:
+        return self._right.copy()
+
+    def match(self, left: typed_lambda[TError], right: typed_lambda[np.ndarray, np.ndarray]) -> np.ndarray:
+        """Fold both branches into one array.
+
+        ``right`` is called once with the array of Right payloads;
+        ``left`` is called per Left row with its payload.
+        """
+        right_branch = np.asarray(right(self._values[self._right]))
+        if self._right.all():
+            return right_branch
+        out = np.empty(len(self), dtype=object)
+        out[self._right] = right_branch
+        for i, error in self._errors.items():
+            out[i] = left(error)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> Either[TError, TSource]:
+        if self._right[index]:
+            value = self._values[index]
+            return Right(value.item() if isinstance(value, np.generic) else value)
+        return Left(self._errors.get(index % len(self)))
+
+    def __iter__(self):
+        return iter(self.to_eithers())
+
+    def __rmod__(self, fn):
+        """Infix version of map."""
+        return self.map(fn)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} {self.to_eithers()}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class TryArray[TSource](EitherArray[Exception, TSource]):
+    """Batch form of Try: Left rows hold the exception raised for that row."""
+
+    __slots__ = ()
+
+    _eager = Try
+
+
+class _Collector:
+    """Accumulates the Right results and Left payloads of one transform."""
+
+    __slots__ = ("_right", "_errors", "_flatten", "_policy", "_rows", "_parts")
+
+    def __init__(self, size: int, errors: dict, flatten: bool, policy: Capture = Capture.KEEP) -> None:
+        self._right = np.zeros(size, dtype=bool)
+        self._errors = dict(errors)
+        self._flatten = flatten
+        self._policy = policy
+        self._rows = []
+        self._parts = []
+
+    def vectorized(self, fn, rows: np.ndarray, values: np.ndarray) -> bool:
+        """Try ``fn`` on the whole slice; False means fall back to rows."""
+        try:
+            with np.errstate(all="raise"):
+                result = fn(values)
+        except Exception:
+            return False
+        if not isinstance(result, np.ndarray) or result.shape != values.shape:
+            return False
+        if result.dtype == object:
+            self.scalar(lambda value: value, rows, result.tolist())
+        else:
+            self._accept(rows, result)
+        return True
+
+    def scalar(self, fn, rows: np.ndarray, values: list) -> None:
+        self.indexed(lambda _, value: fn(value), rows, values)
+
+    def indexed(self, call, rows: np.ndarray, values: list) -> None:
+        ok_rows, ok_values = [], []
+        errors, flatten, policy = self._errors, self._flatten, self._policy
+        for i, value in zip(rows.tolist(), values):
+            try:
+                result = call(i, value)
+            except Exception as ex:
+                errors[i] = ex if policy is Capture.KEEP else capture(ex, policy)
+                continue
+            if isinstance(result, Either) and (flatten or isinstance(result, Fail)):
+                if result.is_left():
+                    errors[i] = result.unwrap()
+                    continue
+                result = result.unwrap()
+            if result is None:
+                errors[i] = None
+                continue
+            ok_rows.append(i)
+            ok_values.append(result)
+        self._accept(np.asarray(ok_rows, dtype=np.intp), _pack(ok_values))
+
+    def _accept(self, rows: np.ndarray, values: np.ndarray) -> None:
+        if len(rows):
+            self._right[rows] = True
+            self._rows.append(rows)
+            self._parts.append(values)
+
+    def columns(self) -> tuple[np.ndarray, np.ndarray, dict]:
+        if self._parts:
+            parts = self._parts
+            if len({part.dtype for part in parts}) > 1:
+                parts = [part.astype(object) for part in parts]
+            values = np.concatenate(parts)
+            out = np.zeros(len(self._right), dtype=values.dtype) if values.dtype != object \
+                else np.empty(len(self._right), dtype=object)
+            out[np.concatenate(self._rows)] = values
+        else:
+            out = np.empty(len(self._right), dtype=object)
+        return out, self._right, self._errors
+
+
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad
+    from .types.checks import check_protocols
+
+    check_protocols(EitherArray, Functor, Applicative, Monad)
@@ -1,19 +1,17 @@
 from abc import abstractmethod
 from functools import reduce, partial
 
-from typing import Callable, Any, Optional, TypeVar, cast
+from typing import Callable, Any, Generator, Iterable, Optional, TypeVar, cast
 
 from fp_py.types.lambda_types import typed_lambda, untyped_lambda
-
-
-from .types import Applicative
-from .types import Functor
-from .types import Monoid
-from .types import Monad
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.curry import apply_curried
 
 TSource = TypeVar("TSource")
 TResult = TypeVar("TResult")
 
+_identity = lambda x: x
+
 
 class Maybe[TSource]:
     """Encapsulates an optional value.
@@ -25,6 +23,11 @@ class Maybe[TSource]:
     measures such as error.
     """
 
+    __slots__ = ()
+
+    # True for deferred values (see fp_py.lazy), which must be forced before use.
+    _lazy = False
+
     @classmethod
     def empty(cls) -> "Maybe[TSource]":
         return Nothing()
@@ -64,22 +67,131 @@ class Maybe[TSource]:
     def is_nothing(self) -> bool:
         return True
 
+    def force(self) -> "Maybe[TSource]":
+        """The computed Just or Nothing; a plain Maybe is already computed."""
+        return self
+
 
 
     @classmethod
-    def concat(cls, xs):
+    def concat(cls, xs: Iterable["Maybe[TSource]"]) -> "Maybe[TSource]":
         """mconcat :: [m] -> m
 
-        Fold a list using the monoid. For most types, the default
-        definition for mconcat will be used, but the function is
-        included in the class definition so that an optimized version
-        can be provided for specific types.
+        Fold a list using the monoid. Nothing is skipped, and the
+        values of strings, bytes, lists, tuples and numbers are added
+        in one linear pass (see fp_py.concat) instead of pairwise.
+        ``xs`` may be any iterable and is read once.
+        """
+        from .concat import strategy_for
+        justs = []
+        for m in xs:
+            if m._lazy:
+                m = m.force()
+            if not isinstance(m, Nothing):
+                justs.append(m)
+        if len(justs) <= 1:
+            return justs[0] if justs else Nothing()
+        values = [m._value for m in justs]
+        strategy = strategy_for(values)
+        if strategy is None:
+            return reduce(lambda a, b: a + b, justs)
+        return Just.unit(strategy(values))
+
+    @classmethod
+    def pipeline(cls) -> "MaybePipeline[TSource, TSource]":
+        """Start a lazy, fused chain of map/bind/filter steps.
+
+        The recorded steps run over a raw value in one pass when the
+        pipeline is called, with no intermediate Just in between.
         """
+        from .pipeline import MaybePipeline
+        return MaybePipeline()
 
-        def reducer(a, b):
-            return a + b
+    @classmethod
+    def traverse(cls, fn: typed_lambda[TSource, "Maybe[TResult]"], xs: Iterable[TSource]) -> "Maybe[list[TResult]]":
+        """traverse :: (a -> Maybe b) -> [a] -> Maybe [b]
 
-        return reduce(reducer, xs, cls.empty())
+        Map ``fn`` over ``xs`` and collect the values into a Just list.
+        Stops at the first Nothing without reading the rest of ``xs``.
+        """
+        from .traverse import traverse
+        return traverse(fn, xs, Nothing, Just)
+
+    @classmethod
+    def sequence(cls, xs: Iterable["Maybe[TSource]"]) -> "Maybe[list[TSource]]":
+        """sequence :: [Maybe a] -> Maybe [a]"""
+        from .traverse import traverse
+        return traverse(_identity, xs, Nothing, Just)
+
+    @classmethod
+    def traverse_iter(cls, fn: typed_lambda[TSource, "Maybe[TResult]"], xs: Iterable[TSource],
+                      raise_on_failure: bool = False) -> Generator[TResult, None, "Maybe[TResult] | None"]:
+        """Streaming traverse: yield values until the first Nothing.
+
+        The generator returns that Nothing (or raises ShortCircuit when
+        ``raise_on_failure`` is set), so memory stays constant on
+        unbounded inputs.
+        """
+        from .traverse import traverse_iter
+        return traverse_iter(fn, xs, Nothing, raise_on_failure)
+
+    @classmethod
+    def sequence_iter(cls, xs: Iterable["Maybe[TSource]"],
+                      raise_on_failure: bool = False) -> Generator[TSource, None, "Maybe[TSource] | None"]:
+        """Streaming sequence: yield values until the first Nothing."""
+        from .traverse import traverse_iter
+        return traverse_iter(_identity, xs, Nothing, raise_on_failure)
+
+    @classmethod
+    def map_n(cls, fn: Callable[..., TResult], first: "Maybe", *rest: "Maybe") -> "Maybe[TResult]":
+        """Call ``fn`` with the values of all the arguments.
+
+        The result of ``pure(fn).apply(first).apply(...)`` without any
+        intermediate partials: the first Nothing is returned as is.
+        """
+        from .curry import map_n
+        return map_n(fn, (first, *rest), Nothing)
+
+    @classmethod
+    def lift2(cls, fn: Callable[[Any, Any], TResult]) -> Callable[["Maybe", "Maybe"], "Maybe[TResult]"]:
+        """liftA2 :: (a -> b -> c) -> f a -> f b -> f c"""
+        return lambda a, b: cls.map_n(fn, a, b)
+
+    @classmethod
+    def lift_n(cls, fn: Callable[..., TResult]) -> Callable[..., "Maybe[TResult]"]:
+        """Lift a function of n values to a function of n Maybes."""
+        return lambda first, *rest: cls.map_n(fn, first, *rest)
+
+    @classmethod
+    def tail_rec(cls, step: typed_lambda[TSource, Any], seed: TSource) -> "Maybe[TResult]":
+        """tailRecM :: (a -> Maybe (Either a b)) -> a -> Maybe b
+
+        Run ``step`` in a constant-stack loop: it returns
+        ``Continue(x)`` to go on with ``x``, ``Done(y)`` for ``Just(y)``
+        or Nothing to stop. See fp_py.tailrec.
+        """
+        from .tailrec import tail_rec
+        return tail_rec(step, seed, Nothing, Just.unit, Nothing)
+
+    @classmethod
+    def do(cls, fn: Callable[..., Generator]) -> Callable[..., "Maybe[TResult]"]:
+        """Decorate a generator function to run as a do block.
+
+        ``x = yield m`` binds the value of a Just; the first Nothing
+        yielded is the result. See fp_py.do.
+        """
+        from .do import do, run
+        return do(fn, lambda gen: run(gen, Nothing, Maybe, Just.unit))
+
+    @classmethod
+    def lazy(cls, thunk: Callable[[], Any]) -> "Maybe[TSource]":
+        """A Maybe computed by ``thunk`` on first use, at most once.
+
+        ``thunk`` returns a Maybe or a plain value (None is Nothing).
+        map/bind stay deferred until the value is inspected. See fp_py.lazy.
+        """
+        from .lazy import LazyMaybe
+        return LazyMaybe(thunk)
 
     def __rmod__(self, fn):
         """Infix version of map.
@@ -111,8 +223,23 @@ class Nothing(Maybe[TSource]):
 
     Represents an empty Maybe that holds nothing (in which case it has
     the value of Nothing).
+
+    Nothing carries no state, so there is exactly one instance of it:
+    every ``Nothing()`` call returns the same object.
     """
 
+    __slots__ = ()
+    __match_args__ = ()
+
+    _instance: "Nothing | None" = None
+
+    def __new__(cls, *args, **kwargs) -> "Nothing":
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
     # Monoid Section
     # ==============
 
@@ -124,7 +251,7 @@ class Nothing(Maybe[TSource]):
     # ===============
 
     def map(self, mapper: typed_lambda[TSource,TResult]) -> Maybe[TResult]:
-        return Nothing()
+        return self
 
     # Applicative Section
     # ===================
@@ -134,7 +261,7 @@ class Nothing(Maybe[TSource]):
         return Nothing()
 
     def apply(self: "Nothing[typed_lambda[TSource, TResult]]", something: Maybe[TSource]) -> Maybe[TResult]:
-        return Nothing()
+        return self
 
     # Monad Section
     # =============
@@ -149,7 +276,7 @@ class Nothing(Maybe[TSource]):
         Nothing in, Nothing out.
         """
 
-        return Nothing()
+        return self
 
     # Utilities Section
     # =================
@@ -164,7 +291,12 @@ class Nothing(Maybe[TSource]):
     # ==========================
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, Nothing)
+        if isinstance(other, Nothing):
+            return True
+        return isinstance(other, Maybe) and other._lazy and other.force() is self
+
+    def __hash__(self) -> int:
+        return hash(Nothing)
 
     def __str__(self) -> str:
         return "Nothing"
@@ -178,7 +310,12 @@ class Just(Maybe[TSource]):
     """A Maybe that contains a value.
 
     Represents a Maybe that contains a value (represented as Just a).
-    """ 
+    """
+
+    # _hash caches __hash__ once it has been asked for.
+    __slots__ = ("_value", "_hash")
+    __match_args__ = ("_value",)
+
     def __init__(self, value: TSource)->Maybe[TSource]:
         self._value = value
 
@@ -209,12 +346,8 @@ class Just(Maybe[TSource]):
         return  Just(value) if value is not None else Nothing()
 
     def apply(self: "Just[typed_lambda[TSource, TResult]]", something: Maybe[TSource]) -> Maybe[TResult]:
-        def mapper(other_value):
-            try:
-                return self._value(other_value)
-            except TypeError:
-                return partial(self._value, other_value)
-        return something.map(mapper)
+        # Multi-argument functions are curried: see fp_py.curry.
+        return something.map(partial(apply_curried, self._value))
 
     # Monad Section
     # =============
@@ -248,9 +381,22 @@ class Just(Maybe[TSource]):
         return bool(self._value)
     
     def __eq__(self, other) -> bool:
-        if isinstance(other, Nothing):
-            return False
-        return bool(other.map(lambda other_value: other_value == self._value))
+        if isinstance(other, Just):
+            return self._value is other._value or self._value == other._value
+        if isinstance(other, Maybe):
+            return other._lazy and self == other.force()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = result = hash((Just, self._value))
+            return result
+
+    def __reduce__(self):
+        # Leave out the cached hash: str hashes differ between processes.
+        return (type(self), (self._value,))
 
     def __str__(self) -> str:
         return f"Just {self._value}"
@@ -258,20 +404,14 @@ class Just(Maybe[TSource]):
     def __repr__(self) -> str:
         return str(self)
 
-assert issubclass(Just, Maybe)
-assert issubclass(Nothing, Maybe)
 
-assert isinstance(Maybe, Monoid)
-assert isinstance(Maybe, Functor)
-assert isinstance(Maybe, Applicative)
-assert isinstance(Maybe, Monad)
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad, Monoid
+    from .types.checks import check_protocols
 
-assert isinstance(Just, Monoid)
-assert isinstance(Just, Functor)
-assert isinstance(Just, Applicative)
-assert isinstance(Just, Monad)
+    assert issubclass(Just, Maybe)
+    assert issubclass(Nothing, Maybe)
 
-assert isinstance(Nothing, Monoid)
-assert isinstance(Nothing, Functor)
-assert isinstance(Nothing, Applicative)
-assert isinstance(Nothing, Monad)
\ No newline at end of file
+    check_protocols(Maybe, Monoid, Functor, Applicative, Monad)
+    check_protocols(Just, Monoid, Functor, Applicative, Monad)
+    check_protocols(Nothing, Monoid, Functor, Applicative, Monad)
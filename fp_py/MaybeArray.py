@@ -0,0 +1,251 @@
+"""Columnar Maybe backed by a NumPy masked array.
+
+Requires the optional ``numpy`` dependency (``pip install fp-py[numpy]``).
+"""
+from functools import reduce
+from typing import Any, Callable, Iterable, TypeVar
+
+import numpy as np
+
+from fp_py.types.lambda_types import typed_lambda, untyped_lambda
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.Maybe import Maybe, Just, Nothing
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+
+
+def _pack(values: list) -> np.ndarray:
+    """Pack ``values`` into a 1-d array, keeping each payload as it is.
+
+    Values of a single type get a typed column; mixed payloads (say
+    ``[1, 'a']`` or ``[True, 2]``) would be coerced by ``np.asarray``, so
+    they are stored in an object column instead.
+    """
+    if values and len({type(v) for v in values}) == 1:
+        packed = np.asarray(values)
+        if packed.ndim == 1:
+            return packed
+    packed = np.empty(len(values), dtype=object)
+    packed[:] = values
+    return packed
+
+
+def _scatter(present: np.ndarray, values: list) -> np.ndarray:
+    """Place ``values`` at the True positions of ``present``."""
+    packed = _pack(values)
+    out = np.zeros(len(present), dtype=packed.dtype) if packed.dtype != object \
+        else np.empty(len(present), dtype=object)
+    out[present] = packed
+    return out
+
+
+class MaybeArray[TSource]:
+    """A column of optional values.
+
+    Holds a value buffer plus a presence mask in a single
+    ``numpy.ma.MaskedArray``: a masked slot is a Nothing, an unmasked
+    slot is a Just. Every operation behaves as if it were applied to each
+    row's Maybe, but runs over the whole column at once where it can.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, values: Any, present: Any = None) -> None:
+        if present is None:
+            self._data = np.ma.array(values, mask=np.ma.getmaskarray(values))
+        else:
+            self._data = np.ma.array(values, mask=~np.asarray(present, dtype=bool))
+
+    # Conversion Section
+    # ==================
+
+    @classmethod
+    def from_values(cls, xs: Iterable[TSource | None]) -> "MaybeArray[TSource]":
+        """Build a column from raw values, with None standing for Nothing."""
+        xs = list(xs)
+        present = np.fromiter((x is not None for x in xs), dtype=bool, count=len(xs))
+        return cls(_scatter(present, [x for x in xs if x is not None]), present)
+
+    @classmethod
+    def from_maybes(cls, xs: Iterable[Maybe[TSource]]) -> "MaybeArray[TSource]":
+        return cls.from_values(x.unwrap() if x.is_just() else None for x in xs)
+
+    def to_maybes(self) -> list[Maybe[TSource]]:
+        nothing = Nothing()
+        present = self.is_just()
+        return [Just(v) if p else nothing for v, p in zip(self._data.data.tolist(), present.tolist())]
+
+    @property
+    def values(self) -> np.ma.MaskedArray:
+        return self._data
+
+    # Monoid Section
+    # ==============
+
+    @classmethod
+    def empty(cls) -> "MaybeArray[TSource]":
+        return cls(np.empty(0, dtype=object), np.empty(0, dtype=bool))
+
+    def __add__(self, other: "MaybeArray[TSource]") -> "MaybeArray[TSource]":
+        """Row-wise Maybe append: Just a + Just b = Just (a + b), Nothing is the identity.
+
+        Both columns must have the same length; the empty column is the
+        identity of any length.
+        """
+        if len(self) == 0:
+            return other
+        if len(other) == 0:
+            return self
+        if len(self) != len(other):
+            raise ValueError(f"cannot add MaybeArrays of lengths {len(self)} and {len(other)}")
+        mine, theirs = self.is_just(), other.is_just()
+        both = mine & theirs
+        ours, others = self._data.data, other._data.data
+        if ours.dtype != others.dtype:
+            ours, others = ours.astype(object), others.astype(object)
+        values = np.where(mine, ours, others)
+        # Only rows present on both sides are added: missing rows may hold None.
+        summed = ours[both] + others[both]
+        if summed.dtype != values.dtype:
+            values = values.astype(np.result_type(values, summed))
+        values[both] = summed
+        return MaybeArray(values, mine | theirs)
+
+    @classmethod
+    def concat(cls, xs: Iterable["MaybeArray[TSource]"]) -> "MaybeArray[TSource]":
+        """mconcat :: [m] -> m
+
+        Fold columns with the row-wise monoid.
+        """
+        return reduce(lambda a, b: a + b, xs, cls.empty())
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult], vectorized: bool | None = None) -> "MaybeArray[TResult]":
+        """Apply ``mapper`` to every present value.
+
+        NumPy ufuncs are applied to the whole column at once; any other
+        callable runs once per present row unless ``vectorized=True``
+        says it takes the whole column and returns an array of the same
+        length. A per-element result of None becomes Nothing, and slots
+        masked by a vectorized result stay masked.
+        """
+        if vectorized is None:
+            vectorized = isinstance(mapper, np.ufunc)
+        if not vectorized:
+            return self._per_element(lambda _, value: mapper(value))
+        with np.errstate(all="ignore"):
+            result = mapper(self._data)
+        if not isinstance(result, np.ndarray) or result.shape != self._data.shape:
+            raise TypeError(f"{mapper!r} did not return an array of length {len(self)}")
+        present = self.is_just() & ~np.ma.getmaskarray(result)
+        return MaybeArray(np.ma.getdata(result), present)
+
+    def _per_element(self, call: Callable[[int, Any], Any], flatten: bool = False,
+                     present: np.ndarray | None = None) -> "MaybeArray[TResult]":
+        """Slow path: call ``call(index, value)`` for every present row."""
+        present = (self.is_just() if present is None else present).copy()
+        rows = np.flatnonzero(present)
+        results = []
+        # tolist() hands plain Python values to ``call``, not NumPy scalars.
+        for i, value in zip(rows.tolist(), self._data.data[rows].tolist()):
+            result = call(i, value)
+            if flatten and isinstance(result, Maybe):
+                result = result.unwrap() if result.is_just() else None
+            if result is None:
+                present[i] = False
+            else:
+                results.append(result)
+        return MaybeArray(_scatter(present, results), present)
+
+    # Applicative Section
+    # ===================
+
+    @classmethod
+    def pure(cls, value: typed_lambda[TSource, TResult]) -> "MaybeArray[typed_lambda[TSource, TResult]]":
+        return cls.unit(value)
+
+    def apply(self: "MaybeArray[typed_lambda[TSource, TResult]]", something: "MaybeArray[TSource]") -> "MaybeArray[TResult]":
+        """Apply the wrapped functions row by row.
+
+        A single-row function column (as built by ``pure``) is broadcast,
+        which keeps the vectorized ``map`` path.
+        """
+        if len(self) == 1:
+            return something.map(self._data.data[0]) if self.is_just()[0] else \
+                MaybeArray(something._data.data, np.zeros(len(something), dtype=bool))
+        functions = self._data.data
+        present = self.is_just() & something.is_just()
+        return something._per_element(lambda i, value: functions[i](value), present=present)
+
+    # Monad Section
+    # =============
+
+    @classmethod
+    def unit(cls, value: TSource) -> "MaybeArray[TSource]":
+        return cls.from_values([value])
+
+    def bind(self, func: typed_lambda[TSource, Maybe[TResult] | TResult]) -> "MaybeArray[TResult]":
+        """Run ``func`` on every present value.
+
+        ``func`` may return a Maybe, which is flattened into the column,
+        or a raw value, which is wrapped like ``Just.unit``.
+        """
+        return self._per_element(lambda _, value: func(value), flatten=True)
+
+    # Utilities Section
+    # =================
+
+    def is_just(self) -> np.ndarray:
+        return ~np.ma.getmaskarray(self._data)
+
+    def is_nothing(self) -> np.ndarray:
+        return np.ma.getmaskarray(self._data).copy()
+
+    def match(self, nothing: untyped_lambda, just: typed_lambda[np.ndarray, np.ndarray]) -> np.ndarray:
+        """Fold both branches into one plain array.
+
+        ``just`` is called once with the array of present values and
+        must return an array of the same length; ``nothing`` is called
+        once and its result fills every missing slot.
+        """
+        present = self.is_just()
+        just_branch = np.asarray(just(self._data.data[present]))
+        if present.all():
+            return just_branch
+        nothing_branch = np.asarray(nothing())
+        out = np.empty(len(self), dtype=np.result_type(just_branch, nothing_branch))
+        out[present] = just_branch
+        out[~present] = nothing_branch
+        return out
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> Maybe[TSource]:
+        if np.ma.getmaskarray(self._data)[index]:
+            return Nothing()
+        value = self._data.data[index]
+        return Just(value.item() if isinstance(value, np.generic) else value)
+
+    def __iter__(self):
+        return iter(self.to_maybes())
+
+    def __rmod__(self, fn):
+        """Infix version of map."""
+        return self.map(fn)
+
+    def __str__(self) -> str:
+        return f"MaybeArray {self.to_maybes()}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad, Monoid
+    from .types.checks import check_protocols
+
+    check_protocols(MaybeArray, Monoid, Functor, Applicative, Monad)
@@ -0,0 +1,191 @@
+from functools import partial
+from itertools import batched, chain, dropwhile, islice, takewhile
+
+from typing import Callable, Any, Iterable, Iterator, TypeVar
+
+from fp_py.types.lambda_types import typed_lambda
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.curry import apply_curried
+from fp_py.Maybe import Maybe, Just, Nothing
+from fp_py.Either import Either
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+
+
+class _Replay:
+    """An iterable that calls ``fn(*args)`` afresh for every iteration."""
+
+    __slots__ = ("_fn", "_args")
+
+    def __init__(self, fn: Callable[..., Iterable], *args: Any) -> None:
+        self._fn = fn
+        self._args = args
+
+    def __iter__(self) -> Iterator:
+        return iter(self._fn(*self._args))
+
+
+def _apply(fns: Iterable, xs: Iterable) -> Iterator:
+    for fn in fns:
+        yield from map(partial(apply_curried, fn), xs)
+
+
+def _iterate(fn: Callable, seed: Any) -> Iterator:
+    while True:
+        yield seed
+        seed = fn(seed)
+
+
+class Stream[TSource]:
+    """A lazy, possibly unbounded sequence.
+
+    Nothing is computed until the stream is iterated, and every
+    operator (``map``, ``bind``, ``take``, ``chunk``, ``+`` ...) pulls
+    one item at a time from the stream below it, so a pipeline over an
+    unbounded source runs in constant memory. A stream can be iterated
+    again when its source can: streams over lists or ranges replay,
+    streams over a generator are single-pass.
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Iterable[TSource] = ()) -> None:
+        self._source = source
+
+    def __iter__(self) -> Iterator[TSource]:
+        return iter(self._source)
+
+    @classmethod
+    def of(cls, *xs: TSource) -> "Stream[TSource]":
+        return cls(xs)
+
+    @classmethod
+    def iterate(cls, fn: typed_lambda[TSource, TSource], seed: TSource) -> "Stream[TSource]":
+        """The unbounded stream seed, fn(seed), fn(fn(seed)), ..."""
+        return cls(_Replay(_iterate, fn, seed))
+
+    # Monoid Section
+    # ==============
+
+    @classmethod
+    def empty(cls) -> "Stream[TSource]":
+        return cls(())
+
+    def __add__(self, other: "Stream[TSource]") -> "Stream[TSource]":
+        return Stream(_Replay(chain, self._source, other))
+
+    @classmethod
+    def concat(cls, xs: Iterable["Stream[TSource]"]) -> "Stream[TSource]":
+        """mconcat :: [m] -> m; lazy in both the outer and the inner streams."""
+        return cls(_Replay(chain.from_iterable, xs))
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> "Stream[TResult]":
+        return Stream(_Replay(map, mapper, self._source))
+
+    # Applicative Section
+    # ===================
+
+    @classmethod
+    def pure(cls, value: typed_lambda[TSource, TResult]) -> "Stream[typed_lambda[TSource, TResult]]":
+        return cls((value,))
+
+    def apply(self, something: "Stream[TSource]") -> "Stream[TResult]":
+        """Apply every function to every value, functions outermost.
+
+        ``something`` is iterated once per function, so it should be
+        replayable. Multi-argument functions are curried: see fp_py.curry.
+        """
+        return Stream(_Replay(_apply, self._source, something))
+
+    # Monad Section
+    # =============
+
+    @classmethod
+    def unit(cls, value: TSource) -> "Stream[TSource]":
+        return cls((value,))
+
+    def bind(self, fn: typed_lambda[TSource, Iterable[TResult]]) -> "Stream[TResult]":
+        """Lazy flatMap: ``fn`` may return a Stream or any iterable.
+
+        Only one inner stream is open at a time.
+        """
+        return Stream(_Replay(lambda: chain.from_iterable(map(fn, self._source))))
+
+    # Operators Section
+    # =================
+
+    def filter(self, predicate: typed_lambda[TSource, bool]) -> "Stream[TSource]":
+        return Stream(_Replay(filter, predicate, self._source))
+
+    def take(self, n: int) -> "Stream[TSource]":
+        return Stream(_Replay(islice, self._source, n))
+
+    def drop(self, n: int) -> "Stream[TSource]":
+        return Stream(_Replay(islice, self._source, n, None))
+
+    def take_while(self, predicate: typed_lambda[TSource, bool]) -> "Stream[TSource]":
+        return Stream(_Replay(takewhile, predicate, self._source))
+
+    def drop_while(self, predicate: typed_lambda[TSource, bool]) -> "Stream[TSource]":
+        return Stream(_Replay(dropwhile, predicate, self._source))
+
+    def chunk(self, size: int) -> "Stream[tuple[TSource, ...]]":
+        """Group items into tuples of ``size``; the last one may be shorter."""
+        if size < 1:
+            raise ValueError(f"chunk size must be at least 1, got {size}")
+        return Stream(_Replay(batched, self._source, size))
+
+    # Conversion Section
+    # ==================
+
+    @classmethod
+    def from_maybe(cls, m: Maybe[TSource]) -> "Stream[TSource]":
+        """Just x is the one-item stream of x, Nothing is empty."""
+        return cls((m._value,)) if m.is_just() else cls(())
+
+    @classmethod
+    def from_either(cls, e: Either[Any, TSource]) -> "Stream[TSource]":
+        """Right x is the one-item stream of x, Left is empty."""
+        return cls((e._value,)) if e.is_right() else cls(())
+
+    @classmethod
+    def collect_justs(cls, xs: Iterable[Maybe[TSource]]) -> "Stream[TSource]":
+        """The values of the Justs in ``xs``, skipping every Nothing."""
+        return cls(_Replay(lambda: (m._value for m in xs if m.is_just())))
+
+    @classmethod
+    def collect_rights(cls, xs: Iterable[Either[Any, TSource]]) -> "Stream[TSource]":
+        """The values of the Rights in ``xs``, skipping every Left."""
+        return cls(_Replay(lambda: (e._value for e in xs if e.is_right())))
+
+    @classmethod
+    def collect_lefts(cls, xs: Iterable[Either[Any, TSource]]) -> "Stream[Any]":
+        """The errors of the Lefts in ``xs``, skipping every Right."""
+        return cls(_Replay(lambda: (e._value for e in xs if e.is_left())))
+
+    def head(self) -> Maybe[TSource]:
+        """Just the first item, or Nothing for an empty stream."""
+        for x in self._source:
+            return Just(x)
+        return Nothing()
+
+    def to_list(self) -> list[TSource]:
+        return list(self._source)
+
+    def __str__(self) -> str:
+        # Derived streams are not shown: that would mean running them.
+        return "Stream(...)" if isinstance(self._source, _Replay) else f"Stream({self._source!r})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad, Monoid
+    from .types.checks import check_protocols
+
+    check_protocols(Stream, Monoid, Functor, Applicative, Monad)
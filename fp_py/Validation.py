@@ -0,0 +1,317 @@
+from abc import abstractmethod
+from functools import partial, reduce
+
+from typing import Callable, Any, Iterable, Iterator, TypeVar, cast
+
+from fp_py.types.lambda_types import typed_lambda
+from fp_py.types.checks import CHECK_PROTOCOLS
+from fp_py.curry import apply_curried
+from fp_py.Either import Either, Left, Right
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+TError = TypeVar("TError")
+
+
+class ErrorRope[TError]:
+    """Immutable sequence of errors with O(1) concatenation.
+
+    A rope is either a leaf holding a tuple of errors or a node joining
+    other ropes. Joining never copies, and iteration walks the tree
+    with an explicit stack, so collecting n errors through any sequence
+    of joins costs O(n) overall.
+    """
+
+    __slots__ = ("_items", "_parts", "_size")
+
+    def __init__(self, items: Iterable[TError] = ()) -> None:
+        self._items = tuple(items)
+        self._parts = ()
+        self._size = len(self._items)
+
+    @classmethod
+    def join(cls, ropes: Iterable["ErrorRope[TError]"]) -> "ErrorRope[TError]":
+        parts = tuple(r for r in ropes if r._size)
+        if len(parts) == 1:
+            return parts[0]
+        node = object.__new__(cls)
+        node._items = None
+        node._parts = parts
+        node._size = sum(r._size for r in parts)
+        return node
+
+    def __add__(self, other: "ErrorRope[TError]") -> "ErrorRope[TError]":
+        return ErrorRope.join((self, other))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[TError]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._items is not None:
+                yield from node._items
+            else:
+                stack.extend(reversed(node._parts))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ErrorRope):
+            return self._size == other._size and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ErrorRope({list(self)!r})"
+
+
+class Validation[TError, TSource]:
+    """A value that passed validation, or every error found.
+
+    Unlike Either, combining validations with ``apply``, ``+``,
+    ``map_n`` or ``traverse`` keeps going after a Failure and collects
+    the errors of all of them. ``bind`` still stops at the first
+    Failure, since the next step needs the value.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __add__(self, other: "Validation[TError, TSource]") -> "Validation[TError, TSource]":
+        ...
+
+    @abstractmethod
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> "Validation[TError, TResult]":
+        ...
+
+    @classmethod
+    def pure(cls, value: typed_lambda[TSource, TResult]) -> "Validation[TError, typed_lambda[TSource, TResult]]":
+        return Success(value)
+
+    @abstractmethod
+    def apply(self, something: "Validation[TError, TSource]") -> "Validation[TError, TResult]":
+        ...
+
+    @classmethod
+    def unit(cls, value: TSource) -> "Validation[TError, TSource]":
+        return Success(value)
+
+    @abstractmethod
+    def bind(self, func: typed_lambda[TSource, Any]) -> "Validation[TError, TResult]":
+        ...
+
+    # Utilities Section
+    # =================
+
+    @abstractmethod
+    def is_success(self) -> bool:
+        ...
+
+    @abstractmethod
+    def is_failure(self) -> bool:
+        ...
+
+    @abstractmethod
+    def match(self, failure: typed_lambda[list[TError], TResult], success: typed_lambda[TSource, TResult]) -> TResult:
+        ...
+
+    @abstractmethod
+    def to_either(self) -> Either[list[TError], TSource]:
+        ...
+
+    @classmethod
+    def from_either(cls, e: Either[TError, TSource]) -> "Validation[TError, TSource]":
+        """Right x becomes Success x, Left e becomes a Failure with the one error e."""
+        return Failure(e.unwrap()) if e.is_left() else Success(e.unwrap())
+
+    @classmethod
+    def map_n(cls, fn: Callable[..., TResult], *vs: "Validation[TError, Any]") -> "Validation[TError, TResult]":
+        """Call ``fn`` with the values of all the arguments, or collect all their errors."""
+        failures = [v._errors for v in vs if isinstance(v, Failure)]
+        if failures:
+            return Failure._of(ErrorRope.join(failures))
+        return Success(fn(*(v._value for v in vs)))
+
+    @classmethod
+    def traverse(cls, fn: typed_lambda[TSource, "Validation[TError, TResult]"],
+                 xs: Iterable[TSource]) -> "Validation[TError, list[TResult]]":
+        """traverse :: (a -> Validation e b) -> [a] -> Validation e [b]
+
+        Validate every item; the result holds either all the values or
+        the errors of every item that failed, in input order.
+        """
+        values, failures = [], []
+        for x in xs:
+            v = fn(x)
+            if isinstance(v, Failure):
+                failures.append(v._errors)
+            elif not failures:
+                values.append(v._value)
+        if failures:
+            return Failure._of(ErrorRope.join(failures))
+        return Success(values)
+
+    @classmethod
+    def sequence(cls, xs: Iterable["Validation[TError, TSource]"]) -> "Validation[TError, list[TSource]]":
+        """sequence :: [Validation e a] -> Validation e [a]"""
+        return cls.traverse(lambda v: v, xs)
+
+    @classmethod
+    def concat(cls, xs: Iterable["Validation[TError, TSource]"]) -> "Validation[TError, TSource]":
+        """sconcat :: NonEmpty (Validation e a) -> Validation e a
+
+        Validation has no empty value, so ``xs`` must not be empty.
+        """
+        xs = iter(xs)
+        try:
+            first = next(xs)
+        except StopIteration:
+            raise ValueError("Validation.concat() needs at least one value") from None
+        return reduce(lambda a, b: a + b, xs, first)
+
+    @abstractmethod
+    def unwrap(self) -> TSource | list[TError]:
+        ...
+
+
+class Failure(Validation[TError, TSource]):
+    """A Validation holding one or more errors."""
+
+    __slots__ = ("_errors",)
+
+    def __init__(self, *errors: TError) -> None:
+        self._errors = ErrorRope(errors)
+
+    @classmethod
+    def _of(cls, errors: ErrorRope[TError]) -> "Failure[TError, TSource]":
+        failure = object.__new__(cls)
+        failure._errors = errors
+        return failure
+
+    @classmethod
+    def many(cls, errors: Iterable[TError]) -> "Failure[TError, TSource]":
+        return cls._of(ErrorRope(errors))
+
+    @property
+    def errors(self) -> list[TError]:
+        return list(self._errors)
+
+    # Monoid Section
+    # ==============
+
+    def __add__(self, other: Validation[TError, TSource]) -> Validation[TError, TSource]:
+        if isinstance(other, Failure):
+            return Failure._of(self._errors + other._errors)
+        return self
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> Validation[TError, TResult]:
+        return self
+
+    # Applicative Section
+    # ===================
+
+    def apply(self, something: Validation[TError, TSource]) -> Validation[TError, TResult]:
+        return self + something
+
+    # Monad Section
+    # =============
+
+    def bind(self, func: typed_lambda[TSource, Any]) -> Validation[TError, TResult]:
+        return self
+
+    # Utilities Section
+    # =================
+
+    def is_success(self) -> bool:
+        return False
+
+    def is_failure(self) -> bool:
+        return True
+
+    def match(self, failure: typed_lambda[list[TError], TResult], success: typed_lambda[TSource, TResult]) -> TResult:
+        return failure(self.errors)
+
+    def to_either(self) -> Either[list[TError], TSource]:
+        return Left(self.errors)
+
+    def unwrap(self) -> list[TError]:
+        return self.errors
+
+    def __str__(self) -> str:
+        return f"Failure {self.errors}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Success(Validation[TError, TSource]):
+    """A Validation holding a valid value."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: TSource) -> None:
+        self._value = value
+
+    # Monoid Section
+    # ==============
+
+    def __add__(self, other: Validation[TError, TSource]) -> Validation[TError, TSource]:
+        if isinstance(other, Failure):
+            return other
+        return Success(cast(Any, self._value) + other._value)
+
+    # Functor Section
+    # ===============
+
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> Validation[TError, TResult]:
+        return Success(mapper(self._value))
+
+    # Applicative Section
+    # ===================
+
+    def apply(self, something: Validation[TError, TSource]) -> Validation[TError, TResult]:
+        # Multi-argument functions are curried: see fp_py.curry.
+        return something.map(partial(apply_curried, self._value))
+
+    # Monad Section
+    # =============
+
+    def bind(self, func: typed_lambda[TSource, Any]) -> Validation[TError, TResult]:
+        """Success x >>= f = f x; a plain result is wrapped in Success."""
+        result = func(self._value)
+        return result if isinstance(result, Validation) else Success(result)
+
+    # Utilities Section
+    # =================
+
+    def is_success(self) -> bool:
+        return True
+
+    def is_failure(self) -> bool:
+        return False
+
+    def match(self, failure: typed_lambda[list[TError], TResult], success: typed_lambda[TSource, TResult]) -> TResult:
+        return success(self._value)
+
+    def to_either(self) -> Either[list[TError], TSource]:
+        return Right(self._value)
+
+    def unwrap(self) -> TSource:
+        return self._value
+
+    def __str__(self) -> str:
+        return f"Success {self._value}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+if CHECK_PROTOCOLS:
+    from .types import Applicative, Functor, Monad
+    from .types.checks import check_protocols
+
+    check_protocols(Validation, Functor, Applicative, Monad)
+    check_protocols(Success, Functor, Applicative, Monad)
+    check_protocols(Failure, Functor, Applicative, Monad)
@@ -0,0 +1,95 @@
+"""How ``contoled_map`` stores the exceptions it catches.
+
+Keeping the live exception in a Left also keeps its traceback, and with
+it every frame and local variable of the failed call, alive for as long
+as the Left exists. ``Either.capture_policy`` (or
+``Try.capture_policy``) selects a cheaper policy:
+
+* ``Capture.KEEP``: the exception as raised (default).
+* ``Capture.STRIP``: the exception with ``__traceback__`` cleared on it
+  and on its ``__cause__`` and ``__context__`` chains.
+* ``Capture.SUMMARY``: like STRIP, but a frame-free summary of the
+  traceback is kept and formatted on demand by ``format_traceback``.
+* ``Capture.MESSAGE``: only the exception type and message, as a
+  ``CapturedError``.
+"""
+from enum import Enum
+
+
+class Capture(Enum):
+    KEEP = "keep"
+    STRIP = "strip"
+    SUMMARY = "summary"
+    MESSAGE = "message"
+
+
+class CapturedError:
+    """Exception type and message, without the exception object."""
+
+    __slots__ = ("exc_type", "message")
+
+    def __init__(self, exc_type: type[BaseException], message: str) -> None:
+        self.exc_type = exc_type
+        self.message = message
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CapturedError) and \
+            (self.exc_type, self.message) == (other.exc_type, other.message)
+
+    def __hash__(self) -> int:
+        return hash((self.exc_type, self.message))
+
+    def __str__(self) -> str:
+        return f"{self.exc_type.__name__}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"CapturedError({self.exc_type.__name__}, {self.message!r})"
+
+
+def _strip(ex: BaseException) -> BaseException:
+    """Clear tracebacks on ``ex`` and every exception chained to it.
+
+    ``__cause__`` and ``__context__`` are both followed. A context hidden
+    by ``raise ... from ...`` (``__suppress_context__``) is never shown,
+    so it is dropped rather than kept alive.
+    """
+    seen = set()
+    pending = [ex]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        current.__traceback__ = None
+        if current.__suppress_context__:
+            current.__context__ = None
+        pending.append(current.__context__)
+        pending.append(current.__cause__)
+    return ex
+
+
+def capture(ex: BaseException, policy: Capture) -> object:
+    """Return what a Left should hold for ``ex`` under ``policy``."""
+    if policy is Capture.KEEP:
+        return ex
+    if policy is Capture.MESSAGE:
+        return CapturedError(type(ex), str(ex))
+    if policy is Capture.SUMMARY:
+        import traceback
+        # lookup_lines=False keeps file/line numbers only; source lines are
+        # read when the summary is formatted.
+        ex.__fp_traceback__ = traceback.StackSummary.extract(
+            traceback.walk_tb(ex.__traceback__), lookup_lines=False)
+    return _strip(ex)
+
+
+def format_traceback(ex: BaseException | CapturedError) -> str:
+    """Format whatever traceback information ``capture`` kept for ``ex``."""
+    import traceback
+    if isinstance(ex, CapturedError):
+        return f"{ex}\n"
+    summary = getattr(ex, "__fp_traceback__", None)
+    if summary is not None:
+        lines = ["Traceback (most recent call last):\n", *summary.format()]
+        return "".join(lines + traceback.format_exception_only(ex))
+    return "".join(traceback.format_exception(ex))
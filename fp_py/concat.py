@@ -0,0 +1,53 @@
+"""Linear-time concatenation of container payloads.
+
+Backs ``Maybe.concat``/``Either.concat``. Folding with pairwise ``+``
+copies the accumulated value on every step, which is quadratic for
+strings, lists and tuples, and builds a container per step.
+``strategy_for`` picks a way to add a whole list of payloads at once
+from their types; it returns None when there is no faster way than
+the pairwise fold.
+"""
+from itertools import chain, islice
+from typing import Any, Callable
+
+_NUMBERS = frozenset((int, float, complex, bool))
+
+
+def _join(values: list) -> Any:
+    return values[0][:0].join(values)
+
+
+def _chain(values: list) -> Any:
+    return type(values[0])(chain.from_iterable(values))
+
+
+def _sum(values: list) -> Any:
+    return sum(islice(values, 1, None), values[0])
+
+
+def _in_place(values: list) -> Any:
+    # Accumulate into a private copy so the first payload is left untouched.
+    total = type(values[0])(values[0])
+    for value in islice(values, 1, None):
+        total += value
+    return total
+
+
+_BY_TYPE: dict[type, Callable[[list], Any]] = {
+    str: _join,
+    bytes: _join,
+    list: _chain,
+    tuple: _chain,
+    bytearray: _in_place,
+}
+
+
+def strategy_for(values: list) -> Callable[[list], Any] | None:
+    """Return a function adding all of ``values`` left to right, or None."""
+    kind = type(values[0])
+    if kind in _NUMBERS:
+        return _sum if all(type(v) in _NUMBERS for v in values) else None
+    strategy = _BY_TYPE.get(kind)
+    if strategy is not None and all(type(v) is kind for v in values):
+        return strategy
+    return None
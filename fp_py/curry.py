@@ -0,0 +1,121 @@
+"""Currying for ``apply`` and n-ary lifting.
+
+``Just.pure(f).apply(a).apply(b)`` feeds ``f`` one argument at a time.
+``apply_curried`` decides from the arity of ``f`` whether an argument
+completes the call or only extends a ``Curried`` partial, so no call is
+attempted and retried, and a TypeError raised inside ``f`` propagates.
+
+Arity comes straight from the code object for plain functions and
+bound methods. Other callables (builtins, classes, partials, callable
+objects) go through ``inspect.signature`` once and the answer is cached
+per callable; when it has no answer, ``apply_curried`` falls back to
+calling and retrying as a partial.
+"""
+from functools import partial
+from types import FunctionType, MethodType
+from typing import Any, Callable, Iterable
+from weakref import WeakKeyDictionary
+
+_cache: "WeakKeyDictionary[Callable, int | None]" = WeakKeyDictionary()
+
+
+def _code_arity(fn: FunctionType) -> int:
+    return fn.__code__.co_argcount - len(fn.__defaults__ or ())
+
+
+def _signature_arity(fn: Callable) -> int | None:
+    import inspect
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return sum(1 for p in parameters if p.kind in positional and p.default is p.empty)
+
+
+def arity(fn: Callable) -> int | None:
+    """Number of positional arguments ``fn`` requires, or None if unknown."""
+    kind = type(fn)
+    if kind is FunctionType:
+        return _code_arity(fn)
+    if kind is MethodType and type(fn.__func__) is FunctionType:
+        return _code_arity(fn.__func__) - 1
+    if kind is Curried:
+        return fn._arity - len(fn._args)
+    try:
+        return _cache[fn]
+    except (KeyError, TypeError):
+        pass
+    n = _signature_arity(fn)
+    try:
+        _cache[fn] = n
+    except TypeError:
+        pass  # not weakly referenceable; recomputed on the next call
+    return n
+
+
+class Curried:
+    """``fn`` waiting for the rest of its positional arguments."""
+
+    __slots__ = ("_fn", "_arity", "_args")
+
+    def __init__(self, fn: Callable, arity: int, args: tuple = ()) -> None:
+        self._fn = fn
+        self._arity = arity
+        self._args = args
+
+    def __call__(self, *args: Any) -> Any:
+        args = self._args + args
+        if len(args) >= self._arity:
+            return self._fn(*args)
+        return Curried(self._fn, self._arity, args)
+
+    def __repr__(self) -> str:
+        return f"Curried({self._fn!r}, {self._arity}, {self._args!r})"
+
+
+def curry(fn: Callable) -> Callable:
+    """Return ``fn`` so that it can be called one argument at a time."""
+    n = arity(fn)
+    return Curried(fn, n) if n is not None and n > 1 else fn
+
+
+def apply_curried(fn: Callable, value: Any) -> Any:
+    """Feed one argument to ``fn``.
+
+    Calls ``fn`` when ``value`` is its last missing argument, otherwise
+    returns a ``Curried`` holding it. Callables of unknown arity (such as
+    ``max``) keep the old behaviour: they are called, and a TypeError
+    turns the call into a partial application instead.
+    """
+    if type(fn) is Curried:
+        return fn(value)
+    n = arity(fn)
+    if n is None:
+        try:
+            return fn(value)
+        except TypeError:
+            return partial(fn, value)
+    if n > 1:
+        return Curried(fn, n, (value,))
+    return fn(value)
+
+
+def map_n(fn: Callable, ms: Iterable[Any], failure: type) -> Any:
+    """Call ``fn`` with the values of ``ms``, or return the first failure.
+
+    ``failure`` is the short-circuiting variant (Nothing or Left). The
+    call goes through the first container's ``map``, so the usual None
+    and exception handling of that type applies.
+    """
+    first, *rest = ms
+    first = first.force()
+    if isinstance(first, failure):
+        return first
+    values = []
+    for m in rest:
+        m = m.force()
+        if isinstance(m, failure):
+            return m
+        values.append(m.unwrap())
+    return first.map(lambda value: fn(value, *values))
@@ -0,0 +1,46 @@
+"""Generator-based do-notation.
+
+A generator function decorated with ``Maybe.do``, ``Either.do`` or
+``Try.do`` yields containers and gets their values back; the first
+Nothing/Left ends the block and becomes its result. The returned value
+is wrapped in Just/Right (a container is returned as is):
+
+    @Maybe.do
+    def total(order_id):
+        order = yield find_order(order_id)
+        customer = yield find_customer(order.customer_id)
+        return order.amount * customer.discount
+
+Every earlier binding stays in scope without nesting lambdas. Deferred
+containers (``Maybe.lazy`` and friends) are forced when yielded. On a
+failure the generator is closed straight away, so its ``finally``
+blocks and context managers run before the result is returned.
+"""
+from functools import wraps
+from typing import Any, Callable, Generator
+
+
+def run(gen: Generator, failure: type, container: type, wrap: Callable[[Any], Any]) -> Any:
+    """Drive ``gen`` until it returns or yields a ``failure``."""
+    send = gen.send
+    value = None
+    try:
+        while True:
+            m = send(value)
+            if m._lazy:
+                m = m.force()
+            if isinstance(m, failure):
+                gen.close()
+                return m
+            value = m.unwrap()
+    except StopIteration as stop:
+        result = stop.value
+    return result if isinstance(result, container) else wrap(result)
+
+
+def do(fn: Callable[..., Generator], runner: Callable[[Generator], Any]) -> Callable[..., Any]:
+    """Wrap a generator function so that calling it runs ``runner`` over it."""
+    @wraps(fn)
+    def block(*args, **kwargs):
+        return runner(fn(*args, **kwargs))
+    return block
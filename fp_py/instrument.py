@@ -0,0 +1,197 @@
+"""Opt-in instrumentation of eager Maybe/Either chains.
+
+Inside ``with instrument() as stats:`` every ``map``/``bind`` on Just,
+Nothing, Right and Left, and every ``contoled_map``, reports a
+``StepEvent`` to the active sinks: which function ran, how long it
+took, and whether it produced a value, short-circuited (returned
+Nothing/Left) or raised. Steps skipped because the chain had already
+failed are reported too, so the first failing step is easy to find:
+
+    with instrument() as stats:
+        Try.unit(0).bind(parse).bind(divide).map(render)
+    print(stats.report())
+
+Instrumented methods are swapped into the classes when the first
+``instrument`` context is entered and the originals are put back when
+the last one exits, so nothing is paid outside of it. The swap is
+process-wide: chains running in other threads meanwhile are reported
+too. Pipelines, async containers and arrays are not instrumented.
+"""
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Iterator, NamedTuple
+
+from fp_py.Maybe import Just, Nothing
+from fp_py.Either import Either, Fail, Left, Right
+from fp_py.capture import CapturedError
+
+OK = "ok"
+SHORT_CIRCUIT = "short_circuit"
+ERROR = "error"
+SKIPPED = "skipped"
+
+
+class StepEvent(NamedTuple):
+    step: str
+    method: str
+    container: str
+    outcome: str
+    exc_type: type | None
+    elapsed_ns: int
+
+
+class StepStats:
+    """Running totals for one step."""
+
+    __slots__ = ("calls", "skipped", "short_circuits", "errors", "total_ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.skipped = 0
+        self.short_circuits = 0
+        self.errors: dict[str, int] = {}
+        self.total_ns = 0
+
+    def __repr__(self) -> str:
+        return (f"StepStats(calls={self.calls}, skipped={self.skipped}, "
+                f"short_circuits={self.short_circuits}, errors={self.errors}, total_ns={self.total_ns})")
+
+
+class Aggregate:
+    """In-memory sink that sums events per step.
+
+    Updates are not locked; give each thread its own Aggregate if exact
+    counts matter under concurrency.
+    """
+
+    def __init__(self) -> None:
+        self.steps: dict[str, StepStats] = {}
+
+    def __call__(self, event: StepEvent) -> None:
+        stats = self.steps.get(event.step)
+        if stats is None:
+            stats = self.steps[event.step] = StepStats()
+        if event.outcome == SKIPPED:
+            stats.skipped += 1
+            return
+        stats.calls += 1
+        stats.total_ns += event.elapsed_ns
+        if event.outcome == SHORT_CIRCUIT:
+            stats.short_circuits += 1
+        elif event.outcome == ERROR:
+            name = event.exc_type.__name__
+            stats.errors[name] = stats.errors.get(name, 0) + 1
+
+    def report(self) -> str:
+        lines = [f"{'step':<40}{'calls':>8}{'skipped':>9}{'failed':>8}{'total ms':>10}  errors"]
+        for step, s in sorted(self.steps.items(), key=lambda item: -item[1].total_ns):
+            errors = ", ".join(f"{name} x{n}" for name, n in s.errors.items())
+            failed = s.short_circuits + sum(s.errors.values())
+            lines.append(f"{step:<40}{s.calls:>8}{s.skipped:>9}{failed:>8}{s.total_ns / 1e6:>10.3f}  {errors}")
+        return "\n".join(lines)
+
+
+_sinks: list[Callable[[StepEvent], None]] = []
+_originals: dict[tuple[type, str], Callable] = {}
+_lock = threading.Lock()
+
+
+def _emit(event: StepEvent) -> None:
+    for sink in _sinks:
+        sink(event)
+
+
+def _step_name(fn) -> str:
+    name = getattr(fn, "__qualname__", None) or repr(fn)
+    code = getattr(fn, "__code__", None)
+    if code is not None and name.endswith("<lambda>"):
+        return f"{name}@{code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno}"
+    return name
+
+
+def _error_type(payload) -> type | None:
+    if isinstance(payload, BaseException):
+        return type(payload)
+    if isinstance(payload, CapturedError):
+        return payload.exc_type
+    return None
+
+
+def _just_method(name: str, original: Callable) -> Callable:
+    def instrumented(self, fn):
+        began = perf_counter_ns()
+        try:
+            result = original(self, fn)
+        except Exception as ex:
+            _emit(StepEvent(_step_name(fn), name, type(self).__name__, ERROR, type(ex), perf_counter_ns() - began))
+            raise
+        outcome = SHORT_CIRCUIT if isinstance(result, Nothing) else OK
+        _emit(StepEvent(_step_name(fn), name, type(self).__name__, outcome, None, perf_counter_ns() - began))
+        return result
+    return instrumented
+
+
+def _contoled_map(original: Callable, callers: set) -> Callable:
+    def instrumented(self, mapper):
+        # Report map/bind when called through them, contoled_map otherwise.
+        code = sys._getframe(1).f_code
+        method = code.co_name if code in callers else "contoled_map"
+        began = perf_counter_ns()
+        result = original(self, mapper)
+        elapsed = perf_counter_ns() - began
+        outcome, exc_type = OK, None
+        if isinstance(result, Left):
+            exc_type = None if isinstance(result, Fail) else _error_type(result.unwrap())
+            outcome = SHORT_CIRCUIT if exc_type is None else ERROR
+        _emit(StepEvent(_step_name(mapper), method, type(self).__name__, outcome, exc_type, elapsed))
+        return result
+    return instrumented
+
+
+def _skipped(name: str, original: Callable) -> Callable:
+    def instrumented(self, fn):
+        _emit(StepEvent(_step_name(fn), name, type(self).__name__, SKIPPED, None, 0))
+        return original(self, fn)
+    return instrumented
+
+
+def _install() -> None:
+    patches = {}
+    for name in ("map", "bind"):
+        patches[Just, name] = _just_method(name, Just.__dict__[name])
+        patches[Nothing, name] = _skipped(name, Nothing.__dict__[name])
+        patches[Left, name] = _skipped(name, Left.__dict__[name])
+    callers = {Right.__dict__["map"].__code__, Right.__dict__["bind"].__code__}
+    patches[Either, "contoled_map"] = _contoled_map(Either.__dict__["contoled_map"], callers)
+    for (cls, name), method in patches.items():
+        _originals[cls, name] = cls.__dict__[name]
+        setattr(cls, name, method)
+
+
+def _uninstall() -> None:
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+
+
+@contextmanager
+def instrument(sink: Callable[[StepEvent], None] | None = None) -> Iterator[Callable[[StepEvent], None]]:
+    """Report chain steps to ``sink`` (a new Aggregate by default) while active.
+
+    ``sink`` is any callable taking a StepEvent. Contexts may nest or
+    overlap; each event goes to every active sink.
+    """
+    sink = Aggregate() if sink is None else sink
+    with _lock:
+        if not _sinks:
+            _install()
+        _sinks.append(sink)
+    try:
+        yield sink
+    finally:
+        with _lock:
+            _sinks.remove(sink)
+            if not _sinks:
+                _uninstall()
@@ -0,0 +1,216 @@
+"""Deferred Maybe and Either values.
+
+``Maybe.lazy(thunk)``, ``Either.lazy(thunk)`` and ``Try.lazy(thunk)``
+build a value whose payload is computed by ``thunk`` on first use, at
+most once. ``map``, ``bind``, ``apply`` and ``+`` do not run anything:
+they return another deferred value, linked to this one. Inspecting a
+value (``match``, ``unwrap``, ``is_just``/``is_right``, ``==``,
+``force``) runs the thunk and every pending step on the way, each one
+once, under its own lock, so several threads can force a shared value
+safely. Nothing runs for a chain that is never inspected.
+
+Forcing walks the chain with a loop rather than recursion, so long
+deferred chains are fine.
+"""
+from abc import abstractmethod
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+from fp_py.capture import Capture, capture
+from fp_py.Either import Either, Left, Right
+from fp_py.Maybe import Just, Maybe
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+
+
+class _Deferred:
+    """A node in a chain of deferred steps.
+
+    A root node holds a thunk taking no arguments; any other node holds
+    a step applied to its parent's forced value. Once forced, a node
+    keeps its result and drops the step and the parent.
+    """
+
+    __slots__ = ("_parent", "_step", "_result", "_lock")
+
+    _lazy = True
+
+    def __init__(self, step: Callable, parent: "_Deferred | None" = None) -> None:
+        self._parent = parent
+        self._step = step
+        self._result = None
+        self._lock = Lock()
+
+    @abstractmethod
+    def _normalize(self, result: Any) -> Any:
+        ...
+
+    def _run(self, step: Callable, parent: "_Deferred | None", base: Any) -> Any:
+        return self._normalize(step() if parent is None else step(base))
+
+    def force(self):
+        """Compute the value (once) and return it as a plain Maybe/Either."""
+        if self._step is None:
+            return self._result
+        path = []
+        node = self
+        while node is not None and node._step is not None:
+            path.append(node)
+            node = node._parent
+        base = node._result if node is not None else None
+        for node in reversed(path):
+            with node._lock:
+                step = node._step
+                if step is not None:
+                    node._result = node._run(step, node._parent, base)
+                    node._step = None
+                    node._parent = None
+            base = node._result
+        return base
+
+    def _then(self, step: Callable):
+        return type(self)(step, self)
+
+    def is_forced(self) -> bool:
+        return self._step is None
+
+    @property
+    def _value(self):
+        return self.force()._value
+
+    def unwrap(self):
+        return self.force().unwrap()
+
+    def __bool__(self) -> bool:
+        return bool(self.force())
+
+    def __eq__(self, other) -> bool:
+        return self.force() == other
+
+    def __hash__(self) -> int:
+        return hash(self.force())
+
+    def __reduce__(self):
+        return self.force().__reduce__()
+
+
+class LazyMaybe(_Deferred, Maybe[TSource]):
+    """A Maybe computed on first use; see ``Maybe.lazy``.
+
+    The thunk may return a Maybe or a plain value, which becomes a Just
+    (or Nothing for None), as with ``Maybe.unit``. An exception raised
+    by the thunk or a step propagates and leaves the value pending.
+    """
+
+    __slots__ = ()
+
+    def _normalize(self, result: Any) -> Maybe[TSource]:
+        if isinstance(result, Maybe):
+            return result.force() if result._lazy else result
+        return Just.unit(result)
+
+    def __add__(self, other: Maybe[TSource]) -> Maybe[TSource]:
+        return self._then(lambda m: m + other)
+
+    def map(self, mapper: Callable[[TSource], TResult]) -> Maybe[TResult]:
+        return self._then(lambda m: m.map(mapper))
+
+    @classmethod
+    def pure(cls, value: Callable[[TSource], TResult]) -> Maybe[Callable[[TSource], TResult]]:
+        return Just.pure(value)
+
+    def apply(self, something: Maybe[TSource]) -> Maybe[TResult]:
+        return self._then(lambda m: m.apply(something))
+
+    @classmethod
+    def unit(cls, value: TSource) -> Maybe[TSource]:
+        return Just.unit(value)
+
+    def bind(self, func: Callable[[TSource], Any]) -> Maybe[TResult]:
+        return self._then(lambda m: m.bind(func))
+
+    def is_just(self) -> bool:
+        return self.force().is_just()
+
+    def is_nothing(self) -> bool:
+        return self.force().is_nothing()
+
+    def match(self, nothing: Callable[[], TResult], just: Callable[[TSource], TResult]) -> TResult:
+        return self.force().match(nothing, just)
+
+    def __str__(self) -> str:
+        return str(self._result) if self._step is None else "Maybe.lazy(<pending>)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class LazyEither(_Deferred, Either[Any, TSource]):
+    """An Either computed on first use; see ``Either.lazy``.
+
+    The thunk may return an Either or a plain value. A plain value is
+    wrapped like a ``map`` result: None becomes ``Left(None)``, anything
+    else the Right class the value was created from (Right or Try). An
+    exception raised by the thunk becomes a Left under that class's
+    capture policy; steps are ``map``/``bind`` and catch as usual.
+    """
+
+    __slots__ = ("_wrap",)
+
+    def __init__(self, step: Callable, parent: "LazyEither | None" = None,
+                 wrap: type = Right) -> None:
+        super().__init__(step, parent)
+        self._wrap = wrap if parent is None else parent._wrap
+
+    def _run(self, step: Callable, parent: "_Deferred | None", base: Any) -> Any:
+        if parent is not None:
+            return self._normalize(step(base))
+        try:
+            result = step()
+        except Exception as ex:
+            policy = self._wrap.capture_policy
+            return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+        return self._normalize(result)
+
+    def _normalize(self, result: Any) -> Either[Any, TSource]:
+        if isinstance(result, Either):
+            return result.force() if result._lazy else result
+        if result is None:
+            return Left(result)
+        return self._wrap(result)
+
+    def __add__(self, other: Either[Any, TSource]) -> Either[Any, TSource]:
+        return self._then(lambda e: e + other)
+
+    def map(self, mapper: Callable[[TSource], TResult]) -> Either[Any, TResult]:
+        return self._then(lambda e: e.map(mapper))
+
+    @classmethod
+    def pure(cls, value: Callable[[TSource], TResult]) -> Either[Any, Callable[[TSource], TResult]]:
+        return Right(value)
+
+    def apply(self, something: Either[Any, TSource]) -> Either[Any, TResult]:
+        return self._then(lambda e: e.apply(something))
+
+    @classmethod
+    def unit(cls, value: TSource) -> Either[Any, TSource]:
+        return Right(value)
+
+    def bind(self, func: Callable[[TSource], Any]) -> Either[Any, TResult]:
+        return self._then(lambda e: e.bind(func))
+
+    def is_left(self) -> bool:
+        return self.force().is_left()
+
+    def is_right(self) -> bool:
+        return self.force().is_right()
+
+    def match(self, left: Callable[[Any], TResult], right: Callable[[TSource], TResult]) -> TResult:
+        return self.force().match(left, right)
+
+    def __str__(self) -> str:
+        return str(self._result) if self._step is None else f"{self._wrap.__name__}.lazy(<pending>)"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -0,0 +1,152 @@
+"""Memoization for functions that return a Maybe or an Either.
+
+``memoize_monadic`` caches the successful results (Just/Right) of a
+function such as ``x -> Maybe[y]`` or ``x -> Try[y]``; failures
+(Nothing, Left or None) are retried on the next call unless
+``cache_failures`` is set. The decorated function is a drop-in
+replacement, so it can be passed straight to ``bind``:
+
+    @memoize_monadic(maxsize=1024, ttl=60)
+    def lookup_rate(currency): ...
+
+    Try.unit("EUR").bind(lookup_rate)
+"""
+import time
+from collections import OrderedDict
+from functools import update_wrapper
+from threading import RLock
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from fp_py.Maybe import Nothing
+from fp_py.Either import Left
+
+TResult = TypeVar("TResult")
+
+_MISSING = object()
+_KWARGS = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+def _failed(result: Any) -> bool:
+    return result is None or isinstance(result, (Nothing, Left))
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    if kwargs:
+        return args + (_KWARGS,) + tuple(kwargs.items())
+    return args
+
+
+def memoize_monadic(fn: Callable[..., TResult] | None = None, /, *, maxsize: int | None = 128,
+                    ttl: float | None = None, cache_failures: bool = False,
+                    failure_ttl: float | None = None, thread_safe: bool = False,
+                    key: Callable[..., Any] | None = None,
+                    clock: Callable[[], float] = time.monotonic) -> Callable[..., TResult]:
+    """Cache the results of ``fn`` by argument.
+
+    ``maxsize`` bounds the cache, evicting the least recently used entry
+    (None means unbounded). Entries older than ``ttl`` seconds are
+    dropped on lookup. Failures are only cached with ``cache_failures``,
+    for ``failure_ttl`` seconds if given, otherwise for ``ttl``. A
+    deferred result (``Maybe.lazy``/``Either.lazy``) is cached without
+    being forced and judged on the first lookup after it has been.
+    ``key`` builds the cache key from the call arguments; by default the
+    arguments must be hashable. With ``thread_safe`` the cache is
+    guarded by a lock; ``fn`` itself runs outside it, so concurrent
+    misses on one key may each call ``fn``.
+
+    The wrapper has ``cache_info()`` returning hits, misses, evictions
+    (including expired entries) and sizes, and ``cache_clear()``.
+    """
+    if fn is None:
+        return lambda f: memoize_monadic(f, maxsize=maxsize, ttl=ttl, cache_failures=cache_failures,
+                                         failure_ttl=failure_ttl, thread_safe=thread_safe,
+                                         key=key, clock=clock)
+
+    cache: OrderedDict = OrderedDict()
+    stats = [0, 0, 0]  # hits, misses, evictions
+    lock = RLock() if thread_safe else None
+    make_key = _make_key if key is None else lambda args, kwargs: key(*args, **kwargs)
+
+    timed = ttl is not None or failure_ttl is not None
+
+    def expiry(stored, failed: bool):
+        lifetime = failure_ttl if failed and failure_ttl is not None else ttl
+        return None if lifetime is None else stored + lifetime
+
+    def lookup(k):
+        entry = cache.get(k, _MISSING)
+        if entry is not _MISSING:
+            result, expires, deferred, stored = entry
+            live = True
+            if deferred and result.is_forced():
+                # A deferred result has been forced since it was stored.
+                failed = _failed(result.force())
+                live = cache_failures or not failed
+                expires = expiry(stored, failed)
+                cache[k] = (result, expires, False, stored)
+            if live and (expires is None or clock() < expires):
+                if maxsize is not None:
+                    cache.move_to_end(k)
+                stats[0] += 1
+                return result
+            del cache[k]
+            stats[2] += 1
+        stats[1] += 1
+        return _MISSING
+
+    def store(k, result) -> None:
+        now = clock() if timed else None
+        if getattr(result, "_lazy", False) and not result.is_forced():
+            # Storing must not run the thunk: the value is judged on a
+            # later lookup, once something has forced it.
+            cache[k] = (result, expiry(now, False), True, now)
+        else:
+            failed = _failed(result.force() if getattr(result, "_lazy", False) else result)
+            if failed and not cache_failures:
+                return
+            cache[k] = (result, expiry(now, failed), False, now)
+        if maxsize is not None:
+            cache.move_to_end(k)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+                stats[2] += 1
+
+    def wrapper(*args, **kwargs):
+        k = make_key(args, kwargs)
+        if lock is None:
+            result = lookup(k)
+            if result is _MISSING:
+                result = fn(*args, **kwargs)
+                store(k, result)
+            return result
+        with lock:
+            result = lookup(k)
+        if result is _MISSING:
+            result = fn(*args, **kwargs)
+            with lock:
+                store(k, result)
+        return result
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(stats[0], stats[1], stats[2], maxsize, len(cache))
+
+    def cache_clear() -> None:
+        if lock is None:
+            cache.clear()
+            stats[:] = [0, 0, 0]
+            return
+        with lock:
+            cache.clear()
+            stats[:] = [0, 0, 0]
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return update_wrapper(wrapper, fn)
@@ -0,0 +1,264 @@
+"""Run Either/Try chains over many inputs on a thread or process pool.
+
+A *chain* is anything that turns one raw input into an Either: an
+``Either.pipeline()``, a sequence of functions bound in order as with
+``Try.unit(x).bind(f).bind(g)``, or a plain callable. Inputs are split
+into chunks and every chunk runs its whole chain inside one worker, so
+only the chunk and its results cross the pool boundary.
+
+For a process pool the chain must be picklable: build pipelines from
+module-level functions rather than lambdas.
+
+``fold_parallel`` reduces many Semigroup/Monoid values (``Just``
+counters, ``Right`` lists, ...) with ``+`` the same way: chunks are
+folded in the pool and the partial results are combined as a balanced
+tree.
+"""
+import operator
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import reduce
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+from fp_py.Either import Either, Left, Right
+from fp_py.pipeline import EitherPipeline
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+
+# Items run in-process to estimate the per-item cost when tuning chunks.
+PROBE_SIZE = 16
+# Aim for chunks that keep a worker busy for about this long.
+TARGET_CHUNK_SECONDS = 0.05
+MAX_CHUNK_SIZE = 65536
+
+
+class RemoteError(Exception):
+    """Stand-in for an exception that could not be pickled back from a worker."""
+
+
+def _as_chain(chain: EitherPipeline | Sequence[Callable] | Callable[[Any], Either]) -> Callable[[Any], Either]:
+    if callable(chain):
+        return chain
+    pipeline = Either.pipeline()
+    for fn in chain:
+        pipeline = pipeline.bind(fn)
+    return pipeline
+
+
+def _portable(result: Either) -> Either:
+    if isinstance(result, Left) and isinstance(result.unwrap(), BaseException):
+        try:
+            pickle.dumps(result.unwrap())
+        except Exception:
+            error = result.unwrap()
+            return Left(RemoteError(f"{type(error).__name__}: {error}"))
+    return result
+
+
+def _run_chunk(chain: Callable[[Any], Either], chunk: list, portable: bool) -> list[Either]:
+    results = [chain(x) for x in chunk]
+    if portable:
+        results = [_portable(r) for r in results]
+    return results
+
+
+def _tune(chain: Callable[[Any], Either], head: list, workers: int, total: int | None) -> tuple[int, list[Either]]:
+    """Pick a chunk size from the time taken to run ``head`` serially."""
+    began = time.perf_counter()
+    results = [chain(x) for x in head]
+    per_item = (time.perf_counter() - began) / max(len(head), 1)
+    size = int(TARGET_CHUNK_SECONDS / per_item) if per_item > 0 else MAX_CHUNK_SIZE
+    if total is not None:
+        # Leave every worker a few chunks so stragglers even out.
+        size = min(size, -(-(total - len(head)) // (workers * 4)))
+    return max(1, min(size, MAX_CHUNK_SIZE)), results
+
+
+def _pool(executor: str | Executor, workers: int) -> tuple[Executor, bool]:
+    """Return the executor to use and whether it should be shut down after."""
+    if isinstance(executor, Executor):
+        return executor, False
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=workers), True
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers), True
+    raise ValueError(f"Unknown executor {executor!r}, expected 'process', 'thread' or an Executor")
+
+
+def map_parallel(chain: EitherPipeline | Sequence[Callable] | Callable[[Any], Either], xs: Iterable[TSource],
+                 executor: str | Executor = "process", max_workers: int | None = None,
+                 chunk_size: int | None = None, ordered: bool = True,
+                 max_in_flight: int | None = None) -> Iterator[Either]:
+    """Yield ``chain(x)`` for every x, computed on a pool.
+
+    ``executor`` is ``"process"``, ``"thread"`` or an existing Executor,
+    which is left running afterwards. At most ``max_in_flight`` chunks
+    (twice the worker count by default) are submitted at a time, so the
+    input is read lazily. With ``ordered=False`` chunks are yielded as
+    they finish. When ``chunk_size`` is None it is tuned from a short
+    in-process probe of the first items.
+    """
+    chain = _as_chain(chain)
+    total = len(xs) if hasattr(xs, "__len__") else None
+    items = iter(xs)
+    workers = max_workers or os.cpu_count() or 1
+    pool, owned = _pool(executor, workers)
+    portable = isinstance(pool, ProcessPoolExecutor)
+    window = max_in_flight or 2 * workers
+    in_flight: deque[Future] | set[Future] = deque() if ordered else set()
+
+    def drain() -> list[Either]:
+        if ordered:
+            return in_flight.popleft().result()
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        results = []
+        for future in done:
+            in_flight.remove(future)
+            results.extend(future.result())
+        return results
+
+    try:
+        if chunk_size is None:
+            chunk_size, probed = _tune(chain, list(islice(items, PROBE_SIZE)), workers, total)
+            yield from probed
+        for chunk in iter(lambda: list(islice(items, chunk_size)), []):
+            while len(in_flight) >= window:
+                yield from drain()
+            future = pool.submit(_run_chunk, chain, chunk, portable)
+            if ordered:
+                in_flight.append(future)
+            else:
+                in_flight.add(future)
+        while in_flight:
+            yield from drain()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def traverse_parallel(chain: EitherPipeline | Sequence[Callable] | Callable[[Any], Either], xs: Iterable[TSource],
+                      **options) -> Either[Any, list[TResult]]:
+    """Parallel ``Either.traverse``: a Right list, or the first Left by input order.
+
+    Chunks not yet started are cancelled as soon as a Left is seen.
+    Takes the same keyword options as ``map_parallel`` except ``ordered``.
+    """
+    values = []
+    results = map_parallel(chain, xs, ordered=True, **options)
+    try:
+        for result in results:
+            if isinstance(result, Left):
+                return result
+            values.append(result.unwrap())
+    finally:
+        results.close()
+    return Right(values)
+
+
+_MISSING = object()
+
+
+def _fold_chunk(chunk: list) -> Any:
+    # Maybe/Either concat is linear for common payloads and skips Nothing.
+    concat = getattr(type(chunk[0]), "concat", None)
+    return concat(chunk) if concat is not None else reduce(operator.add, chunk)
+
+
+class _Tree:
+    """Balanced ``+`` of partial results fed left to right.
+
+    Works like a binary counter: ``levels[k]`` holds the sum of 2**k
+    consecutive partials, so each result takes part in at most log2(n)
+    combinations and the tree depth stays logarithmic.
+    """
+
+    __slots__ = ("levels",)
+
+    def __init__(self) -> None:
+        self.levels: list = []
+
+    def push(self, value) -> None:
+        for k, older in enumerate(self.levels):
+            if older is _MISSING:
+                self.levels[k] = value
+                return
+            value = older + value
+            self.levels[k] = _MISSING
+        self.levels.append(value)
+
+    def total(self):
+        result = _MISSING
+        for older in self.levels:
+            if older is not _MISSING:
+                result = older if result is _MISSING else older + result
+        return result
+
+
+def fold_parallel(xs: Iterable[Any], workers: int | None = None, executor: str | Executor = "process",
+                  chunk_size: int | None = None, commutative: bool = False, empty: Any = _MISSING,
+                  max_in_flight: int | None = None) -> Any:
+    """Reduce ``xs`` with ``+`` on a pool, as a balanced tree.
+
+    ``xs`` holds Semigroup values such as ``Just(Counter(...))``; ``+``
+    must be associative. Chunks of ``chunk_size`` items (by default
+    about four per worker when ``xs`` has a length, else 4096) are
+    folded in the workers, and their results are combined in the
+    calling process as they arrive, in a tree of logarithmic depth.
+    Input order is kept unless ``commutative`` is set, in which case
+    results are combined in whatever order chunks finish.
+
+    Nothing stays the identity of ``Maybe.__add__``; an empty ``xs``
+    returns ``empty`` (for example ``Maybe.empty()``) or raises
+    ValueError when none is given. ``executor`` and ``max_in_flight``
+    are as for ``map_parallel``; with a process pool the values must
+    be picklable.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        total = len(xs) if hasattr(xs, "__len__") else None
+        chunk_size = max(1, -(-total // (workers * 4))) if total else 4096
+    items = iter(xs)
+    pool, owned = _pool(executor, workers)
+    window = max_in_flight or 2 * workers
+    in_flight: deque[Future] | set[Future] = set() if commutative else deque()
+    tree = _Tree()
+
+    def drain() -> None:
+        if not commutative:
+            tree.push(in_flight.popleft().result())
+            return
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            in_flight.remove(future)
+            tree.push(future.result())
+
+    try:
+        for chunk in iter(lambda: list(islice(items, chunk_size)), []):
+            while len(in_flight) >= window:
+                drain()
+            future = pool.submit(_fold_chunk, chunk)
+            if commutative:
+                in_flight.add(future)
+            else:
+                in_flight.append(future)
+        while in_flight:
+            drain()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    result = tree.total()
+    if result is _MISSING:
+        if empty is _MISSING:
+            raise ValueError("fold_parallel() of an empty iterable with no empty value")
+        return empty
+    return result
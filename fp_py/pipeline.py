@@ -0,0 +1,157 @@
+"""Lazy, fused pipelines for Maybe and Either chains.
+
+A pipeline records ``map``/``bind``/``filter`` steps without running
+them. Calling it (or the callable returned by ``compile``) runs the
+whole chain over a raw input value in a single frame and only wraps the
+final result:
+
+>>> plan = Maybe.pipeline().map(lambda x: x + 1).filter(lambda x: x > 2)
+>>> plan(2)
+Just 3
+>>> plan(1)
+Nothing
+
+Results follow the eager ``Just.unit(x).map(...)`` and
+``Right.unit(x).bind(...)`` semantics, including ``None`` turning into
+``Nothing``/``Left(None)`` and exceptions turning into ``Left``.
+"""
+from typing import Callable, TypeVar
+
+from fp_py.types.lambda_types import typed_lambda
+from fp_py.Maybe import Maybe, Just, Nothing
+from fp_py.Either import Either, Left, Right, Fail
+from fp_py.capture import Capture, capture
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+TError = TypeVar("TError")
+
+# Step kinds. map and bind behave the same on Just/Right, so they share one.
+_MAP = 0
+_FILTER = 1
+
+
+class _Pipeline[TSource, TResult]:
+    """Immutable list of recorded steps.
+
+    Every builder method returns a new pipeline, so a common prefix can
+    be shared by several plans.
+    """
+
+    __slots__ = ("_steps", "_compiled")
+
+    def __init__(self, steps: tuple = ()) -> None:
+        self._steps = steps
+        self._compiled = None
+
+    def _options(self) -> tuple:
+        # Constructor arguments that follow the steps.
+        return ()
+
+    def _extend(self, *step) -> "_Pipeline":
+        return type(self)(self._steps + (step,), *self._options())
+
+    def map(self, mapper: typed_lambda[TSource, TResult]) -> "_Pipeline":
+        return self._extend(_MAP, mapper)
+
+    def bind(self, func: typed_lambda[TSource, TResult]) -> "_Pipeline":
+        return self._extend(_MAP, func)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __reduce__(self):
+        # The compiled closure is rebuilt on demand, so only steps travel.
+        return (type(self), (self._steps, *self._options()))
+
+    def compile(self) -> Callable:
+        ...
+
+    def __call__(self, value):
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = self.compile()
+        return compiled(value)
+
+
+class MaybePipeline(_Pipeline[TSource, TResult]):
+    """Deferred ``Just.unit(x).map(f).bind(g)...`` chain."""
+
+    __slots__ = ()
+
+    def filter(self, predicate: typed_lambda[TSource, bool]) -> "MaybePipeline":
+        """Turn the value into Nothing when the predicate is falsy."""
+        return self._extend(_FILTER, predicate)
+
+    def compile(self) -> typed_lambda[TSource, Maybe[TResult]]:
+        steps = self._steps
+        nothing = Nothing()
+
+        def run(value):
+            if value is None:
+                return nothing
+            for kind, fn in steps:
+                if kind == _FILTER:
+                    if not fn(value):
+                        return nothing
+                else:
+                    value = fn(value)
+                    if value is None:
+                        return nothing
+            return Just(value)
+
+        return run
+
+
+class EitherPipeline(_Pipeline[TSource, TResult]):
+    """Deferred ``Right.unit(x).bind(f).map(g)...`` chain.
+
+    The whole chain runs under one ``try`` block; the first exception
+    becomes the ``Left`` payload, exactly as ``contoled_map`` does, kept
+    according to the capture policy the pipeline was created with. A
+    successful result is wrapped in ``right``, so a Try pipeline returns
+    a Try like the eager chain does.
+    """
+
+    __slots__ = ("_capture", "_right")
+
+    def __init__(self, steps: tuple = (), capture_policy: Capture = Capture.KEEP, right: type = Right) -> None:
+        super().__init__(steps)
+        self._capture = capture_policy
+        self._right = right
+
+    def _options(self) -> tuple:
+        return (self._capture, self._right)
+
+    def filter(self, predicate: typed_lambda[TSource, bool],
+               error: typed_lambda[TSource, TError] | None = None) -> "EitherPipeline":
+        """Turn the value into a Left when the predicate is falsy.
+
+        The Left holds ``error(value)`` if given, otherwise the rejected
+        value itself.
+        """
+        return self._extend(_FILTER, (predicate, error))
+
+    def compile(self) -> typed_lambda[TSource, Either[TError, TResult]]:
+        steps = self._steps
+        policy = self._capture
+        right = self._right
+
+        def run(value):
+            try:
+                for kind, fn in steps:
+                    if kind == _FILTER:
+                        predicate, error = fn
+                        if not predicate(value):
+                            return Left(value if error is None else error(value))
+                    else:
+                        value = fn(value)
+                        if value is None:
+                            return Left(None)
+                        if isinstance(value, Fail):
+                            return value
+            except Exception as ex:
+                return Left(ex if policy is Capture.KEEP else capture(ex, policy))
+            return right(value)
+
+        return run
@@ -0,0 +1,79 @@
+"""Stack-safe monadic loops.
+
+``tailRecM :: (a -> m (Either a b)) -> a -> m b``
+
+``Maybe.tail_rec(step, seed)`` and ``Either.tail_rec(step, seed)`` call
+``step`` in a plain ``while`` loop. ``step`` returns ``Continue(x)`` to
+run again with ``x``, ``Done(y)`` to finish with a success holding
+``y``, or a Nothing/Left to stop with that failure. No container is
+built per iteration and the stack does not grow, so a loop can run
+for millions of steps:
+
+    def page(cursor):
+        batch = fetch(cursor)
+        return Done(batch.items) if batch.last else Continue(batch.next)
+
+    Try.tail_rec(page, first_cursor)
+
+A success container holding a marker (``Just(Continue(x))``) is
+accepted as well, at the cost of the allocation.
+"""
+from typing import Any, Callable
+
+
+class Continue:
+    """Run the step again with ``value``."""
+
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Continue({self.value!r})"
+
+
+class Done:
+    """Stop with ``value`` as the result."""
+
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Done({self.value!r})"
+
+
+def tail_rec(step: Callable[[Any], Any], seed: Any, failure: type, done: Callable[[Any], Any],
+             none: Callable[[], Any]) -> Any:
+    """Loop ``step`` from ``seed`` until it returns Done or a failure.
+
+    ``failure`` is the short-circuiting class, ``done`` wraps the final
+    value and ``none`` builds the result when ``step`` returns None.
+    """
+    value = seed
+    while True:
+        result = step(value)
+        kind = type(result)
+        if kind is Continue:
+            value = result.value
+        elif kind is Done:
+            return done(result.value)
+        elif result is None:
+            return none()
+        else:
+            if getattr(result, "_lazy", False):
+                result = result.force()
+            if isinstance(result, failure):
+                return result
+            marker = result.unwrap() if hasattr(result, "unwrap") else result
+            kind = type(marker)
+            if kind is Continue:
+                value = marker.value
+            elif kind is Done:
+                return done(marker.value)
+            else:
+                raise TypeError(f"tail_rec step must return Continue, Done or a failure, got {result!r}")
@@ -0,0 +1,76 @@
+"""Short-circuiting traverse/sequence over iterables.
+
+These helpers back ``Maybe.traverse``/``Either.traverse`` and friends.
+They pull one item at a time from the input and stop at the first
+failure (Nothing or Left) without reading the rest of it. A deferred
+result (``Maybe.lazy``/``Either.lazy``) is forced before it is checked.
+"""
+from typing import Any, Callable, Generator, Iterable, TypeVar
+
+TSource = TypeVar("TSource")
+TResult = TypeVar("TResult")
+
+
+class ShortCircuit(Exception):
+    """Raised by the streaming forms when asked to raise on failure.
+
+    The failing container (a Nothing or a Left) is kept in ``failure``.
+    """
+
+    def __init__(self, failure: Any) -> None:
+        super().__init__(failure)
+        self.failure = failure
+
+
+def traverse(fn: Callable[[TSource], Any], xs: Iterable[TSource], failure: type, wrap: Callable[[list], Any]):
+    """Collect ``fn(x).unwrap()`` for every x, or return the first failure.
+
+    ``failure`` is the class of the short-circuiting variant and
+    ``wrap`` builds the successful container. When ``xs`` has a length
+    the result list is allocated up front.
+    """
+    try:
+        size = len(xs)
+    except TypeError:
+        size = None
+    if size is None:
+        out = []
+        append = out.append
+        for x in xs:
+            m = fn(x)
+            if m._lazy:
+                m = m.force()
+            if isinstance(m, failure):
+                return m
+            append(m.unwrap())
+        return wrap(out)
+    out = [None] * size
+    for i, x in enumerate(xs):
+        m = fn(x)
+        if m._lazy:
+            m = m.force()
+        if isinstance(m, failure):
+            return m
+        out[i] = m.unwrap()
+    return wrap(out)
+
+
+def traverse_iter(fn: Callable[[TSource], Any], xs: Iterable[TSource], failure: type,
+                  raise_on_failure: bool = False) -> Generator[Any, None, Any]:
+    """Yield ``fn(x).unwrap()`` as items arrive.
+
+    On the first failure the generator stops and returns the failing
+    container (available as ``StopIteration.value`` or through
+    ``yield from``), or raises ShortCircuit if ``raise_on_failure`` is
+    set. It returns None when the input is exhausted without failures.
+    """
+    for x in xs:
+        m = fn(x)
+        if m._lazy:
+            m = m.force()
+        if isinstance(m, failure):
+            if raise_on_failure:
+                raise ShortCircuit(m)
+            return m
+        yield m.unwrap()
+    return None
@@ -1,5 +1,31 @@
-from .applicative import Applicative
-from .functor import Functor
-from .monoid import Monoid
-from .monad import Monad
-from .lambda_types import typed_lambda,untyped_lambda
\ No newline at end of file
+"""Protocols shared by the fp_py containers.
+
+The names below are imported from their submodules on first access,
+so importing one submodule (e.g. ``fp_py.types.lambda_types``) does not
+load every protocol.
+"""
+import importlib
+
+_exports = {
+    "Applicative": ".applicative",
+    "Functor": ".functor",
+    "Monoid": ".monoid",
+    "Monad": ".monad",
+    "typed_lambda": ".lambda_types",
+    "untyped_lambda": ".lambda_types",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,15 @@
 from abc import abstractmethod
 
-from typing import Callable, Self, TypeVar, Protocol
-from typing_extensions import runtime_checkable
+from typing import Callable, Self, TypeVar, Protocol, runtime_checkable
+
+from fp_py.types.conformance import CachedProtocolMeta
 
 TSource = TypeVar('TSource')
 TResult = TypeVar('TResult')
 
 
 @runtime_checkable
-class Applicative(Protocol[TSource, TResult]):
+class Applicative(Protocol[TSource, TResult], metaclass=CachedProtocolMeta):
     """Applicative.
 
     Applicative functors are functors with some extra properties.
@@ -0,0 +1,16 @@
+"""Opt-in protocol verification.
+
+The container modules used to assert their protocol conformance at
+import time. Those checks now run only when the ``FP_PY_CHECK_PROTOCOLS``
+environment variable is set, or when a test calls ``check_protocols``.
+"""
+import os
+
+CHECK_PROTOCOLS = bool(os.environ.get("FP_PY_CHECK_PROTOCOLS"))
+
+
+def check_protocols(cls: type, *protocols: type) -> None:
+    """Raise TypeError unless ``cls`` structurally matches every protocol."""
+    for protocol in protocols:
+        if not isinstance(cls, protocol):
+            raise TypeError(f"{cls.__name__} does not implement {protocol.__name__}")
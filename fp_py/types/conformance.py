@@ -0,0 +1,81 @@
+"""Cached protocol conformance.
+
+``runtime_checkable`` protocols re-check every protocol attribute on each
+``isinstance`` call. The protocols in ``fp_py.types`` use
+``CachedProtocolMeta`` instead, which asks the shared ``registry`` first:
+the structural check runs once per (protocol, type) pair and its answer
+is reused afterwards.
+
+Conformance is decided per type, so attributes attached to a single
+instance after the first check are not seen. Use ``register`` to declare
+an answer up front and ``invalidate`` after patching a class. The cache
+keeps a reference to every type it has seen; call ``invalidate`` if a
+program creates and drops classes in bulk.
+"""
+from typing import Protocol
+
+
+class ConformanceRegistry:
+    """Per-protocol cache of which types conform."""
+
+    def __init__(self) -> None:
+        # protocol -> {type: conforms}
+        self._cache: dict[type, dict[type, bool]] = {}
+
+    def lookup(self, protocol: type, subject: type) -> bool | None:
+        """Return the cached answer, or None if ``subject`` was not seen yet."""
+        return self._cache.get(protocol, {}).get(subject)
+
+    def register(self, protocol: type, subject: type, conforms: bool = True) -> None:
+        """Declare whether ``subject`` conforms to ``protocol`` without checking."""
+        self._cache.setdefault(protocol, {})[subject] = conforms
+
+    def invalidate(self, subject: type | None = None, protocol: type | None = None) -> None:
+        """Forget cached answers for a type, a protocol, or (by default) everything."""
+        protocols = [protocol] if protocol is not None else list(self._cache)
+        for p in protocols:
+            if subject is None:
+                self._cache.get(p, {}).clear()
+            else:
+                self._cache.get(p, {}).pop(subject, None)
+
+
+registry = ConformanceRegistry()
+register = registry.register
+invalidate = registry.invalidate
+
+_cache = registry._cache
+
+
+class CachedProtocolMeta(type(Protocol)):
+    """Protocol metaclass that consults ``registry`` for isinstance/issubclass.
+
+    Only the protocol classes themselves are cached; classes that inherit
+    from a protocol nominally keep the normal checks.
+    """
+
+    def __init__(cls, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if cls.__dict__.get("_is_protocol", False):
+            _cache.setdefault(cls, {})
+
+    def __instancecheck__(cls, instance) -> bool:
+        subject = instance if isinstance(instance, type) else type(instance)
+        try:
+            return _cache[cls][subject]
+        except KeyError:
+            pass
+        result = super().__instancecheck__(instance)
+        if cls in _cache:
+            _cache[cls][subject] = result
+        return result
+
+    def __subclasscheck__(cls, other) -> bool:
+        try:
+            return _cache[cls][other]
+        except (KeyError, TypeError):
+            pass
+        result = super().__subclasscheck__(other)
+        if cls in _cache and isinstance(other, type):
+            _cache[cls][other] = result
+        return result
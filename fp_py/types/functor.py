@@ -1,8 +1,8 @@
 from abc import abstractmethod
 
-from typing import Self, TypeVar, Protocol, Callable
-from typing_extensions import runtime_checkable
+from typing import Self, TypeVar, Protocol, Callable, runtime_checkable
 
+from fp_py.types.conformance import CachedProtocolMeta
 from fp_py.types.lambda_types import typed_lambda
 
 
@@ -10,7 +10,7 @@ TSource = TypeVar('TSource', covariant=True)
 TResult = TypeVar('TResult')
 
 @runtime_checkable
-class Functor(Protocol[TSource]):
+class Functor(Protocol[TSource], metaclass=CachedProtocolMeta):
     """The Functor class is used for types that can be mapped over.
 
     Instances of Functor should satisfy the following laws:
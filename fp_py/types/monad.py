@@ -8,9 +8,9 @@ All instances of the Monad typeclass should obey the three monad laws:
 """
 
 from abc import abstractmethod
-from typing import TypeVar, Protocol, Callable
-from typing_extensions import runtime_checkable
+from typing import TypeVar, Protocol, Callable, runtime_checkable
 
+from fp_py.types.conformance import CachedProtocolMeta
 from fp_py.types.lambda_types import typed_lambda
 
 
@@ -19,7 +19,7 @@ TResult = TypeVar('TResult')
 
 
 @runtime_checkable
-class Monad(Protocol[TSource]):
+class Monad(Protocol[TSource], metaclass=CachedProtocolMeta):
     """Monad protocol"""
 
     @abstractmethod
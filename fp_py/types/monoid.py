@@ -1,12 +1,13 @@
 from abc import abstractmethod
-from typing import Protocol, Self, TypeVar
-from typing_extensions import runtime_checkable
+from typing import Protocol, Self, TypeVar, runtime_checkable
+
+from fp_py.types.conformance import CachedProtocolMeta
 
 TSource = TypeVar('TSource')
 
 
 @runtime_checkable
-class Monoid(Protocol[TSource]):
+class Monoid(Protocol[TSource], metaclass=CachedProtocolMeta):
     """The Monoid abstract base class.
 
     The class of monoids (types with an associative binary operation that
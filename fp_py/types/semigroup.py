@@ -1,14 +1,15 @@
 
 from abc import abstractmethod
 
-from typing import Self, TypeVar, Protocol
-from typing_extensions import runtime_checkable
+from typing import Self, TypeVar, Protocol, runtime_checkable
+
+from fp_py.types.conformance import CachedProtocolMeta
 
 
 TSource = TypeVar('TSource', covariant=True)
 
 @runtime_checkable
-class Semigroup(Protocol[TSource]):
+class Semigroup(Protocol[TSource], metaclass=CachedProtocolMeta):
     """The Semigroup class is used for types that can be mapped over.
 
     The set is semigroup if we can  define binary operation:
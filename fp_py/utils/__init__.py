@@ -1,2 +1,12 @@
+"""Utilities; ``lambda_calculus`` is loaded on first attribute access."""
+import importlib
 
-from .lambda_calculus import *
\ No newline at end of file
+
+def __getattr__(name: str):
+    lambda_calculus = importlib.import_module(".lambda_calculus", __name__)
+    if name == "__all__":
+        return [n for n in vars(lambda_calculus) if not n.startswith("_")]
+    try:
+        return getattr(lambda_calculus, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
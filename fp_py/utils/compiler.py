@@ -0,0 +1,206 @@
+"""Compile lambda terms to Python functions.
+
+``compile_term`` turns a closed ``fp_py.utils.terms`` term, or one of
+the curried combinators of ``fp_py.utils.lambda_calculus``, into a
+curried Python function that can be used in place of the hand-written
+one. ``compile_uncurried`` gives a function taking all the leading
+arguments at once, which saves a call per argument.
+
+Compilation first normalizes the term (within a step budget, and only
+if the normal form is not much bigger), so the reductions between known
+combinators are done once, at compile time. The generated code then:
+
+* hoists closed subterms to module-level constants, so no closure is
+  built for them at run time;
+* calls a hoisted combinator applied to all its arguments through its
+  uncurried form, ``k(a, b, c)`` rather than ``k(a)(b)(c)``;
+* eta-reduces ``λx. f x`` to ``f`` when ``f`` is a variable;
+* uses ``lambda_calculus`` Numerals for Church numerals, so applying
+  them loops instead of nesting calls, and ``lambda_calculus.true``,
+  ``false`` and ``identity`` for those terms.
+
+The result runs under Python's call-by-value, like the hand-written
+combinators: it agrees with ``terms.normalize`` whenever evaluating
+every argument terminates.
+"""
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from fp_py.utils import lambda_calculus as lc
+from fp_py.utils.terms import (App, Lam, StepLimitExceeded, Term, Var, church_value, from_python,
+                               normalize)
+
+OPTIMIZE_STEPS = 100_000
+MAX_GROWTH = 4
+
+_TRUE = Lam(Lam(Var(1)))
+_FALSE = Lam(Lam(Var(0)))
+_IDENTITY = Lam(Var(0))
+
+_curried: "WeakKeyDictionary[Term, Callable]" = WeakKeyDictionary()
+_uncurried: "WeakKeyDictionary[Term, Callable]" = WeakKeyDictionary()
+
+
+def _size(term: Term, limit: int) -> int:
+    """Tree size of ``term``, counting no further than ``limit``."""
+    size, stack = 0, [term]
+    while stack and size <= limit:
+        t = stack.pop()
+        size += 1
+        if type(t) is App:
+            stack.append(t.fn)
+            stack.append(t.arg)
+        elif type(t) is Lam:
+            stack.append(t.body)
+    return size
+
+
+def optimize(term: Term) -> Term:
+    """The normal form of ``term`` if it is cheap to find and not much bigger, else ``term``."""
+    try:
+        nf = normalize(term, OPTIMIZE_STEPS)
+    except StepLimitExceeded:
+        return term
+    limit = MAX_GROWTH * _size(term, 1_000_000)
+    return nf if _size(nf, limit) <= limit else term
+
+
+def _leading(term: Term) -> tuple[int, Term]:
+    count = 0
+    while type(term) is Lam:
+        count, term = count + 1, term.body
+    return count, term
+
+
+def _params(count: int) -> str:
+    return ", ".join(f"v{i}" for i in range(count))
+
+
+class _Emitter:
+    """Generates one module of definitions for a closed term and its closed subterms."""
+
+    def __init__(self) -> None:
+        self.namespace: dict = {}
+        self.lines: list[str] = []
+        self.curried: dict[Term, str] = {}
+        self.uncurried: dict[Term, tuple[str, int]] = {}
+        self.known: dict[Term, object] = {}
+        self.count = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def known_value(self, term: Term):
+        if term not in self.known:
+            value = {_TRUE: lc.true, _FALSE: lc.false, _IDENTITY: lc.identity}.get(term)
+            if value is None:
+                try:
+                    value = lc.from_int(church_value(term))
+                except ValueError:
+                    pass
+            self.known[term] = value
+        return self.known[term]
+
+    def curried_name(self, term: Term) -> str:
+        name = self.curried.get(term)
+        if name is None:
+            value = self.known_value(term)
+            name = self.fresh("_c")
+            if value is not None:
+                self.namespace[name] = value
+            else:
+                count, body = _leading(term)
+                header = "".join(f"lambda v{i}: " for i in range(count))
+                self.lines.append(f"{name} = {header}{self.expr(body, count)}")
+            self.curried[term] = name
+        return name
+
+    def uncurried_name(self, term: Term) -> tuple[str, int]:
+        entry = self.uncurried.get(term)
+        if entry is None:
+            count, body = _leading(term)
+            entry = self.fresh("_u"), count
+            self.lines.append(f"def {entry[0]}({_params(count)}):\n    return {self.expr(body, count)}")
+            self.uncurried[term] = entry
+        return entry
+
+    def expr(self, term: Term, depth: int) -> str:
+        kind = type(term)
+        if kind is Lam and term.free == 0:
+            return self.curried_name(term)
+        if kind is Var:
+            return f"v{depth - term.index - 1}"
+        if kind is Lam:
+            body = term.body
+            if type(body) is App and body.arg is Var(0) and type(body.fn) is Var and body.fn.index:
+                return f"v{depth - body.fn.index}"
+            return f"(lambda v{depth}: {self.expr(body, depth + 1)})"
+        args, head = [], term
+        while type(head) is App:
+            args.append(head.arg)
+            head = head.fn
+        parts = [self.expr(a, depth) for a in reversed(args)]
+        if type(head) is Lam and head.free == 0 and self.known_value(head) is None:
+            name, arity = self.uncurried_name(head)
+            if len(parts) >= arity:
+                return f"{name}({', '.join(parts[:arity])})" + "".join(f"({p})" for p in parts[arity:])
+        return self.expr(head, depth) + "".join(f"({p})" for p in parts)
+
+    def build(self, name: str) -> Callable:
+        exec("\n".join(self.lines), self.namespace)
+        return self.namespace[name]
+
+
+def _prepare(source: Term | Callable, optimized: bool) -> Term:
+    term = source if isinstance(source, Term) else from_python(source)
+    if term.free:
+        raise ValueError("only closed terms can be compiled")
+    if optimized:
+        term = optimize(term)
+    if type(term) is not Lam:
+        raise ValueError("only abstractions compile to functions")
+    return term
+
+
+def _compile(source: Term | Callable, optimized: bool, uncurried: bool) -> Callable:
+    term = _prepare(source, optimized)
+    emitter = _Emitter()
+    try:
+        if uncurried:
+            return emitter.build(emitter.uncurried_name(term)[0])
+        return emitter.build(emitter.curried_name(term))
+    except (RecursionError, SyntaxError, MemoryError):
+        raise ValueError("term is too deeply nested to compile") from None
+
+
+def to_source(source: Term | Callable, optimized: bool = True) -> str:
+    """The Python code ``compile_term`` generates, for inspection."""
+    emitter = _Emitter()
+    emitter.curried_name(_prepare(source, optimized))
+    return "\n".join(emitter.lines)
+
+
+def compile_term(source: Term | Callable, optimized: bool = True) -> Callable:
+    """Compile a closed abstraction (or a ``lambda_calculus`` combinator) to a curried function."""
+    term = source if isinstance(source, Term) else None
+    cached = _curried.get(term) if term is not None and optimized else None
+    if cached is None:
+        cached = _compile(source, optimized, uncurried=False)
+        if term is not None and optimized:
+            _curried[term] = cached
+    return cached
+
+
+def compile_uncurried(source: Term | Callable, optimized: bool = True) -> Callable:
+    """Compile to a function taking every leading argument of the term at once.
+
+    For ``λa.λb.λc.body`` the result is called as ``f(a, b, c)``.
+    """
+    term = source if isinstance(source, Term) else None
+    cached = _uncurried.get(term) if term is not None and optimized else None
+    if cached is None:
+        cached = _compile(source, optimized, uncurried=True)
+        if term is not None and optimized:
+            _uncurried[term] = cached
+    return cached
@@ -7,7 +7,15 @@ Lambda calculus.
 * http://eflorenzano.com/blog/2008/11/20/lambda-calculus/
 
 Just for the fun of it.
+
+Numerals built here (``zero``, ``one``, ``succ``, ``from_int`` and the
+arithmetic on them) are ``Numeral`` objects: they behave exactly like
+λf.λx.f (f ... (f x)), but know their value, so ``to_int`` is O(1),
+applying one runs ``f`` in a loop instead of n nested calls, and
+arithmetic on two of them is plain integer arithmetic. Hand-written
+numerals still work everywhere through the textbook definitions.
 """
+from functools import lru_cache as _lru_cache
 
 '''
 Identity function:
@@ -35,16 +43,90 @@ not_ = lambda x: cond(false)(true)(x)
 and_ = lambda x: lambda y: x(y)(false)
 or_ = lambda x: lambda y: x(true)(y)
 
+
+class Numeral:
+    """The Church numeral λf.λx.f^n x for a known n."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __call__(self, f):
+        n = self.value
+
+        def repeat(x):
+            for _ in range(n):
+                x = f(x)
+            return x
+        return repeat
+
+    def __repr__(self) -> str:
+        return f"Numeral({self.value})"
+
+
+@_lru_cache(maxsize=65536)
+def _numeral(n: int) -> Numeral:
+    return Numeral(n)
+
+
+def from_int(n: int) -> Numeral:
+    """Church numeral for a non-negative int; numerals are cached by value."""
+    if n < 0:
+        raise ValueError(f"Church numerals are non-negative, got {n}")
+    return _numeral(n)
+
+
+def _known(*ns) -> bool:
+    return all(type(n) is Numeral for n in ns)
+
+
 # succ = λn.λf.λx.f (n f x)
-succ = lambda n: lambda f: lambda x: f(n(f)(x))
+def succ(n):
+    if type(n) is Numeral:
+        return from_int(n.value + 1)
+    return lambda f: lambda x: f(n(f)(x))
+
+
+# pred = λn.λf.λx.n (λg.λh.h (g f)) (λu.x) (λu.u)
+def pred(n):
+    if type(n) is Numeral:
+        return from_int(max(n.value - 1, 0))
+    return lambda f: lambda x: n(lambda g: lambda h: h(g(f)))(lambda u: x)(identity)
+
+
+# add = λm.λn.λf.λx.m f (n f x)
+add = lambda m: lambda n: from_int(m.value + n.value) if _known(m, n) \
+    else (lambda f: lambda x: m(f)(n(f)(x)))
+
+# mul = λm.λn.λf.m (n f)
+mul = lambda m: lambda n: from_int(m.value * n.value) if _known(m, n) \
+    else (lambda f: m(n(f)))
+
+# pow = λb.λe.e b
+pow_ = lambda b: lambda e: from_int(b.value ** e.value) if _known(b, e) else e(b)
 
-zero = lambda f: identity
-one = lambda f: lambda x: f(x)
+# sub = λm.λn.n pred m
+sub = lambda m: lambda n: from_int(max(m.value - n.value, 0)) if _known(m, n) else n(pred)(m)
+
+zero = from_int(0)
+one = from_int(1)
 
 two = succ(one)
 three = succ(two)
 
 iszero = lambda n: n(select_first)
 
-to_int = lambda n: n(lambda x: x + 1)(0)
-printl = lambda n: n(lambda x: x + 1)(0)
\ No newline at end of file
+
+def to_int(n) -> int:
+    """Value of a Church numeral; O(1) for a Numeral."""
+    if type(n) is Numeral:
+        return n.value
+    return n(lambda x: x + 1)(0)
+
+
+def to_bool(b) -> bool:
+    return b(True)(False)
+
+
+printl = to_int
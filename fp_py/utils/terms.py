@@ -0,0 +1,421 @@
+"""Lambda terms as data, with a call-by-need normalizer.
+
+Terms use de Bruijn indices: ``Var(0)`` is bound by the nearest
+enclosing ``Lam``. Terms are hash-consed, so building a term that
+already exists returns the existing object: identical subterms are one
+object, and equality is identity.
+
+    >>> K = parse(r"\\x y. x")
+    >>> K is Lam(Lam(Var(1)))
+    True
+    >>> show(normalize(app(parse(r"\\f x. f (f x)"), K)))
+    'λa.λb.λc.a'
+
+``normalize`` reduces a term to normal form. It runs a lazy abstract
+machine: arguments are bound as thunks and each is evaluated at most
+once (call-by-need), then reading the result back goes under binders
+and normalizes the arguments of stuck applications in normal order.
+Both parts work on explicit stacks, so deep terms and long reductions
+do not use the Python stack. A step budget bounds the number of beta
+reductions.
+
+``from_python`` turns the combinators of ``fp_py.utils.lambda_calculus``
+(``make_pair``, ``cond``, Church numerals, ...) into terms by applying
+them to symbolic arguments.
+"""
+from typing import Any, Callable
+from weakref import WeakValueDictionary
+
+from fp_py.utils.lambda_calculus import Numeral
+
+DEFAULT_MAX_STEPS = 10_000_000
+
+_table: "WeakValueDictionary[tuple, Term]" = WeakValueDictionary()
+
+
+class Term:
+    """Base of the hash-consed term classes."""
+
+    __slots__ = ("free", "__weakref__")
+
+    def __repr__(self) -> str:
+        return show(self)
+
+
+class Var(Term):
+    """Variable bound ``index`` binders out."""
+
+    __slots__ = ("index",)
+    __match_args__ = ("index",)
+
+    def __new__(cls, index: int) -> "Var":
+        key = (cls, index)
+        term = _table.get(key)
+        if term is None:
+            term = object.__new__(cls)
+            term.index = index
+            term.free = index + 1
+            _table[key] = term
+        return term
+
+
+class Lam(Term):
+    """Abstraction; its body refers to the bound variable as Var(0)."""
+
+    __slots__ = ("body",)
+    __match_args__ = ("body",)
+
+    def __new__(cls, body: Term) -> "Lam":
+        key = (cls, body)
+        term = _table.get(key)
+        if term is None:
+            term = object.__new__(cls)
+            term.body = body
+            term.free = max(body.free - 1, 0)
+            _table[key] = term
+        return term
+
+
+class App(Term):
+    """Application of ``fn`` to ``arg``."""
+
+    __slots__ = ("fn", "arg")
+    __match_args__ = ("fn", "arg")
+
+    def __new__(cls, fn: Term, arg: Term) -> "App":
+        key = (cls, fn, arg)
+        term = _table.get(key)
+        if term is None:
+            term = object.__new__(cls)
+            term.fn = fn
+            term.arg = arg
+            term.free = max(fn.free, arg.free)
+            _table[key] = term
+        return term
+
+
+def app(fn: Term, *args: Term) -> Term:
+    """Left-nested application ``fn a1 a2 ...``."""
+    for arg in args:
+        fn = App(fn, arg)
+    return fn
+
+
+def church(n: int) -> Term:
+    """The Church numeral λf.λx.f (f ... (f x))."""
+    body = Var(0)
+    for _ in range(n):
+        body = App(Var(1), body)
+    return Lam(Lam(body))
+
+
+def church_value(term: Term) -> int:
+    """Read a normal-form Church numeral back as an int."""
+    if type(term) is Lam and type(term.body) is Lam:
+        n, body = 0, term.body.body
+        while type(body) is App and body.fn is Var(1):
+            n, body = n + 1, body.arg
+        if body is Var(0):
+            return n
+    raise ValueError(f"{show(term)} is not a Church numeral")
+
+
+def church_bool(term: Term) -> bool:
+    """Read a normal-form Church boolean (λa.λb.a or λa.λb.b)."""
+    if term is Lam(Lam(Var(1))):
+        return True
+    if term is Lam(Lam(Var(0))):
+        return False
+    raise ValueError(f"{show(term)} is not a Church boolean")
+
+
+# Printing and parsing
+# ====================
+
+def _name(level: int) -> str:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return letters[level % 26] + ("" if level < 26 else str(level // 26))
+
+
+def show(term: Term) -> str:
+    """Render ``term`` with named variables, e.g. ``λa.λb.a b``."""
+    out: list[str] = []
+    # Items are terms to print (with their depth and position) or literal text.
+    work: list = [(term, term.free, False, False)]
+    while work:
+        item = work.pop()
+        if type(item) is str:
+            out.append(item)
+            continue
+        t, depth, as_fn, as_arg = item
+        kind = type(t)
+        if kind is Var:
+            level = depth - t.index - 1
+            out.append(_name(level) if level >= 0 else f"free{-level - 1}")
+        elif kind is Lam:
+            wrap = as_fn or as_arg
+            if wrap:
+                work.append(")")
+            work.append((t.body, depth + 1, False, False))
+            out.append(("(" if wrap else "") + f"λ{_name(depth)}.")
+        else:
+            if as_arg:
+                work.append(")")
+            work.append((t.arg, depth, False, True))
+            work.append(" ")
+            work.append((t.fn, depth, True, False))
+            if as_arg:
+                out.append("(")
+    return "".join(out)
+
+
+def parse(source: str) -> Term:
+    """Parse ``\\x y. body`` / ``λx.body`` syntax; application is left-nested."""
+    tokens = source.replace("(", " ( ").replace(")", " ) ").replace(".", " . ") \
+        .replace("\\", " \\ ").replace("λ", " \\ ").split()
+    position = 0
+    scope: list[str] = []
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take(expected=None):
+        nonlocal position
+        token = peek()
+        if token is None or expected is not None and token != expected:
+            raise SyntaxError(f"expected {expected or 'a term'} at token {position} of {source!r}")
+        position += 1
+        return token
+
+    def term() -> Term:
+        if peek() == "\\":
+            take("\\")
+            names = []
+            while peek() not in (".", None):
+                names.append(take())
+            take(".")
+            scope.extend(names)
+            body = term()
+            del scope[len(scope) - len(names):]
+            for _ in names:
+                body = Lam(body)
+            return body
+        result = atom()
+        while peek() not in (")", None):
+            result = App(result, term() if peek() == "\\" else atom())
+        return result
+
+    def atom() -> Term:
+        token = take()
+        if token == "(":
+            inner = term()
+            take(")")
+            return inner
+        for i, name in enumerate(reversed(scope)):
+            if name == token:
+                return Var(i)
+        raise SyntaxError(f"unbound variable {token!r} in {source!r}")
+
+    result = term()
+    if peek() is not None:
+        raise SyntaxError(f"unexpected {peek()!r} in {source!r}")
+    return result
+
+
+# Python combinators
+# ==================
+
+class _Symbol:
+    """Stands for a bound variable while a Python function is being reified."""
+
+    __slots__ = ("level", "args")
+
+    def __init__(self, level: int, args: tuple = ()) -> None:
+        self.level = level
+        self.args = args
+
+    def __call__(self, arg: Any) -> "_Symbol":
+        return _Symbol(self.level, self.args + (arg,))
+
+
+def from_python(value: Callable, depth: int = 0) -> Term:
+    """Reify a curried Python lambda term, such as ``lambda_calculus.make_pair``.
+
+    The function is applied to symbolic arguments until it returns one
+    of them; every Python function met on the way becomes a ``Lam``.
+    Church numerals from ``lambda_calculus`` are converted directly.
+    """
+    if type(value) is _Symbol:
+        term = Var(depth - value.level - 1)
+        for arg in value.args:
+            term = App(term, from_python(arg, depth))
+        return term
+    if type(value) is Numeral:
+        return church(value.value)
+    if not callable(value):
+        raise TypeError(f"{value!r} is not a lambda term")
+    return Lam(from_python(value(_Symbol(depth)), depth + 1))
+
+
+# Evaluation
+# ==========
+
+class StepLimitExceeded(Exception):
+    """Raised when normalization takes more beta steps than allowed."""
+
+    def __init__(self, steps: int) -> None:
+        super().__init__(f"no normal form within {steps} reduction steps")
+        self.steps = steps
+
+
+class Divergence(Exception):
+    """Raised when a thunk is needed to compute its own value."""
+
+
+class _Thunk:
+    __slots__ = ("term", "env", "value")
+
+    def __init__(self, term: Term | None, env, value=None) -> None:
+        self.term = term
+        self.env = env
+        self.value = value
+
+
+class _Update:
+    __slots__ = ("thunk",)
+
+    def __init__(self, thunk: _Thunk) -> None:
+        self.thunk = thunk
+
+
+class _Closure:
+    __slots__ = ("body", "env")
+
+    def __init__(self, body: Term, env) -> None:
+        self.body = body
+        self.env = env
+
+
+class _Neutral:
+    """A variable introduced by read-back applied to thunks (args reversed, as a cons list)."""
+
+    __slots__ = ("level", "args")
+
+    def __init__(self, level: int, args=None) -> None:
+        self.level = level
+        self.args = args
+
+
+_BLACKHOLE = object()
+_FORCE, _LAM, _APP = range(3)
+
+
+def _lookup(env, index: int) -> _Thunk:
+    for _ in range(index):
+        env = env[1]
+    return env[0]
+
+
+class Normalizer:
+    """Call-by-need normalizer; ``steps`` counts the beta reductions done so far."""
+
+    def __init__(self, max_steps: int = DEFAULT_MAX_STEPS) -> None:
+        self.max_steps = max_steps
+        self.steps = 0
+
+    def _whnf(self, term: Term, env, stack: list):
+        """Run the machine until ``term`` is a lambda or a stuck application."""
+        steps, limit = self.steps, self.max_steps
+        while True:
+            kind = type(term)
+            if kind is App:
+                arg = term.arg
+                # A variable argument shares the thunk it already names.
+                stack.append(_lookup(env, arg.index) if type(arg) is Var else _Thunk(arg, env))
+                term = term.fn
+                continue
+            if kind is Var:
+                thunk = _lookup(env, term.index)
+                value = thunk.value
+                if value is None:
+                    if thunk.term is _BLACKHOLE:
+                        self.steps = steps
+                        raise Divergence("a thunk depends on its own value")
+                    stack.append(_Update(thunk))
+                    term, env = thunk.term, thunk.env
+                    thunk.term = _BLACKHOLE
+                    thunk.env = None
+                    continue
+            else:
+                value = _Closure(term.body, env)
+            while stack:
+                frame = stack.pop()
+                if type(frame) is _Update:
+                    frame.thunk.value = value
+                elif type(value) is _Closure:
+                    steps += 1
+                    if steps > limit:
+                        self.steps = steps
+                        raise StepLimitExceeded(limit)
+                    term, env = value.body, (frame, value.env)
+                    break
+                else:
+                    value = _Neutral(value.level, (frame, value.args))
+            else:
+                self.steps = steps
+                return value
+
+    def _force(self, thunk: _Thunk):
+        value = thunk.value
+        if value is not None:
+            return value
+        if thunk.term is _BLACKHOLE:
+            raise Divergence("a thunk depends on its own value")
+        term, env = thunk.term, thunk.env
+        thunk.term = _BLACKHOLE
+        thunk.env = None
+        return self._whnf(term, env, [_Update(thunk)])
+
+    def normalize(self, term: Term) -> Term:
+        """Return the normal form of ``term``."""
+        depth = term.free
+        env = None
+        for level in range(depth):
+            env = (_Thunk(None, None, _Neutral(level)), env)
+        results: list[Term] = []
+        work: list = [(_FORCE, _Thunk(term, env), depth)]
+        while work:
+            item = work.pop()
+            tag = item[0]
+            if tag is _LAM:
+                results.append(Lam(results.pop()))
+                continue
+            if tag is _APP:
+                count = item[1]
+                head = results[-count - 1]
+                for arg in results[len(results) - count:]:
+                    head = App(head, arg)
+                del results[len(results) - count - 1:]
+                results.append(head)
+                continue
+            value, depth = self._force(item[1]), item[2]
+            if type(value) is _Closure:
+                fresh = _Thunk(None, None, _Neutral(depth))
+                work.append((_LAM,))
+                work.append((_FORCE, _Thunk(value.body, (fresh, value.env)), depth + 1))
+                continue
+            results.append(Var(depth - value.level - 1))
+            args, node = [], value.args
+            while node is not None:
+                args.append(node[0])
+                node = node[1]
+            if args:
+                # args is in reverse application order, so the first argument is pushed last.
+                work.append((_APP, len(args)))
+                work.extend((_FORCE, arg, depth) for arg in args)
+        return results[0]
+
+
+def normalize(term: Term, max_steps: int = DEFAULT_MAX_STEPS) -> Term:
+    """Normal form of ``term``, or StepLimitExceeded after ``max_steps`` beta steps."""
+    return Normalizer(max_steps).normalize(term)
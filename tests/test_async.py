@@ -0,0 +1,124 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from fp_py.Async import AsyncEither, AsyncMaybe, AsyncTry
+from fp_py.capture import Capture
+from fp_py.Either import Left, Right, Try
+from fp_py.Maybe import Just, Nothing
+from assertpy import assert_that
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def _await(awaitable):
+    return await awaitable
+
+async def async_inc(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+async def async_div(x):
+    await asyncio.sleep(0)
+    return 6 / x
+
+@pytest.mark.maybe
+def test_async_maybe_chain():
+    v = run(_await(AsyncMaybe.unit(41).map(async_inc).map(lambda x: x * 2)))
+    assert_that(v.unwrap()).is_equal_to(84)
+    v = run(_await(AsyncMaybe.unit(1).bind(lambda x: Nothing()).map(async_inc)))
+    assert_that(v).is_same_as(Nothing())
+    v = run(_await(AsyncMaybe.unit(1).bind(lambda x: AsyncMaybe.unit(x + 1))))
+    assert_that(v.unwrap()).is_equal_to(2)
+
+@pytest.mark.trymonad
+def test_async_try_captures_exceptions():
+    v = run(_await(AsyncTry.unit(3).bind(async_div).map(lambda x: x + 7)))
+    assert_that(v.is_right()).is_true()
+    assert_that(v.unwrap()).is_equal_to(9)
+    v = run(_await(AsyncTry.unit(0).bind(async_div).map(async_inc)))
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_instance_of(ZeroDivisionError)
+    v = run(_await(AsyncEither.unit(1).map(lambda x: None)))
+    assert_that(v.is_left()).is_true()
+
+@pytest.mark.trymonad
+def test_async_try_follows_sync_rules(monkeypatch):
+    for mapper in (lambda x: x + 1, lambda x: None, lambda x: Try.fail("e"), lambda x: Right(x)):
+        v = run(_await(AsyncTry.unit(1).map(mapper)))
+        assert_that(v).is_equal_to(Try(1).map(mapper))
+        assert_that(type(v)).is_equal_to(type(Try(1).map(mapper)))
+    monkeypatch.setattr(Try, "capture_policy", Capture.SUMMARY)
+    v = run(_await(AsyncTry.unit(0).bind(async_div)))
+    assert_that(v.unwrap().__traceback__).is_none()
+
+@pytest.mark.either
+def test_async_either_apply():
+    v = run(_await(AsyncEither.pure(async_inc).apply(AsyncEither.unit(1))))
+    assert_that(v.unwrap()).is_equal_to(2)
+    v = run(_await(AsyncEither.pure(lambda x: x * 3).apply(AsyncEither.from_either(Left("e")))))
+    assert_that(v.unwrap()).is_equal_to("e")
+
+@pytest.mark.either
+def test_async_apply_awaits_any_async_callable():
+    class AsyncInc:
+        async def __call__(self, x):
+            return x + 1
+
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    v = run(_await(AsyncEither.pure(AsyncInc()).apply(AsyncEither.unit(1))))
+    assert_that(v.unwrap()).is_equal_to(2)
+    v = run(_await(AsyncEither.pure(partial(add, 10)).apply(AsyncEither.unit(1))))
+    assert_that(v.unwrap()).is_equal_to(11)
+    v = run(_await(AsyncMaybe.pure(add).apply(AsyncMaybe.unit(1)).apply(AsyncMaybe.unit(2))))
+    assert_that(v.unwrap()).is_equal_to(3)
+
+@pytest.mark.either
+def test_traverse_async_rejects_zero_limit():
+    with pytest.raises(ValueError):
+        run(AsyncEither.traverse_async(async_inc, [1, 2], limit=0))
+
+@pytest.mark.either
+def test_traverse_async_respects_limit():
+    running = 0
+    peak = 0
+    async def work(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x * 2
+    v = run(AsyncEither.traverse_async(work, range(20), limit=3))
+    assert_that(v.unwrap()).is_equal_to([x * 2 for x in range(20)])
+    assert_that(peak).is_less_than_or_equal_to(3)
+
+@pytest.mark.trymonad
+def test_traverse_async_captures_and_cancels():
+    v = run(AsyncTry.traverse_async(async_div, [1, 0, 2, 3], limit=2))
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_instance_of(ZeroDivisionError)
+
+    finished = []
+    async def slow(x):
+        if x == 0:
+            raise ValueError("boom")
+        await asyncio.sleep(0.05)
+        finished.append(x)
+        return x
+    v = run(AsyncTry.traverse_async(slow, [1, 2, 0, 3], cancel_on_failure=True))
+    assert_that(v.unwrap()).is_instance_of(ValueError)
+    assert_that(finished).is_empty()
+
+@pytest.mark.maybe
+def test_async_gather():
+    items = [AsyncMaybe.unit(1).map(async_inc), AsyncMaybe.from_maybe(Nothing()), AsyncMaybe.unit(3)]
+    res = run(AsyncMaybe.gather(items, limit=2))
+    assert_that(res).is_equal_to([Just(2), Nothing(), Just(3)])
+    v = run(AsyncMaybe.traverse_async(lambda x: Just(x) if x else Nothing(), [1, 2]))
+    assert_that(v.unwrap()).is_equal_to([1, 2])
@@ -0,0 +1,26 @@
+import json
+import os
+
+import pytest
+from assertpy import assert_that
+
+from benchmarks import suite
+
+# Relative slowdown against benchmarks/baseline.json that fails the run.
+TOLERANCE = float(os.environ.get("FP_PY_BENCH_TOLERANCE", "0.5"))
+
+
+def test_compare_flags_regressions():
+    baseline = {"results": {"a": {"ratio": 2.0}, "b": {"ratio": 2.0}, "c": {"ratio": 2.0},
+                            "d": {"error": "AttributeError"}}}
+    current = {"results": {"a": {"ratio": 2.9}, "b": {"ratio": 3.1}, "c": {"error": "TypeError: x"},
+                           "d": {"ratio": 9.0}}}
+    regressions = suite.compare(current, baseline, 0.5)
+    assert_that(regressions).contains_only("b", "c")
+
+
+@pytest.mark.benchmark
+def test_no_regression_against_baseline():
+    baseline = json.loads(suite.BASELINE.read_text())
+    _, regressions = suite.gate(baseline, TOLERANCE, quick=True)
+    assert_that(regressions).is_empty()
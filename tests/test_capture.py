@@ -0,0 +1,115 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try, Fail
+from fp_py.capture import Capture, CapturedError, format_traceback
+from assertpy import assert_that
+
+
+def divide(x):
+    return 6 / x
+
+
+@pytest.mark.trymonad
+def test_try_unit_keeps_try():
+    res = Try.unit(3).bind(divide).map(lambda x: x + 1)
+    assert_that(res).is_instance_of(Try)
+    assert_that(res.unwrap()).is_equal_to(3)
+
+
+@pytest.mark.either
+def test_contoled_map_on_left_gives_right():
+    res = Left(1).contoled_map(lambda x: x + 1)
+    assert_that(type(res)).is_equal_to(Right)
+    assert_that(res.unwrap()).is_equal_to(2)
+    assert_that(type(Right(1).contoled_map(lambda x: x + 1))).is_equal_to(Right)
+
+
+@pytest.mark.trymonad
+def test_capture_keep_by_default():
+    res = Try.unit(0).bind(divide)
+    assert_that(res.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(res.unwrap().__traceback__).is_not_none()
+
+
+@pytest.mark.trymonad
+def test_capture_strip(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.STRIP)
+    res = Try.unit(0).bind(divide)
+    assert_that(res.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(res.unwrap().__traceback__).is_none()
+    assert_that(Either.capture_policy).is_equal_to(Capture.KEEP)
+
+
+def reraise(x):
+    try:
+        return 6 / x
+    except ZeroDivisionError:
+        raise ValueError(x)
+
+
+def reraise_from(x):
+    try:
+        int("x")
+    except ValueError as ex:
+        cause = ex
+    try:
+        return 6 / x
+    except ZeroDivisionError:
+        raise KeyError(x) from cause
+
+
+@pytest.mark.trymonad
+def test_capture_strip_walks_cause_and_context(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.STRIP)
+    error = Try.unit(0).bind(reraise).unwrap()
+    assert_that(error.__context__).is_instance_of(ZeroDivisionError)
+    assert_that(error.__context__.__traceback__).is_none()
+    error = Try.unit(0).bind(reraise_from).unwrap()
+    assert_that(error.__cause__).is_instance_of(ValueError)
+    assert_that(error.__cause__.__traceback__).is_none()
+    # the context hidden by "from" is dropped instead of kept alive
+    assert_that(error.__suppress_context__).is_true()
+    assert_that(error.__context__).is_none()
+    assert_that(error.__traceback__).is_none()
+
+
+@pytest.mark.trymonad
+def test_capture_summary(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.SUMMARY)
+    error = Try.unit(0).bind(divide).unwrap()
+    assert_that(error.__traceback__).is_none()
+    text = format_traceback(error)
+    assert_that(text).contains("in divide", "ZeroDivisionError")
+
+
+@pytest.mark.trymonad
+def test_capture_message(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.MESSAGE)
+    error = Try.unit(0).bind(divide).unwrap()
+    assert_that(error).is_equal_to(CapturedError(ZeroDivisionError, "division by zero"))
+    assert_that(str(error)).is_equal_to("ZeroDivisionError: division by zero")
+
+
+@pytest.mark.trymonad
+def test_capture_in_pipeline(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.MESSAGE)
+    res = Try.pipeline().bind(divide)(0)
+    assert_that(res.unwrap()).is_instance_of(CapturedError)
+    assert_that(Either.pipeline().bind(divide)(0).unwrap()).is_instance_of(ZeroDivisionError)
+
+
+@pytest.mark.trymonad
+def test_fail_short_circuits_without_raising():
+    calls = []
+    res = Try.unit(-1) \
+        .bind(lambda x: Try.fail("negative") if x < 0 else x) \
+        .map(calls.append)
+    assert_that(res).is_instance_of(Fail)
+    assert_that(res.is_left()).is_true()
+    assert_that(res.unwrap()).is_equal_to("negative")
+    assert_that(calls).is_empty()
+
+    plan = Try.pipeline().bind(lambda x: Try.fail("negative") if x < 0 else x)
+    assert_that(plan(-1)).is_instance_of(Left)
+    assert_that(plan(-1).unwrap()).is_equal_to("negative")
+    assert_that(plan(1).unwrap()).is_equal_to(1)
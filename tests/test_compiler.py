@@ -0,0 +1,73 @@
+from itertools import product
+
+import pytest
+from assertpy import assert_that
+
+from fp_py.utils import lambda_calculus as lc
+from fp_py.utils.compiler import compile_term, compile_uncurried, optimize, to_source
+from fp_py.utils.terms import App, Lam, Var, app, church, from_python, parse
+
+BOOLEANS = [lc.true, lc.false]
+EXPRESSION = parse(r"""\a b c. (\x. x (\p q. q) (\p q. p))
+    ((\x y. x y (\p q. q)) ((\x y. x (\p q. p) y) a b) ((\x. x (\p q. q) (\p q. p)) c))""")
+
+
+def expected(a, b, c) -> bool:
+    return not ((lc.to_bool(a) or lc.to_bool(b)) and not lc.to_bool(c))
+
+
+@pytest.mark.lambdacalculus
+def test_compiled_combinators_match_hand_written():
+    not_, and_, or_ = (compile_term(f) for f in (lc.not_, lc.and_, lc.or_))
+    for a, b in product(BOOLEANS, repeat=2):
+        assert_that(lc.to_bool(and_(a)(b))).is_equal_to(lc.to_bool(lc.and_(a)(b)))
+        assert_that(lc.to_bool(or_(a)(b))).is_equal_to(lc.to_bool(lc.or_(a)(b)))
+        assert_that(lc.to_bool(not_(a))).is_equal_to(lc.to_bool(lc.not_(a)))
+    assert_that(compile_term(lc.identity)).is_same_as(lc.identity)
+    assert_that(compile_term(lc.select_first)).is_same_as(lc.true)
+    assert_that(compile_uncurried(lc.make_pair)(1, 2, lambda x: lambda y: x - y)).is_equal_to(-1)
+
+
+@pytest.mark.lambdacalculus
+def test_compiled_expression():
+    curried = compile_term(EXPRESSION)
+    uncurried = compile_uncurried(EXPRESSION)
+    unoptimized = compile_uncurried(EXPRESSION, optimized=False)
+    for a, b, c in product(BOOLEANS, repeat=3):
+        assert_that(lc.to_bool(curried(a)(b)(c))).is_equal_to(expected(a, b, c))
+        assert_that(lc.to_bool(uncurried(a, b, c))).is_equal_to(expected(a, b, c))
+        assert_that(lc.to_bool(unoptimized(a, b, c))).is_equal_to(expected(a, b, c))
+    assert_that(compile_term(EXPRESSION)).is_same_as(curried)
+
+
+@pytest.mark.lambdacalculus
+def test_compiled_numerals():
+    compiled = compile_term(parse(r"\m n. (\m n f x. m f (n f x)) ((\m n f. m (n f)) m n) m"))
+    assert_that(lc.to_int(compiled(lc.from_int(7))(lc.from_int(6)))).is_equal_to(49)
+    assert_that(compile_term(church(5))).is_same_as(lc.from_int(5))
+    assert_that(compile_term(app(from_python(lc.add), church(2), church(3)))).is_same_as(lc.from_int(5))
+    pred = compile_term(lc.pred)
+    assert_that(lc.to_int(pred(lc.from_int(10)))).is_equal_to(9)
+
+
+@pytest.mark.lambdacalculus
+def test_generated_source():
+    assert_that(to_source(lc.and_)).matches(r"^_c\d+ = lambda v0: lambda v1: v0\(v1\)\(_c\d+\)$")
+    # λx. f x is emitted as f.
+    assert_that(to_source(parse(r"\f. f (\x. f x)"), optimized=False)).is_equal_to("_c1 = lambda v0: v0(v0)")
+    assert_that(to_source(EXPRESSION, optimized=False)).contains("def _u")
+
+
+@pytest.mark.lambdacalculus
+def test_optimize_keeps_small_terms():
+    assert_that(optimize(app(from_python(lc.add), church(2), church(3)))).is_same_as(church(5))
+    blowup = app(from_python(lc.pow_), church(2), church(10))
+    assert_that(optimize(Lam(App(Var(0), blowup)))).is_same_as(Lam(App(Var(0), blowup)))
+
+
+@pytest.mark.lambdacalculus
+def test_compile_rejects_open_or_non_function_terms():
+    with pytest.raises(ValueError):
+        compile_term(Var(0))
+    with pytest.raises(ValueError):
+        compile_term(App(church(1), church(1)), optimized=False)
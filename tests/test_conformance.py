@@ -0,0 +1,45 @@
+import pytest
+
+from fp_py.Maybe import Just
+from fp_py.types import Functor, Monad
+from fp_py.types.conformance import invalidate, register, registry
+from assertpy import assert_that
+
+
+class Box:
+    def map(self, fn):
+        return self
+
+
+def test_conformance_is_cached_per_type():
+    invalidate(Box)
+    assert_that(isinstance(Box(), Functor)).is_true()
+    assert_that(registry.lookup(Functor, Box)).is_true()
+    assert_that(isinstance(Box(), Monad)).is_false()
+    assert_that(registry.lookup(Monad, Box)).is_false()
+    assert_that(isinstance(Just(1), Monad)).is_true()
+    assert_that(issubclass(Box, Functor)).is_true()
+
+def test_conformance_register_and_invalidate():
+    register(Monad, Box)
+    assert_that(isinstance(Box(), Monad)).is_true()
+    invalidate(Box, Monad)
+    assert_that(registry.lookup(Monad, Box)).is_none()
+    assert_that(isinstance(Box(), Monad)).is_false()
+
+def test_conformance_invalidate_sees_patched_class():
+    class Late:
+        pass
+    assert_that(isinstance(Late(), Monad)).is_false()
+    Late.bind = lambda self, fn: self
+    Late.unit = classmethod(lambda cls, value: cls())
+    assert_that(isinstance(Late(), Monad)).is_false()
+    invalidate(Late)
+    assert_that(isinstance(Late(), Monad)).is_true()
+
+def test_nominal_subclass_is_not_cached():
+    class Concrete(Functor):
+        def map(self, fn):
+            return self
+    assert_that(isinstance(Concrete(), Concrete)).is_true()
+    assert_that(isinstance(Box(), Concrete)).is_false()
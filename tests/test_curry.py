@@ -0,0 +1,86 @@
+import operator
+from functools import partial
+
+import pytest
+
+from fp_py.Either import Either, Left, Right
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.curry import Curried, arity, curry
+from assertpy import assert_that
+
+
+def add3(a, b, c):
+    return a + b + c
+
+
+class Box:
+    def scale(self, x, factor=2):
+        return x * factor
+
+
+def test_arity():
+    assert_that(arity(add3)).is_equal_to(3)
+    assert_that(arity(lambda x, y=1: x)).is_equal_to(1)
+    assert_that(arity(Box().scale)).is_equal_to(1)
+    assert_that(arity(operator.add)).is_equal_to(2)
+    assert_that(arity(partial(add3, 1))).is_equal_to(2)
+    assert_that(arity(curry(add3)(1))).is_equal_to(2)
+
+
+def test_curry():
+    assert_that(curry(add3)(1)(2)(3)).is_equal_to(6)
+    assert_that(curry(add3)(1, 2)(3)).is_equal_to(6)
+    assert_that(curry(add3)(1)).is_instance_of(Curried)
+
+
+@pytest.mark.maybe
+def test_maybe_apply_curries():
+    m = Just.pure(add3).apply(Just(1)).apply(Just(2)).apply(Just(3))
+    assert_that(m.unwrap()).is_equal_to(6)
+    assert_that(Just.pure(operator.mul).apply(Just(6)).apply(Just(7)).unwrap()).is_equal_to(42)
+    assert_that(Just.pure(add3).apply(Nothing()).apply(Just(2)).is_nothing()).is_true()
+
+
+@pytest.mark.maybe
+def test_maybe_apply_keeps_type_error():
+    def broken(a, b):
+        raise TypeError("genuine")
+
+    with pytest.raises(TypeError, match="genuine"):
+        Just.pure(broken).apply(Just(1)).apply(Just(2))
+
+
+@pytest.mark.maybe
+def test_apply_builtin_of_unknown_arity():
+    assert_that(arity(max)).is_none()
+    assert_that(Just.pure(max).apply(Just(1)).apply(Just(2))).is_equal_to(Just(2))
+    assert_that(Right.pure(min).apply(Right(1)).apply(Right(2)).unwrap()).is_equal_to(1)
+
+
+@pytest.mark.either
+def test_either_apply_curries():
+    e = Right.pure(add3).apply(Right(1)).apply(Right(2)).apply(Right(3))
+    assert_that(e.unwrap()).is_equal_to(6)
+
+    def broken(a, b):
+        raise TypeError("genuine")
+
+    e = Right.pure(broken).apply(Right(1)).apply(Right(2))
+    assert_that(e.is_left()).is_true()
+    assert_that(e.unwrap()).is_instance_of(TypeError)
+
+
+@pytest.mark.maybe
+def test_maybe_lift():
+    assert_that(Maybe.map_n(add3, Just(1), Just(2), Just(3)).unwrap()).is_equal_to(6)
+    assert_that(Maybe.map_n(add3, Just(1), Nothing(), Just(3)).is_nothing()).is_true()
+    assert_that(Maybe.lift2(operator.add)(Just(1), Just(2)).unwrap()).is_equal_to(3)
+    assert_that(Maybe.lift_n(add3)(Just(1), Just(2), Just(3)).unwrap()).is_equal_to(6)
+
+
+@pytest.mark.either
+def test_either_lift():
+    assert_that(Either.map_n(add3, Right(1), Right(2), Right(3)).unwrap()).is_equal_to(6)
+    assert_that(Either.map_n(add3, Right(1), Left("a"), Left("b")).unwrap()).is_equal_to("a")
+    assert_that(Either.lift2(operator.truediv)(Right(1), Right(0)).unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(Either.lift_n(add3)(Right(1), Right(2), Right(3)).unwrap()).is_equal_to(6)
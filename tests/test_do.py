@@ -0,0 +1,63 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from assertpy import assert_that
+
+
+def half(x):
+    return Just(x // 2) if x % 2 == 0 else Nothing()
+
+
+@pytest.mark.maybe
+def test_maybe_do():
+    @Maybe.do
+    def quarter_sum(x):
+        a = yield half(x)
+        b = yield half(a)
+        return a + b
+
+    assert_that(quarter_sum(8).unwrap()).is_equal_to(6)
+    assert_that(quarter_sum(6).is_nothing()).is_true()
+    assert_that(quarter_sum.__name__).is_equal_to("quarter_sum")
+
+
+@pytest.mark.maybe
+def test_maybe_do_closes_generator_on_failure():
+    cleaned = []
+
+    @Maybe.do
+    def block():
+        try:
+            yield Nothing()
+            cleaned.append("unreachable")
+        finally:
+            cleaned.append("finally")
+
+    assert_that(block().is_nothing()).is_true()
+    assert_that(cleaned).is_equal_to(["finally"])
+
+
+@pytest.mark.either
+def test_either_do():
+    @Either.do
+    def checked(x):
+        a = yield Right(x)
+        b = yield (Right(a * 2) if a < 10 else Left("too big"))
+        return Right(a + b)
+
+    assert_that(checked(3)).is_instance_of(Right)
+    assert_that(checked(3).unwrap()).is_equal_to(9)
+    assert_that(checked(30).unwrap()).is_equal_to("too big")
+
+
+@pytest.mark.trymonad
+def test_try_do_captures_exceptions():
+    @Try.do
+    def inverse(x):
+        value = yield Try.unit(x)
+        return 1 / value
+
+    assert_that(inverse(4)).is_instance_of(Try)
+    assert_that(inverse(4).unwrap()).is_equal_to(0.25)
+    assert_that(inverse(0).unwrap()).is_instance_of(ZeroDivisionError)
@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from fp_py.Either import Left, Right
+from fp_py.Either import Either, Left, Right, Try
 from fp_py.Maybe import Just, Maybe, Nothing
 from assertpy import assert_that,fail
 
@@ -69,4 +71,55 @@ def test_either_monad():
     
     v = Right.unit(42).bind(lambda x: x/0).bind(lambda y: y+2)
     assert_that(v.is_left()).is_true()
-    assert_that(v.unwrap()).is_instance_of(Exception)    
\ No newline at end of file
+    assert_that(v.unwrap()).is_instance_of(Exception)    
+
+@pytest.mark.either
+def test_either_left_short_circuit():
+    v = Left("error")
+    assert_that(v.map(lambda x: x + 1)).is_same_as(v)
+    assert_that(v.bind(lambda x: x + 1)).is_same_as(v)
+    assert_that(v.apply(Right(1))).is_same_as(v)
+    assert_that(v + Right(1)).is_same_as(v)
+    assert_that(Right(1) + v).is_same_as(v)
+
+@pytest.mark.either
+def test_either_slots():
+    assert_that(hasattr(Left(2), "__dict__")).is_false()
+    assert_that(hasattr(Right(2), "__dict__")).is_false()
+
+
+@pytest.mark.either
+def test_either_concat():
+    assert_that(Either.concat(Right(s) for s in "abc").unwrap()).is_equal_to("abc")
+    assert_that(Either.concat([Right([1]), Right([2])]).unwrap()).is_equal_to([1, 2])
+
+    def lefts():
+        yield Right(1)
+        yield Left("stop")
+        raise AssertionError("read past the first Left")
+
+    assert_that(Either.concat(lefts()).unwrap()).is_equal_to("stop")
+    assert_that(Either.concat([Right("a"), Right(1)]).unwrap()).is_instance_of(TypeError)
+    assert_that(Either.concat([]).is_left()).is_true()
+
+
+@pytest.mark.either
+def test_either_eq_hash_and_match():
+    assert_that(Right(1) == Right(1)).is_true()
+    assert_that(Left(1) == Right(1)).is_false()
+    assert_that(Try.unit(1) == Right(1)).is_true()
+    assert_that(hash(Try.unit("k"))).is_equal_to(hash(Right("k")))
+    assert_that({Left("e"): 1, Right("e"): 2}[Right("e")]).is_equal_to(2)
+    assert_that({Left(1), Left(1), Right(1)}).is_length(2)
+    copy = pickle.loads(pickle.dumps(Right("key")))
+    assert_that(copy).is_equal_to(Right("key"))
+
+    def describe(e):
+        match e:
+            case Left(error):
+                return f"left {error}"
+            case Right(value):
+                return f"right {value}"
+
+    assert_that(describe(Left("x"))).is_equal_to("left x")
+    assert_that(describe(Try.unit(3))).is_equal_to("right 3")
@@ -0,0 +1,90 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fp_py.capture import Capture, CapturedError
+from fp_py.Either import Left, Right, Try
+from fp_py.EitherArray import EitherArray, TryArray
+from assertpy import assert_that
+
+
+def as_pairs(batch):
+    return [(e.is_right(), e.unwrap()) for e in batch.to_eithers()]
+
+@pytest.mark.either
+def test_either_array_roundtrip():
+    batch = EitherArray.from_eithers([Right(1), Left("bad"), Right(3)])
+    assert_that(len(batch)).is_equal_to(3)
+    assert_that(batch.is_right().tolist()).is_equal_to([True, False, True])
+    assert_that(batch.errors).is_equal_to({1: "bad"})
+    assert_that(as_pairs(batch)).is_equal_to([(True, 1), (False, "bad"), (True, 3)])
+    assert_that(batch[1].is_left()).is_true()
+
+@pytest.mark.either
+def test_either_array_vectorized_map_keeps_lefts():
+    batch = EitherArray.from_eithers([Right(1), Left("bad"), Right(3)])
+    res = batch.map(lambda xs: xs * 2, vectorized=True)
+    assert_that(as_pairs(res)).is_equal_to([(True, 2), (False, "bad"), (True, 6)])
+    res = TryArray.from_values([1.0, 4.0]).map(np.sqrt)
+    assert_that(as_pairs(res)).is_equal_to([(True, 1.0), (True, 2.0)])
+
+@pytest.mark.trymonad
+def test_try_array_per_row_capture():
+    batch = TryArray.from_values([3, 0, 6, 2])
+    res = batch.bind(lambda x: 6 / x, chunk_size=2)
+    assert_that(res).is_instance_of(TryArray)
+    assert_that(res.is_right().tolist()).is_equal_to([True, False, True, True])
+    assert_that(res.errors[1]).is_instance_of(ZeroDivisionError)
+    assert_that(res.values[[0, 2, 3]].tolist()).is_equal_to([2.0, 1.0, 3.0])
+    eager = [Try.unit(x).bind(lambda x: 6 / x) for x in [3, 0, 6, 2]]
+    assert_that([e.is_right() for e in eager]).is_equal_to(res.is_right().tolist())
+
+@pytest.mark.trymonad
+def test_try_array_scalar_fallback():
+    calls = []
+    def parse(x):
+        calls.append(x)
+        return int(x)
+    res = TryArray.from_values(["1", "x", "3", None]).map(parse)
+    assert_that(calls).is_equal_to(["1", "x", "3", None])
+    assert_that(res.is_right().tolist()).is_equal_to([True, False, True, False])
+    assert_that(res.values[res.is_right()].tolist()).is_equal_to([1, 3])
+    assert_that(res.errors[1]).is_instance_of(ValueError)
+    assert_that(res.errors[3]).is_instance_of(TypeError)
+    res = EitherArray.from_values([1, 2]).map(lambda x: None if x == 1 else x, vectorized=False)
+    assert_that(as_pairs(res)).is_equal_to([(False, None), (True, 2)])
+
+@pytest.mark.trymonad
+def test_try_array_honours_capture_policy(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.STRIP)
+    res = TryArray.from_values([1, 0]).map(lambda x: 6 // x)
+    assert_that(res.errors[1]).is_instance_of(ZeroDivisionError)
+    assert_that(res.errors[1].__traceback__).is_none()
+    monkeypatch.setattr(Try, "capture_policy", Capture.MESSAGE)
+    res = TryArray.from_values(["x"]).map(int)
+    assert_that(res.errors[0]).is_instance_of(CapturedError)
+    assert_that(EitherArray.from_values([0]).map(lambda x: 6 // x).errors[0].__traceback__).is_not_none()
+    assert_that(type(TryArray.from_values([3])[0].unwrap())).is_equal_to(int)
+
+@pytest.mark.either
+def test_either_array_keeps_mixed_payloads():
+    xs = [Right(1), Right("a"), Left("bad"), Right(True), Right(2)]
+    batch = EitherArray.from_eithers(xs)
+    assert_that(as_pairs(batch)).is_equal_to([(True, 1), (True, "a"), (False, "bad"), (True, True), (True, 2)])
+    res = EitherArray.from_values([True, 2]).map(lambda x: x)
+    assert_that([type(v) for v in res.values.tolist()]).is_equal_to([bool, int])
+    res = EitherArray.from_values([1, 2, 3]).map(lambda x: "a" if x == 2 else x, chunk_size=1)
+    assert_that(res.values.tolist()).is_equal_to([1, "a", 3])
+
+@pytest.mark.either
+def test_either_array_bind_flattens():
+    res = EitherArray.from_values([1, -1]).bind(lambda x: Right(x) if x > 0 else Left("negative"), vectorized=False)
+    assert_that(as_pairs(res)).is_equal_to([(True, 1), (False, "negative")])
+
+@pytest.mark.either
+def test_either_array_applicative_and_match():
+    batch = EitherArray.from_eithers([Right(1), Left("bad")])
+    res = EitherArray.pure(lambda x: x + 1).apply(batch)
+    assert_that(as_pairs(res)).is_equal_to([(True, 2), (False, "bad")])
+    out = batch.match(left=lambda e: f"error {e}", right=lambda xs: xs * 10)
+    assert_that(out.tolist()).is_equal_to([10, "error bad"])
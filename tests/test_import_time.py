@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from assertpy import assert_that
+
+# Cumulative microseconds allowed for importing fp_py.Maybe and fp_py.Either,
+# on top of the stdlib modules every program already pays for.
+IMPORT_BUDGET_US = 30_000
+
+PRELOADED = "import abc, functools, typing"
+TARGETS = "import fp_py.Maybe, fp_py.Either"
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {k: v for k, v in os.environ.items() if k not in ("PYTHONDONTWRITEBYTECODE", "FP_PY_CHECK_PROTOCOLS")}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def fp_py_import_us() -> int:
+    """Sum the top-level fp_py entries of one ``-X importtime`` run."""
+    stderr = run_python("-X", "importtime", "-c", f"{PRELOADED}; {TARGETS}").stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith(" fp_py"):
+            total += int(cumulative)
+    return total
+
+
+@pytest.mark.benchmark
+def test_import_time_budget():
+    run_python("-c", TARGETS)  # warm the bytecode cache
+    best = min(fp_py_import_us() for _ in range(3))
+    assert_that(best).is_less_than(IMPORT_BUDGET_US)
+
+
+def test_import_does_not_load_protocols():
+    loaded = run_python("-c", f"{TARGETS}; import sys; print(' '.join(sys.modules))").stdout.split()
+    assert_that(loaded).does_not_contain("typing_extensions", "fp_py.types.monad", "fp_py.utils.lambda_calculus")
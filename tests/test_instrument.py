@@ -0,0 +1,67 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Nothing
+from fp_py.instrument import ERROR, OK, SHORT_CIRCUIT, SKIPPED, instrument
+from assertpy import assert_that
+
+
+def parse(x):
+    return int(x)
+
+
+def invert(x):
+    return 1 / x
+
+
+def positive(x):
+    return x if x > 0 else None
+
+
+@pytest.mark.trymonad
+def test_instrument_either_chain():
+    with instrument() as stats:
+        Try.unit("0").bind(parse).bind(invert).map(str)
+        Try.unit("2").bind(parse).bind(invert).map(str)
+    steps = stats.steps
+    assert_that(steps["parse"].calls).is_equal_to(2)
+    assert_that(steps["invert"].calls).is_equal_to(2)
+    assert_that(steps["invert"].errors).is_equal_to({"ZeroDivisionError": 1})
+    assert_that(steps["str"].calls).is_equal_to(1)
+    assert_that(steps["str"].skipped).is_equal_to(1)
+    assert_that(stats.report()).contains("invert", "ZeroDivisionError x1")
+
+
+@pytest.mark.maybe
+def test_instrument_maybe_chain_with_callback():
+    events = []
+    with instrument(events.append):
+        Just(-1).bind(positive).map(abs)
+    assert_that([(e.step, e.method, e.container, e.outcome) for e in events]).is_equal_to([
+        ("positive", "bind", "Just", SHORT_CIRCUIT),
+        ("abs", "map", "Nothing", SKIPPED),
+    ])
+
+
+@pytest.mark.either
+def test_instrument_reports_method_and_exceptions():
+    events = []
+    with instrument(events.append):
+        Right(1).map(invert)
+        Right(1).contoled_map(positive)
+        Left("e").bind(invert)
+        with pytest.raises(ZeroDivisionError):
+            Just(0).map(invert)
+    assert_that([(e.method, e.outcome) for e in events]).is_equal_to([
+        ("map", OK), ("contoled_map", OK), ("bind", SKIPPED), ("map", ERROR),
+    ])
+    assert_that(events[-1].exc_type).is_equal_to(ZeroDivisionError)
+
+
+def test_instrument_restores_methods():
+    originals = (Just.map, Nothing.bind, Left.map, Either.contoled_map)
+    with instrument():
+        with instrument():
+            assert_that(Just.map).is_not_same_as(originals[0])
+        assert_that(Just.map).is_not_same_as(originals[0])
+    assert_that((Just.map, Nothing.bind, Left.map, Either.contoled_map)).is_equal_to(originals)
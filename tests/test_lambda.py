@@ -33,4 +33,49 @@ def test_printl_one():
 
 @pytest.mark.lambdacalculus
 def test_succ_zero():
-    assert_that(printl(succ(zero))).is_equal_to(1)
\ No newline at end of file
+    assert_that(printl(succ(zero))).is_equal_to(1)
+
+# Numerals written out by hand, without the Numeral fast paths.
+church = lambda n: lambda f: lambda x: x if n == 0 else f(church(n - 1)(f)(x))
+
+
+@pytest.mark.lambdacalculus
+def test_church_arithmetic():
+    assert_that(to_int(add(from_int(3))(from_int(4)))).is_equal_to(7)
+    assert_that(to_int(mul(from_int(3))(from_int(4)))).is_equal_to(12)
+    assert_that(to_int(pow_(from_int(2))(from_int(10)))).is_equal_to(1024)
+    assert_that(to_int(pred(from_int(5)))).is_equal_to(4)
+    assert_that(to_int(pred(zero))).is_equal_to(0)
+    assert_that(to_int(sub(from_int(5))(from_int(7)))).is_equal_to(0)
+    assert_that(to_int(sub(from_int(7))(from_int(5)))).is_equal_to(2)
+
+
+@pytest.mark.lambdacalculus
+def test_church_arithmetic_on_plain_terms():
+    assert_that(to_int(add(church(3))(church(4)))).is_equal_to(7)
+    assert_that(to_int(mul(church(3))(from_int(4)))).is_equal_to(12)
+    assert_that(to_int(pow_(church(2))(church(3)))).is_equal_to(8)
+    assert_that(to_int(pred(church(5)))).is_equal_to(4)
+    assert_that(to_int(sub(church(7))(church(5)))).is_equal_to(2)
+    assert_that(to_int(succ(church(2)))).is_equal_to(3)
+
+
+@pytest.mark.lambdacalculus
+def test_church_large_numerals():
+    million = from_int(10**6)
+    assert_that(from_int(10**6)).is_same_as(million)
+    assert_that(to_int(mul(million)(million))).is_equal_to(10**12)
+    assert_that(million(lambda x: x + 2)(0)).is_equal_to(2 * 10**6)
+    n = zero
+    for _ in range(10_000):
+        n = succ(n)
+    assert_that(to_int(n)).is_equal_to(10_000)
+    with pytest.raises(ValueError):
+        from_int(-1)
+
+
+@pytest.mark.lambdacalculus
+def test_to_bool():
+    assert_that(to_bool(true)).is_true()
+    assert_that(to_bool(and_(true)(false))).is_false()
+    assert_that(to_bool(or_(false)(true))).is_true()
@@ -0,0 +1,202 @@
+import threading
+import time
+
+import pytest
+
+from fp_py.capture import Capture
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.memoize import memoize_monadic
+from fp_py.Stream import Stream
+from fp_py.tailrec import Done
+from fp_py.Validation import Validation
+from assertpy import assert_that
+
+
+class Counter:
+    def __init__(self, value=1):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.maybe
+def test_maybe_lazy_runs_once_on_first_use():
+    thunk = Counter(20)
+    m = Maybe.lazy(thunk)
+    chained = m.map(lambda x: x + 1).bind(lambda x: x * 2)
+    assert_that(thunk.calls).is_equal_to(0)
+    assert_that(chained.is_forced()).is_false()
+    assert_that(chained.unwrap()).is_equal_to(42)
+    assert_that(m.unwrap()).is_equal_to(20)
+    assert_that(m.match(lambda: 0, lambda x: x)).is_equal_to(20)
+    assert_that(thunk.calls).is_equal_to(1)
+    assert_that(str(chained)).is_equal_to("Just 42")
+
+
+@pytest.mark.maybe
+def test_maybe_lazy_discarded_chain_does_no_work():
+    thunk = Counter()
+    Maybe.lazy(thunk).map(lambda x: 1 / 0).bind(lambda x: x)
+    assert_that(thunk.calls).is_equal_to(0)
+
+
+@pytest.mark.maybe
+def test_maybe_lazy_results():
+    assert_that(Maybe.lazy(lambda: None).is_nothing()).is_true()
+    assert_that(Maybe.lazy(lambda: Nothing()).map(lambda x: x + 1).force()).is_same_as(Nothing())
+    assert_that(Maybe.lazy(lambda: Just(3)).force()).is_equal_to(Just(3))
+    assert_that(Maybe.lazy(lambda: Maybe.lazy(lambda: 4)).force()).is_equal_to(Just(4))
+    assert_that(Maybe.lazy(lambda: 5) == Just(5)).is_true()
+    assert_that(Just(5) == Maybe.lazy(lambda: 5)).is_true()
+    assert_that(Nothing() == Maybe.lazy(lambda: None)).is_true()
+    assert_that(Just(5) == Maybe.lazy(lambda: 6)).is_false()
+    assert_that(hash(Maybe.lazy(lambda: 5))).is_equal_to(hash(Just(5)))
+    assert_that((Maybe.lazy(lambda: 1) + Just(2)).unwrap()).is_equal_to(3)
+    assert_that(Just(lambda x: x * 3).apply(Maybe.lazy(lambda: 2)).unwrap()).is_equal_to(6)
+    assert_that(Just(7).force()).is_equal_to(Just(7))
+
+
+@pytest.mark.maybe
+def test_maybe_lazy_exception_leaves_value_pending():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("not yet")
+        return 1
+
+    m = Maybe.lazy(flaky)
+    with pytest.raises(RuntimeError):
+        m.force()
+    assert_that(m.unwrap()).is_equal_to(1)
+    assert_that(attempts).is_length(2)
+
+
+@pytest.mark.maybe
+def test_maybe_lazy_long_chain_is_stack_safe():
+    m = Maybe.lazy(lambda: 0)
+    for _ in range(50_000):
+        m = m.map(lambda x: x + 1)
+    assert_that(m.unwrap()).is_equal_to(50_000)
+
+
+@pytest.mark.either
+def test_either_lazy():
+    thunk = Counter(10)
+    e = Either.lazy(thunk)
+    doubled = e.map(lambda x: x * 2)
+    failed = e.map(lambda x: x / 0)
+    assert_that(thunk.calls).is_equal_to(0)
+    assert_that(doubled).is_equal_to(Right(20))
+    assert_that(failed.is_left()).is_true()
+    assert_that(failed.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(thunk.calls).is_equal_to(1)
+    assert_that(Either.lazy(lambda: None).force()).is_equal_to(Left(None))
+    assert_that(Either.lazy(lambda: Left("e")).map(lambda x: x + 1).force()).is_equal_to(Left("e"))
+    assert_that(Left("e") == Either.lazy(lambda: Left("e"))).is_true()
+
+
+@pytest.mark.trymonad
+def test_try_lazy_catches_and_keeps_type():
+    def boom():
+        raise ValueError("bad config")
+
+    failed = Try.lazy(boom)
+    assert_that(failed.is_left()).is_true()
+    assert_that(failed.unwrap()).is_instance_of(ValueError)
+    assert_that(Try.lazy(lambda: 2).map(lambda x: x + 1).force()).is_instance_of(Try)
+
+
+@pytest.mark.trymonad
+def test_try_lazy_honours_capture_policy(monkeypatch):
+    monkeypatch.setattr(Try, "capture_policy", Capture.SUMMARY)
+    error = Try.lazy(lambda: 1 / 0).unwrap()
+    assert_that(error).is_instance_of(ZeroDivisionError)
+    assert_that(error.__traceback__).is_none()
+
+
+@pytest.mark.either
+def test_lazy_forcing_is_thread_safe():
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.01)
+        return 1
+
+    e = Either.lazy(slow).map(lambda x: x + 1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(e.unwrap())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert_that(results).is_equal_to([2] * 8)
+    assert_that(calls).is_length(1)
+
+
+@pytest.mark.maybe
+def test_lazy_maybe_through_combinators():
+    nothing = lambda: Maybe.lazy(lambda: None)
+    assert_that(Maybe.sequence([Just(1), Maybe.lazy(lambda: 2)]).unwrap()).is_equal_to([1, 2])
+    assert_that(Maybe.sequence([Just(1), nothing()]).is_nothing()).is_true()
+    assert_that(Maybe.sequence(iter([Just(1), nothing()])).is_nothing()).is_true()
+    assert_that(list(Maybe.sequence_iter([Maybe.lazy(lambda: 1), nothing(), Just(3)]))).is_equal_to([1])
+    assert_that(Maybe.concat([Just("a"), nothing(), Maybe.lazy(lambda: "b")]).unwrap()).is_equal_to("ab")
+    assert_that(Maybe.map_n(max, Just(1), nothing()).is_nothing()).is_true()
+    assert_that(Maybe.tail_rec(lambda x: nothing(), 0).is_nothing()).is_true()
+    assert_that(Maybe.tail_rec(lambda x: Maybe.lazy(lambda: Done(x)), 5).unwrap()).is_equal_to(5)
+
+    @Maybe.do
+    def block():
+        x = yield Maybe.lazy(lambda: 1)
+        y = yield nothing()
+        return x, y
+
+    assert_that(block().is_nothing()).is_true()
+    assert_that(Stream.from_maybe(nothing()).to_list()).is_empty()
+    assert_that(Stream.collect_justs([nothing(), Maybe.lazy(lambda: 2)]).to_list()).is_equal_to([2])
+
+
+@pytest.mark.either
+def test_lazy_either_through_combinators():
+    failed = lambda: Try.lazy(lambda: 1 / 0)
+    res = Either.sequence([Right(1), failed()])
+    assert_that(res.is_left()).is_true()
+    assert_that(res.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(Either.concat([Right([1]), Either.lazy(lambda: None)]).is_left()).is_true()
+    assert_that(Either.map_n(max, failed(), Right(2)).is_left()).is_true()
+    assert_that(Either.tail_rec(lambda x: failed(), 0).is_left()).is_true()
+    assert_that(Validation.from_either(failed()).is_failure()).is_true()
+
+    @Either.do
+    def block():
+        x = yield Either.lazy(lambda: None)
+        return "got", x
+
+    assert_that(block()).is_equal_to(Left(None))
+    assert_that(Stream.from_either(failed()).to_list()).is_empty()
+    assert_that(Stream.collect_rights([failed(), Either.lazy(lambda: 2)]).to_list()).is_equal_to([2])
+    assert_that(Stream.collect_lefts([Either.lazy(lambda: None)]).to_list()).is_equal_to([None])
+
+
+@pytest.mark.either
+def test_memoize_sees_lazy_failures():
+    calls = []
+    def fn(x):
+        calls.append(x)
+        return Either.lazy(lambda: None if x < 0 else x)
+    cached = memoize_monadic(fn)
+    pending = cached(-1)
+    assert_that(pending.is_forced()).is_false()
+    assert_that(cached(-1)).is_same_as(pending)
+    assert_that(pending.is_left()).is_true()
+    assert_that(cached(-1)).is_not_same_as(pending)
+    assert_that(cached(1).unwrap()).is_equal_to(1)
+    assert_that(cached(1).unwrap()).is_equal_to(1)
+    assert_that(calls).is_equal_to([-1, -1, 1])
@@ -60,4 +60,53 @@ def test_maybe_monoid():
     i = v + Nothing().empty() + Just.empty()
     assert_that(i.is_just()).is_true()
     assert_that(i.is_nothing()).is_false()
-    assert_that(i.unwrap()).is_equal_to(42)
\ No newline at end of file
+    assert_that(i.unwrap()).is_equal_to(42)
+
+@pytest.mark.maybe
+def test_maybe_nothing_singleton():
+    assert_that(Nothing()).is_same_as(Nothing())
+    assert_that(Just.unit(None)).is_same_as(Nothing())
+    v = Nothing()
+    assert_that(v.map(lambda x: x + 1)).is_same_as(v)
+    assert_that(v.bind(lambda x: x + 1)).is_same_as(v)
+    assert_that(v.apply(Just(1))).is_same_as(v)
+
+@pytest.mark.maybe
+def test_maybe_slots():
+    assert_that(hasattr(Just(42), "__dict__")).is_false()
+    assert_that(hasattr(Nothing(), "__dict__")).is_false()
+
+
+@pytest.mark.maybe
+def test_maybe_concat():
+    assert_that(Maybe.concat(Just(s) for s in "abc").unwrap()).is_equal_to("abc")
+    assert_that(Maybe.concat([Just([1]), Nothing(), Just([2, 3])]).unwrap()).is_equal_to([1, 2, 3])
+    assert_that(Maybe.concat([Just((1,)), Just((2,))]).unwrap()).is_equal_to((1, 2))
+    assert_that(Maybe.concat([Just(1), Just(2.5), Nothing()]).unwrap()).is_equal_to(3.5)
+    first = bytearray(b"a")
+    assert_that(Maybe.concat([Just(first), Just(bytearray(b"b"))]).unwrap()).is_equal_to(bytearray(b"ab"))
+    assert_that(first).is_equal_to(bytearray(b"a"))
+    assert_that(Maybe.concat([Nothing(), Nothing()]).is_nothing()).is_true()
+    assert_that(Maybe.concat([]).is_nothing()).is_true()
+
+
+@pytest.mark.maybe
+def test_maybe_eq_hash_and_match():
+    assert_that(Just(0) == Just(0)).is_true()
+    assert_that(Just(0) != Just(1)).is_true()
+    assert_that(Just(1) == Nothing()).is_false()
+    assert_that(Just(1) == 1).is_false()
+    assert_that({Just("a"): 1, Nothing(): 2}[Just("a")]).is_equal_to(1)
+    assert_that({Just(1), Just(1), Nothing(), Nothing()}).is_length(2)
+    with pytest.raises(TypeError):
+        hash(Just([1]))
+
+    def describe(m):
+        match m:
+            case Just(value):
+                return f"just {value}"
+            case Nothing():
+                return "nothing"
+
+    assert_that(describe(Just(2))).is_equal_to("just 2")
+    assert_that(describe(Nothing())).is_equal_to("nothing")
@@ -0,0 +1,98 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fp_py.Maybe import Just, Nothing
+from fp_py.MaybeArray import MaybeArray
+from assertpy import assert_that
+
+
+@pytest.mark.maybe
+def test_maybe_array_roundtrip():
+    xs = [Just(1), Nothing(), Just(3)]
+    arr = MaybeArray.from_maybes(xs)
+    assert_that(len(arr)).is_equal_to(3)
+    assert_that(arr.is_just().tolist()).is_equal_to([True, False, True])
+    assert_that(arr.to_maybes()).is_equal_to(xs)
+    assert_that(arr[1]).is_same_as(Nothing())
+    assert_that(MaybeArray.from_values([1, None, 3]).to_maybes()).is_equal_to(xs)
+
+@pytest.mark.maybe
+def test_maybe_array_vectorized_map():
+    arr = MaybeArray.from_values([1.0, None, 4.0])
+    assert_that(arr.map(np.sqrt).to_maybes()).is_equal_to([Just(1.0), Nothing(), Just(2.0)])
+    assert_that(arr.map(lambda x: x * 2, vectorized=True).to_maybes()).is_equal_to([Just(2.0), Nothing(), Just(8.0)])
+    # masked results of np.ma ufuncs become Nothing
+    assert_that(MaybeArray.from_values([-1.0, 1.0]).map(np.ma.log, vectorized=True).is_just().tolist()).is_equal_to([False, True])
+
+@pytest.mark.maybe
+def test_maybe_array_per_element_map():
+    arr = MaybeArray.from_values(["ab", None, "abc"])
+    assert_that(arr.map(len).to_maybes()).is_equal_to([Just(2), Nothing(), Just(3)])
+    arr = MaybeArray.from_values([1, 2, 3])
+    res = arr.map(lambda x: x if x > 1 else None)
+    assert_that(res.to_maybes()).is_equal_to([Nothing(), Just(2), Just(3)])
+    with pytest.raises(TypeError):
+        MaybeArray.from_values(["a"]).map(len, vectorized=True)
+
+@pytest.mark.maybe
+def test_maybe_array_map_runs_once_per_row():
+    calls = []
+    arr = MaybeArray.from_values([1.0, None, 4.0])
+    res = arr.map(lambda x: calls.append(x) or x / max(x, 2.0))
+    assert_that(res.to_maybes()).is_equal_to([Just(0.5), Nothing(), Just(1.0)])
+    assert_that(calls).is_equal_to([1.0, 4.0])
+    words = MaybeArray.from_values(["ab", "cde"])
+    assert_that(words.map(lambda s: s[::-1]).to_maybes()).is_equal_to([Just("ba"), Just("edc")])
+
+@pytest.mark.maybe
+def test_maybe_array_passes_python_values():
+    arr = MaybeArray.from_values([2**62, None, 3])
+    assert_that(arr.map(lambda x: x * 4).to_maybes()).is_equal_to([Just(2**64), Nothing(), Just(12)])
+    assert_that(arr.bind(lambda x: Just(type(x).__name__)).to_maybes()).is_equal_to([Just("int"), Nothing(), Just("int")])
+    floats = MaybeArray.from_values([1.5])
+    assert_that(floats.map(lambda x: isinstance(x, float) and type(x) is float).to_maybes()).is_equal_to([Just(True)])
+    assert_that(type(arr[2].unwrap())).is_equal_to(int)
+
+@pytest.mark.maybe
+def test_maybe_array_keeps_mixed_payloads():
+    xs = [Just(1), Just("a"), Nothing(), Just(True), Just(2)]
+    assert_that(MaybeArray.from_maybes(xs).to_maybes()).is_equal_to(xs)
+    res = MaybeArray.from_values([True, 2]).map(lambda x: x)
+    assert_that([type(m.unwrap()) for m in res.to_maybes()]).is_equal_to([bool, int])
+
+@pytest.mark.maybe
+def test_maybe_array_applicative_monad():
+    arr = MaybeArray.from_values([1, None, 3])
+    assert_that(MaybeArray.pure(lambda x: x + 1).apply(arr).to_maybes()).is_equal_to([Just(2), Nothing(), Just(4)])
+    fns = MaybeArray.from_values([lambda x: x + 1, lambda x: x, None])
+    assert_that(fns.apply(arr).to_maybes()).is_equal_to([Just(2), Nothing(), Nothing()])
+    res = arr.bind(lambda x: Just(x * 10) if x > 1 else Nothing())
+    assert_that(res.to_maybes()).is_equal_to([Nothing(), Nothing(), Just(30)])
+    assert_that(MaybeArray.unit(None).is_nothing().tolist()).is_equal_to([True])
+
+@pytest.mark.maybe
+def test_maybe_array_monoid():
+    a = MaybeArray.from_values([1, None, 3, None])
+    b = MaybeArray.from_values([10, 20, None, None])
+    expected = [Just(11), Just(20), Just(3), Nothing()]
+    assert_that((a + b).to_maybes()).is_equal_to(expected)
+    assert_that((a + MaybeArray.empty()).to_maybes()).is_equal_to(a.to_maybes())
+    assert_that(MaybeArray.concat([a, b]).to_maybes()).is_equal_to(expected)
+
+@pytest.mark.maybe
+def test_maybe_array_monoid_object_columns():
+    res = MaybeArray.from_values([1, "a", None]) + MaybeArray.from_values([1, "b", 2])
+    assert_that(res.to_maybes()).is_equal_to([Just(2), Just("ab"), Just(2)])
+    res = MaybeArray.from_values([[1], None]) + MaybeArray.from_values([None, [2]])
+    assert_that(res.to_maybes()).is_equal_to([Just([1]), Just([2])])
+    res = MaybeArray.from_values([1, None]) + MaybeArray.from_values([0.5, 2.5])
+    assert_that(res.to_maybes()).is_equal_to([Just(1.5), Just(2.5)])
+    with pytest.raises(ValueError):
+        MaybeArray.from_values([1]) + MaybeArray.from_values([1, 2])
+
+@pytest.mark.maybe
+def test_maybe_array_match():
+    arr = MaybeArray.from_values([1, None, 3])
+    res = arr.match(nothing=lambda: -1, just=lambda xs: xs * 2)
+    assert_that(res.tolist()).is_equal_to([2, -1, 6])
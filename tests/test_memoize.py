@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fp_py.Either import Left, Right, Try
+from fp_py.Maybe import Just, Nothing
+from fp_py.memoize import memoize_monadic
+from assertpy import assert_that
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting(results):
+    calls = []
+
+    def fn(x):
+        calls.append(x)
+        return results(x)
+    return fn, calls
+
+
+@pytest.mark.maybe
+def test_memoize_caches_just_and_retries_nothing():
+    fn, calls = counting(lambda x: Just(x * 2) if x > 0 else Nothing())
+    cached = memoize_monadic(fn)
+    assert_that(cached(2).unwrap()).is_equal_to(4)
+    assert_that(cached(2).unwrap()).is_equal_to(4)
+    assert_that(cached(0).is_nothing()).is_true()
+    assert_that(cached(0).is_nothing()).is_true()
+    assert_that(calls).is_equal_to([2, 0, 0])
+    info = cached.cache_info()
+    assert_that((info.hits, info.misses, info.currsize)).is_equal_to((1, 3, 1))
+
+
+@pytest.mark.either
+def test_memoize_cache_failures_with_own_ttl():
+    clock = FakeClock()
+    fn, calls = counting(lambda x: Right(x) if x else Left("empty"))
+    cached = memoize_monadic(fn, ttl=10, cache_failures=True, failure_ttl=1, clock=clock)
+    cached(0), cached(1)
+    cached(0), cached(1)
+    assert_that(calls).is_equal_to([0, 1])
+    clock.now = 2
+    cached(0), cached(1)
+    assert_that(calls).is_equal_to([0, 1, 0])
+    clock.now = 20
+    cached(1)
+    assert_that(calls).is_equal_to([0, 1, 0, 1])
+    assert_that(cached.cache_info().evictions).is_equal_to(2)
+
+
+def test_memoize_lru_eviction():
+    fn, calls = counting(Just)
+    cached = memoize_monadic(maxsize=2)(fn)
+    cached(1), cached(2), cached(1), cached(3), cached(1), cached(2)
+    assert_that(calls).is_equal_to([1, 2, 3, 2])
+    info = cached.cache_info()
+    assert_that((info.evictions, info.maxsize, info.currsize)).is_equal_to((2, 2, 2))
+    cached.cache_clear()
+    assert_that(cached.cache_info().currsize).is_equal_to(0)
+
+
+@pytest.mark.trymonad
+def test_memoize_in_bind_chain():
+    fn, calls = counting(lambda x: 10 / x)
+    cached = memoize_monadic(fn)
+    for _ in range(3):
+        assert_that(Try.unit(5).bind(cached).unwrap()).is_equal_to(2)
+    assert_that(Try.unit(0).bind(cached).is_left()).is_true()
+    assert_that(calls).is_equal_to([5, 0])
+
+
+def test_memoize_key_and_thread_safe():
+    fn, calls = counting(Just)
+    cached = memoize_monadic(fn, key=lambda x: x % 10, thread_safe=True, maxsize=None)
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(cached, [1, 11, 21, 2, 12] * 50))
+    info = cached.cache_info()
+    assert_that(info.hits + info.misses).is_equal_to(250)
+    assert_that(info.currsize).is_equal_to(2)
@@ -0,0 +1,98 @@
+import math
+import multiprocessing
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.parallel import RemoteError, fold_parallel, map_parallel, traverse_parallel, _portable
+from assertpy import assert_that
+
+
+@pytest.fixture
+def process_pool():
+    # Forking once the test run has started threads is unsafe; start clean workers.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context(method)) as pool:
+        yield pool
+
+@pytest.mark.trymonad
+def test_map_parallel_threads_ordered():
+    chain = [int, lambda x: 100 // x]
+    res = list(map_parallel(chain, ["1", "0", "x", "4"] * 10, executor="thread", max_workers=3, chunk_size=3))
+    assert_that(res).is_length(40)
+    assert_that([r.is_right() for r in res[:4]]).is_equal_to([True, False, False, True])
+    assert_that(res[0].unwrap()).is_equal_to(100)
+    assert_that(res[1].unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(res[2].unwrap()).is_instance_of(ValueError)
+
+@pytest.mark.trymonad
+def test_map_parallel_matches_serial_and_autotunes():
+    xs = list(range(1, 500))
+    pipeline = Try.pipeline().bind(lambda x: x * 2).bind(lambda x: x + 1)
+    serial = [Try.unit(x).bind(lambda x: x * 2).bind(lambda x: x + 1).unwrap() for x in xs]
+    res = [r.unwrap() for r in map_parallel(pipeline, xs, executor="thread", max_workers=2)]
+    assert_that(res).is_equal_to(serial)
+    res = [r.unwrap() for r in map_parallel(pipeline, iter(xs), executor="thread", ordered=False, chunk_size=7)]
+    assert_that(sorted(res)).is_equal_to(serial)
+
+@pytest.mark.trymonad
+def test_map_parallel_processes(process_pool):
+    pipeline = Either.pipeline().bind(int).bind(math.sqrt)
+    res = list(map_parallel(pipeline, ["4", "9", "x", "-1"], executor=process_pool, max_workers=2, chunk_size=2))
+    assert_that([r.unwrap() for r in res[:2]]).is_equal_to([2.0, 3.0])
+    assert_that(res[2].unwrap()).is_instance_of(ValueError)
+    assert_that(res[3].unwrap()).is_instance_of(ValueError)
+
+@pytest.mark.trymonad
+def test_traverse_parallel():
+    v = traverse_parallel([int], ["1", "2", "3"], executor="thread", chunk_size=1)
+    assert_that(v.unwrap()).is_equal_to([1, 2, 3])
+    v = traverse_parallel([int], ["1", "x", "3"], executor="thread", chunk_size=1)
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_instance_of(ValueError)
+
+@pytest.mark.trymonad
+def test_unpicklable_exception_is_replaced():
+    class Local(Exception):
+        pass
+    v = _portable(Left(Local("boom")))
+    assert_that(v.unwrap()).is_instance_of(RemoteError)
+    assert_that(str(v.unwrap())).is_equal_to("Local: boom")
+    assert_that(pickle.loads(pickle.dumps(v)).unwrap()).is_instance_of(RemoteError)
+
+
+@pytest.mark.maybe
+def test_fold_parallel_keeps_order_and_nothing_identity(process_pool):
+    xs = [Just([i]) if i % 3 else Nothing() for i in range(200)]
+    expected = [i for i in range(200) if i % 3]
+    res = fold_parallel(xs, workers=3, executor="thread", chunk_size=7)
+    assert_that(res.unwrap()).is_equal_to(expected)
+    res = fold_parallel(iter(xs), workers=2, executor=process_pool, chunk_size=50)
+    assert_that(res.unwrap()).is_equal_to(expected)
+    assert_that(fold_parallel([Nothing()] * 5, executor="thread").is_nothing()).is_true()
+
+
+@pytest.mark.maybe
+def test_fold_parallel_commutative_and_empty():
+    shards = [Just(Counter({"a": 1, f"k{i % 4}": i})) for i in range(100)]
+    res = fold_parallel(shards, executor="thread", chunk_size=9, commutative=True)
+    assert_that(res.unwrap()["a"]).is_equal_to(100)
+    assert_that(res.unwrap()).is_equal_to(sum((s.unwrap() for s in shards), Counter()))
+    assert_that(fold_parallel([], executor="thread", empty=Maybe.empty()).is_nothing()).is_true()
+    with pytest.raises(ValueError):
+        fold_parallel([], executor="thread")
+
+
+@pytest.mark.maybe
+def test_fold_parallel_tree_depth():
+    class Node:
+        def __init__(self, depth):
+            self.depth = depth
+        def __add__(self, other):
+            return Node(max(self.depth, other.depth) + 1)
+    res = fold_parallel([Node(0) for _ in range(1024)], executor="thread", chunk_size=1)
+    assert_that(res.depth).is_equal_to(10)
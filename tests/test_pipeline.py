@@ -0,0 +1,66 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from assertpy import assert_that
+
+
+@pytest.mark.maybe
+def test_maybe_pipeline_matches_eager():
+    f = lambda x: x + 2
+    g = lambda x: x * 2
+    plan = Maybe.pipeline().map(f).bind(g)
+    for value in (0, 1, 42, None):
+        assert_that(plan(value)).is_equal_to(Just.unit(value).map(f).bind(g))
+
+@pytest.mark.maybe
+def test_maybe_pipeline_none_and_filter():
+    plan = Maybe.pipeline().map(lambda x: x + 1).filter(lambda x: x > 2)
+    assert_that(plan(2).unwrap()).is_equal_to(3)
+    assert_that(plan(1)).is_same_as(Nothing())
+    assert_that(Maybe.pipeline().map(lambda x: None).map(lambda x: x + 1)(4)).is_same_as(Nothing())
+
+@pytest.mark.maybe
+def test_maybe_pipeline_is_reusable():
+    base = Maybe.pipeline().map(lambda x: x + 1)
+    plus = base.map(lambda x: x + 10)
+    assert_that(len(base)).is_equal_to(1)
+    assert_that(len(plus)).is_equal_to(2)
+    assert_that([base(i).unwrap() for i in range(3)]).is_equal_to([1, 2, 3])
+    assert_that(plus.compile()(1).unwrap()).is_equal_to(12)
+
+@pytest.mark.either
+def test_either_pipeline_matches_eager():
+    plan = Either.pipeline().bind(lambda x: x + 2).map(lambda x: x * 2)
+    v = plan(3)
+    assert_that(v.is_right()).is_true()
+    assert_that(v.unwrap()).is_equal_to(Right.unit(3).bind(lambda x: x + 2).map(lambda x: x * 2).unwrap())
+    v = Either.pipeline().map(lambda x: None)(3)
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_none()
+
+@pytest.mark.either
+def test_either_pipeline_filter():
+    plan = Either.pipeline().filter(lambda x: x > 0, lambda x: f"{x} is not positive")
+    assert_that(plan(1).unwrap()).is_equal_to(1)
+    assert_that(plan(-1).is_left()).is_true()
+    assert_that(plan(-1).unwrap()).is_equal_to("-1 is not positive")
+    assert_that(Either.pipeline().filter(lambda x: x > 0)(-1).unwrap()).is_equal_to(-1)
+
+@pytest.mark.trymonad
+def test_try_pipeline_captures_exception():
+    calls = []
+    plan = Try.pipeline().bind(lambda x: 6 / x).bind(lambda x: calls.append(x) or x + 7)
+    assert_that(plan(3).unwrap()).is_equal_to(9)
+    v = plan(0)
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(calls).is_length(1)
+
+
+@pytest.mark.trymonad
+def test_try_pipeline_returns_try():
+    plan = Try.pipeline().map(lambda x: x + 1)
+    assert_that(plan(1)).is_instance_of(Try)
+    assert_that(plan(1)).is_equal_to(Try(1).map(lambda x: x + 1))
+    assert_that(type(Either.pipeline().map(lambda x: x + 1)(1))).is_equal_to(Right)
@@ -0,0 +1,27 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.Async import AsyncEither, AsyncMaybe
+from fp_py.types import Applicative, Functor, Monad, Monoid
+from fp_py.types.checks import check_protocols
+from assertpy import assert_that
+
+
+@pytest.mark.maybe
+def test_maybe_protocols():
+    for cls in (Maybe, Just, Nothing):
+        check_protocols(cls, Monoid, Functor, Applicative, Monad)
+
+@pytest.mark.either
+def test_either_protocols():
+    for cls in (Either, Left, Right, Try, AsyncEither, AsyncMaybe):
+        check_protocols(cls, Functor, Applicative, Monad)
+
+def test_check_protocols_reports_missing():
+    class OnlyMap:
+        def map(self, fn):
+            return self
+    check_protocols(OnlyMap, Functor)
+    with pytest.raises(TypeError):
+        check_protocols(OnlyMap, Monad)
@@ -0,0 +1,95 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right
+from fp_py.Maybe import Just, Nothing
+from fp_py.Stream import Stream
+from fp_py.types import Applicative, Functor, Monad, Monoid
+from fp_py.types.checks import check_protocols
+from assertpy import assert_that
+
+
+@pytest.mark.stream
+def test_stream_protocols():
+    check_protocols(Stream, Monoid, Functor, Applicative, Monad)
+
+
+@pytest.mark.stream
+def test_stream_functor_and_monoid():
+    assert_that(Stream([1, 2, 3]).map(lambda x: x * 10).to_list()).is_equal_to([10, 20, 30])
+    assert_that((Stream.of(1, 2) + Stream.of(3)).to_list()).is_equal_to([1, 2, 3])
+    assert_that((Stream.empty() + Stream.of(1)).to_list()).is_equal_to([1])
+    assert_that(Stream.concat([Stream.of(1), Stream.empty(), Stream.of(2, 3)]).to_list()).is_equal_to([1, 2, 3])
+
+
+@pytest.mark.stream
+def test_stream_applicative():
+    add = lambda a, b: a + b
+    result = Stream.pure(add).apply(Stream.of(1, 2)).apply(Stream.of(10, 20))
+    assert_that(result.to_list()).is_equal_to([11, 21, 12, 22])
+    fns = Stream.of(lambda x: x + 1, lambda x: x * 2)
+    assert_that(fns.apply(Stream.of(3, 4)).to_list()).is_equal_to([4, 5, 6, 8])
+
+
+@pytest.mark.stream
+def test_stream_monad_laws():
+    f = lambda x: Stream.of(x, x + 1)
+    g = lambda x: Stream.of(x * 2)
+    m = Stream.of(1, 5)
+    assert_that(Stream.unit(3).bind(f).to_list()).is_equal_to(f(3).to_list())
+    assert_that(m.bind(Stream.unit).to_list()).is_equal_to(m.to_list())
+    assert_that(m.bind(f).bind(g).to_list()).is_equal_to(m.bind(lambda x: f(x).bind(g)).to_list())
+    assert_that(m.bind(lambda x: range(x)).to_list()).is_equal_to([0, 0, 1, 2, 3, 4])
+
+
+@pytest.mark.stream
+def test_stream_is_lazy_and_unbounded():
+    seen = []
+
+    def source():
+        n = 0
+        while True:
+            seen.append(n)
+            yield n
+            n += 1
+
+    fanned = Stream(source()).bind(lambda x: Stream.of(x, -x)).filter(lambda x: x % 3)
+    assert_that(seen).is_empty()
+    assert_that(fanned.take(4).to_list()).is_equal_to([1, -1, 2, -2])
+    assert_that(seen).is_equal_to([0, 1, 2])
+    naturals = Stream.iterate(lambda x: x + 1, 0)
+    assert_that(naturals.drop(5).take(3).to_list()).is_equal_to([5, 6, 7])
+    assert_that(naturals.take_while(lambda x: x < 3).to_list()).is_equal_to([0, 1, 2])
+    assert_that(naturals.drop_while(lambda x: x < 3).head()).is_equal_to(Just(3))
+
+
+@pytest.mark.stream
+def test_stream_replays_replayable_sources():
+    doubled = Stream(range(4)).map(lambda x: x * 2)
+    assert_that(doubled.to_list()).is_equal_to(doubled.to_list())
+    once = Stream(iter([1, 2]))
+    assert_that(once.to_list()).is_equal_to([1, 2])
+    assert_that(once.to_list()).is_empty()
+
+
+@pytest.mark.stream
+def test_stream_chunk():
+    assert_that(Stream(range(7)).chunk(3).to_list()).is_equal_to([(0, 1, 2), (3, 4, 5), (6,)])
+    assert_that(Stream.iterate(lambda x: x + 1, 0).chunk(2).take(2).to_list()).is_equal_to([(0, 1), (2, 3)])
+    with pytest.raises(ValueError):
+        Stream.of(1).chunk(0)
+
+
+@pytest.mark.stream
+def test_stream_maybe_and_either_conversions():
+    assert_that(Stream.from_maybe(Just(1)).to_list()).is_equal_to([1])
+    assert_that(Stream.from_maybe(Nothing()).to_list()).is_empty()
+    assert_that(Stream.from_either(Right(2)).to_list()).is_equal_to([2])
+    assert_that(Stream.from_either(Left("e")).to_list()).is_empty()
+    eithers = [Right(1), Left("a"), Right(2), Left("b")]
+    assert_that(Stream.collect_rights(eithers).to_list()).is_equal_to([1, 2])
+    assert_that(Stream.collect_lefts(eithers).to_list()).is_equal_to(["a", "b"])
+    assert_that(Stream.collect_justs([Just(1), Nothing(), Just(3)]).to_list()).is_equal_to([1, 3])
+    assert_that(Stream.empty().head()).is_equal_to(Nothing())
+    parsed = Stream.of("1", "x", "3").bind(lambda s: Stream.from_either(Right(s).map(int)))
+    assert_that(parsed.to_list()).is_equal_to([1, 3])
+    assert_that(Either.traverse(Right, Stream.of(1, 2)).unwrap()).is_equal_to([1, 2])
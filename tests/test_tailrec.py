@@ -0,0 +1,40 @@
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.tailrec import Continue, Done
+from assertpy import assert_that
+
+DEEP = 200_000
+
+
+def countdown(n):
+    return Done("liftoff") if n == 0 else Continue(n - 1)
+
+
+@pytest.mark.maybe
+def test_maybe_tail_rec():
+    assert_that(Maybe.tail_rec(countdown, DEEP).unwrap()).is_equal_to("liftoff")
+    res = Maybe.tail_rec(lambda n: Nothing() if n == 3 else Continue(n + 1), 0)
+    assert_that(res.is_nothing()).is_true()
+    res = Maybe.tail_rec(lambda n: Just(Done(n)) if n > 2 else Just(Continue(n + 1)), 0)
+    assert_that(res.unwrap()).is_equal_to(3)
+
+
+@pytest.mark.either
+def test_either_tail_rec():
+    res = Either.tail_rec(countdown, DEEP)
+    assert_that(res).is_instance_of(Right)
+    assert_that(res.unwrap()).is_equal_to("liftoff")
+    res = Either.tail_rec(lambda n: Left(f"stopped at {n}") if n == 5 else Continue(n + 1), 0)
+    assert_that(res.unwrap()).is_equal_to("stopped at 5")
+
+
+@pytest.mark.trymonad
+def test_try_tail_rec():
+    res = Try.tail_rec(countdown, 10)
+    assert_that(res).is_instance_of(Try)
+    res = Try.tail_rec(lambda n: Continue(10 // n), 20)
+    assert_that(res.unwrap()).is_instance_of(ZeroDivisionError)
+    res = Try.tail_rec(lambda n: 42, 0)
+    assert_that(res.unwrap()).is_instance_of(TypeError)
@@ -0,0 +1,111 @@
+import sys
+
+import pytest
+from assertpy import assert_that
+
+from fp_py.utils import lambda_calculus as lc
+from fp_py.utils.terms import (App, Lam, Normalizer, StepLimitExceeded, Var, app, church,
+                               church_bool, church_value, from_python, normalize, parse, show)
+
+
+@pytest.mark.lambdacalculus
+def test_terms_are_hash_consed():
+    assert_that(Var(0)).is_same_as(Var(0))
+    assert_that(Lam(App(Var(0), Var(0)))).is_same_as(parse(r"\x. x x"))
+    pair = parse(r"\x y. (\z. z) x ((\z. z) y)")
+    assert_that(pair.body.body.fn.fn).is_same_as(pair.body.body.arg.fn)
+    assert_that(church(3).free).is_equal_to(0)
+    assert_that(App(Var(2), Lam(Var(1))).free).is_equal_to(3)
+
+
+@pytest.mark.lambdacalculus
+def test_parse_and_show():
+    assert_that(show(parse(r"λf x. f (f x)"))).is_equal_to("λa.λb.a (a b)")
+    assert_that(show(parse(r"(\x. x) (\y. y y)"))).is_equal_to("(λa.a) (λa.a a)")
+    assert_that(parse(r"\f x. f (f x)")).is_same_as(church(2))
+    with pytest.raises(SyntaxError):
+        parse(r"\x. y")
+    with pytest.raises(SyntaxError):
+        parse(r"(\x. x")
+
+
+@pytest.mark.lambdacalculus
+def test_from_python_reifies_combinators():
+    assert_that(from_python(lc.make_pair)).is_same_as(parse(r"\a b f. f a b"))
+    assert_that(from_python(lc.cond)).is_same_as(parse(r"\a b c. c a b"))
+    assert_that(from_python(lc.true)).is_same_as(parse(r"\a b. a"))
+    assert_that(from_python(lc.three)).is_same_as(church(3))
+    assert_that(from_python(lc.succ)).is_same_as(parse(r"\n f x. f (n f x)"))
+    with pytest.raises(TypeError):
+        from_python(3)
+
+
+@pytest.mark.lambdacalculus
+def test_normalize_combinators():
+    pair = app(from_python(lc.make_pair), church(3), church(7))
+    assert_that(church_value(normalize(app(pair, from_python(lc.select_first))))).is_equal_to(3)
+    assert_that(church_value(normalize(app(pair, from_python(lc.select_second))))).is_equal_to(7)
+    choose = app(from_python(lc.cond), church(1), church(2))
+    assert_that(church_value(normalize(app(choose, from_python(lc.true))))).is_equal_to(1)
+    assert_that(church_value(normalize(app(choose, from_python(lc.false))))).is_equal_to(2)
+    assert_that(church_bool(normalize(app(from_python(lc.and_), from_python(lc.true),
+                                          from_python(lc.false))))).is_false()
+    assert_that(church_bool(normalize(app(from_python(lc.not_), from_python(lc.false))))).is_true()
+
+
+@pytest.mark.lambdacalculus
+def test_normalize_arithmetic():
+    assert_that(church_value(normalize(app(from_python(lc.add), church(3), church(4))))).is_equal_to(7)
+    assert_that(church_value(normalize(app(from_python(lc.mul), church(6), church(7))))).is_equal_to(42)
+    assert_that(church_value(normalize(app(from_python(lc.pow_), church(2), church(10))))).is_equal_to(1024)
+    assert_that(church_value(normalize(app(from_python(lc.sub), church(9), church(4))))).is_equal_to(5)
+    with pytest.raises(ValueError):
+        church_value(from_python(lc.make_pair))
+
+
+@pytest.mark.lambdacalculus
+def test_normalize_under_binders_and_open_terms():
+    assert_that(normalize(parse(r"\z. (\x y. x) z"))).is_same_as(parse(r"\z y. z"))
+    assert_that(normalize(App(Lam(Var(0)), Var(3)))).is_same_as(Var(3))
+    assert_that(normalize(App(Lam(Lam(Var(1))), Var(0)))).is_same_as(Lam(Var(1)))
+
+
+@pytest.mark.lambdacalculus
+def test_normalize_is_stack_safe():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        big = normalize(app(from_python(lc.mul), church(200), church(200)))
+        down = normalize(app(from_python(lc.pred), church(3000)))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert_that(church_value(big)).is_equal_to(40_000)
+    assert_that(church_value(down)).is_equal_to(2999)
+    assert_that(len(show(church(5000)))).is_greater_than(5000)
+
+
+@pytest.mark.lambdacalculus
+def test_call_by_need_shares_arguments():
+    identity = app(church(50), parse(r"\y. y"), parse(r"\z. z"))
+    once = Normalizer()
+    assert_that(once.normalize(identity)).is_same_as(parse(r"\z. z"))
+    shared = Normalizer()
+    # x is needed three times but its value is computed once.
+    result = shared.normalize(app(parse(r"\x c. x (x (x c))"), identity))
+    assert_that(result).is_same_as(parse(r"\c. c"))
+    assert_that(shared.steps).is_equal_to(once.steps + 4)
+
+
+@pytest.mark.lambdacalculus
+def test_step_budget():
+    omega = parse(r"(\x. x x) (\x. x x)")
+    with pytest.raises(StepLimitExceeded) as error:
+        normalize(omega, max_steps=1000)
+    assert_that(error.value.steps).is_equal_to(1000)
+    counter = Normalizer(max_steps=10)
+    with pytest.raises(StepLimitExceeded):
+        counter.normalize(app(from_python(lc.mul), church(10), church(10)))
+    assert_that(counter.steps).is_equal_to(11)
+    # Normal order finds the normal form even when an argument diverges.
+    assert_that(normalize(app(from_python(lc.select_first), church(1), omega), 1000)).is_same_as(church(1))
+
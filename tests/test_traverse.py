@@ -0,0 +1,77 @@
+import itertools
+
+import pytest
+
+from fp_py.Either import Either, Left, Right, Try
+from fp_py.Maybe import Just, Maybe, Nothing
+from fp_py.traverse import ShortCircuit
+from assertpy import assert_that
+
+
+def half(x):
+    return Just(x // 2) if x % 2 == 0 else Nothing()
+
+def parse(s):
+    return Right(int(s)) if s.isdigit() else Left(f"not a number: {s}")
+
+@pytest.mark.maybe
+def test_maybe_traverse():
+    assert_that(Maybe.traverse(half, [2, 4, 6]).unwrap()).is_equal_to([1, 2, 3])
+    assert_that(Maybe.traverse(half, (x for x in [2, 4])).unwrap()).is_equal_to([1, 2])
+    assert_that(Maybe.traverse(half, [2, 3, 4])).is_same_as(Nothing())
+    assert_that(Maybe.traverse(half, []).unwrap()).is_equal_to([])
+
+@pytest.mark.maybe
+def test_maybe_traverse_stops_reading():
+    seen = []
+    def source():
+        for x in itertools.count(2, 1):
+            seen.append(x)
+            yield x
+    assert_that(Maybe.traverse(half, source()).is_nothing()).is_true()
+    assert_that(seen).is_equal_to([2, 3])
+
+@pytest.mark.maybe
+def test_maybe_sequence():
+    assert_that(Maybe.sequence([Just(1), Just(2)]).unwrap()).is_equal_to([1, 2])
+    assert_that(Maybe.sequence([Just(1), Nothing(), Just(2)]).is_nothing()).is_true()
+
+@pytest.mark.maybe
+def test_maybe_traverse_iter():
+    gen = Maybe.traverse_iter(half, itertools.count(0, 2))
+    assert_that(list(itertools.islice(gen, 3))).is_equal_to([0, 1, 2])
+    gen = Maybe.sequence_iter(iter([Just(1), Nothing(), Just(2)]))
+    assert_that(next(gen)).is_equal_to(1)
+    with pytest.raises(StopIteration) as stop:
+        next(gen)
+    assert_that(stop.value.value).is_same_as(Nothing())
+    with pytest.raises(ShortCircuit) as failure:
+        list(Maybe.traverse_iter(half, [2, 3], raise_on_failure=True))
+    assert_that(failure.value.failure).is_same_as(Nothing())
+
+@pytest.mark.either
+def test_either_traverse():
+    assert_that(Either.traverse(parse, ["1", "2"]).unwrap()).is_equal_to([1, 2])
+    v = Either.traverse(parse, iter(["1", "x", "y"]))
+    assert_that(v.is_left()).is_true()
+    assert_that(v.unwrap()).is_equal_to("not a number: x")
+    assert_that(Either.sequence([Right(1), Right(2)]).unwrap()).is_equal_to([1, 2])
+    assert_that(Either.sequence([Right(1), Left("e")]).unwrap()).is_equal_to("e")
+
+@pytest.mark.trymonad
+def test_try_traverse_keeps_try():
+    assert_that(Try.traverse(parse, ["1", "2"])).is_instance_of(Try)
+    assert_that(Try.sequence([Try(1), Right(2)])).is_instance_of(Try)
+    assert_that(type(Either.sequence([Right(1)]))).is_equal_to(Right)
+
+@pytest.mark.either
+def test_either_traverse_iter():
+    def collect():
+        result = yield from Either.traverse_iter(parse, ["1", "2", "x", "3"])
+        return result
+    gen = collect()
+    assert_that([next(gen), next(gen)]).is_equal_to([1, 2])
+    with pytest.raises(StopIteration) as stop:
+        next(gen)
+    assert_that(stop.value.value.unwrap()).is_equal_to("not a number: x")
+    assert_that(list(Either.sequence_iter([Right(1), Right(2)]))).is_equal_to([1, 2])
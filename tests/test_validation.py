@@ -0,0 +1,71 @@
+import pytest
+
+from fp_py.Either import Left, Right
+from fp_py.Validation import ErrorRope, Failure, Success, Validation
+from assertpy import assert_that
+
+
+def positive(x):
+    return Success(x) if x > 0 else Failure(f"{x} is not positive")
+
+
+@pytest.mark.validation
+def test_validation_apply_collects_errors():
+    add3 = lambda a, b, c: a + b + c
+    v = Validation.pure(add3).apply(Success(1)).apply(Success(2)).apply(Success(3))
+    assert_that(v.unwrap()).is_equal_to(6)
+
+    v = Validation.pure(add3).apply(Failure("a")).apply(Success(2)).apply(Failure("c", "d"))
+    assert_that(v.is_failure()).is_true()
+    assert_that(v.errors).is_equal_to(["a", "c", "d"])
+
+
+@pytest.mark.validation
+def test_validation_monoid_and_map_n():
+    assert_that((Success(1) + Success(2)).unwrap()).is_equal_to(3)
+    assert_that((Failure("a") + Success(2) + Failure("b")).errors).is_equal_to(["a", "b"])
+    assert_that(Validation.map_n(max, Success(1), Success(5)).unwrap()).is_equal_to(5)
+    assert_that(Validation.map_n(max, Failure("x"), Success(5), Failure("y")).errors).is_equal_to(["x", "y"])
+
+
+@pytest.mark.validation
+def test_validation_concat():
+    assert_that(Validation.concat([Success(1), Success(2), Success(3)]).unwrap()).is_equal_to(6)
+    assert_that(Validation.concat(iter([Failure("a"), Success(2), Failure("b")])).errors).is_equal_to(["a", "b"])
+    with pytest.raises(ValueError):
+        Validation.concat([])
+
+
+@pytest.mark.validation
+def test_validation_traverse():
+    assert_that(Validation.traverse(positive, [1, 2, 3]).unwrap()).is_equal_to([1, 2, 3])
+    v = Validation.traverse(positive, range(-2, 3))
+    assert_that(v.errors).is_equal_to(["-2 is not positive", "-1 is not positive", "0 is not positive"])
+    assert_that(Validation.sequence([Success(1), Failure("e")]).errors).is_equal_to(["e"])
+
+
+@pytest.mark.validation
+def test_validation_bind_and_map():
+    assert_that(Success(2).map(lambda x: x * 2).unwrap()).is_equal_to(4)
+    assert_that(Success(-1).bind(positive).errors).is_equal_to(["-1 is not positive"])
+    assert_that(Failure("e").bind(positive).map(str).errors).is_equal_to(["e"])
+    assert_that(Success(1).match(failure=len, success=lambda x: x + 1)).is_equal_to(2)
+    assert_that(Failure("a", "b").match(failure=len, success=lambda x: x + 1)).is_equal_to(2)
+
+
+@pytest.mark.validation
+def test_validation_either_conversion():
+    assert_that(Success(1).to_either()).is_instance_of(Right)
+    assert_that(Failure("a", "b").to_either().unwrap()).is_equal_to(["a", "b"])
+    assert_that(Validation.from_either(Right(3)).unwrap()).is_equal_to(3)
+    assert_that(Validation.from_either(Left("bad")).errors).is_equal_to(["bad"])
+
+
+@pytest.mark.validation
+def test_error_rope_deep_joins():
+    v = Success(0)
+    for i in range(50_000):
+        v = v + Failure(i)
+    assert_that(len(v._errors)).is_equal_to(50_000)
+    assert_that(v.errors[:3]).is_equal_to([0, 1, 2])
+    assert_that(ErrorRope([1]) + ErrorRope([2])).is_equal_to(ErrorRope([1, 2]))